@@ -6,9 +6,11 @@ Create Date: 2025-12-23 12:00:00.000000
 
 """
 
+from typing import Any
+
 import sqlalchemy as sa
 
-from alembic import op
+from alembic import context, op
 
 # revision identifiers, used by Alembic.
 revision = "004"
@@ -17,45 +19,135 @@ branch_labels = None
 depends_on = None
 
 
-def upgrade():
-    # Add guarantee_mode to assets with default 'notify'
-    op.add_column(
-        "assets",
-        sa.Column(
-            "guarantee_mode",
-            sa.String(length=50),
-            nullable=False,
-            server_default="notify",
-        ),
-    )
+# Auth columns added to users, with their Postgres column definitions.
+USER_AUTH_COLUMNS = {
+    "password_hash": "VARCHAR(255)",
+    "role": "VARCHAR(50) NOT NULL DEFAULT 'user'",
+    "notification_preferences": "JSON NOT NULL DEFAULT '{}'",
+}
+
 
-    # Add auth columns to users
-    op.add_column(
-        "users",
+def _user_auth_columns() -> list[sa.Column]:
+    """Build the SQLAlchemy columns matching USER_AUTH_COLUMNS."""
+    return [
         sa.Column("password_hash", sa.String(length=255), nullable=True),
-    )
-    op.add_column(
-        "users",
         sa.Column(
             "role",
             sa.String(length=50),
             nullable=False,
             server_default="user",
         ),
-    )
-    op.add_column(
-        "users",
         sa.Column(
             "notification_preferences",
             sa.JSON(),
             nullable=False,
             server_default="{}",
         ),
-    )
+    ]
+
+
+def _is_sqlite() -> bool:
+    """Check if we're running against SQLite."""
+    bind = op.get_bind()
+    return bind.dialect.name == "sqlite"
+
+
+def _column_info(table: str) -> dict[str, dict[str, Any]] | None:
+    """Return the live columns of a table keyed by name.
+
+    Returns None in offline (``--sql``) mode, where there is no database to
+    inspect.
+    """
+    if context.is_offline_mode():
+        return None
+    inspector = sa.inspect(op.get_bind())
+    return {column["name"]: column for column in inspector.get_columns(table)}
+
+
+def _has_fast_column_defaults() -> bool:
+    """Check if ADD COLUMN with a constant default avoids a table rewrite (Postgres 11+).
+
+    Offline (``--sql``) runs can't see the server version, so they assume a
+    supported one; docker-compose runs Postgres 16.
+    """
+    dialect = op.get_bind().dialect
+    if dialect.name != "postgresql":
+        return False
+    if context.is_offline_mode():
+        return True
+    return (dialect.server_version_info or (0,)) >= (11,)
+
+
+def upgrade():
+    # Read both catalogs once up front so a re-run against a partially
+    # migrated database skips the columns that are already in place. Offline
+    # there is no catalog, so every column is added.
+    asset_columns = _column_info("assets") or {}
+    user_columns = _column_info("users") or {}
+
+    # Add guarantee_mode to assets with default 'notify'. SQLite and Postgres 11+
+    # store a constant default in the catalog, so one NOT NULL ADD COLUMN is a
+    # metadata-only change there and needs no backfill.
+    guarantee_mode = asset_columns.get("guarantee_mode")
+    if guarantee_mode is None and (_is_sqlite() or _has_fast_column_defaults()):
+        op.add_column(
+            "assets",
+            sa.Column(
+                "guarantee_mode",
+                sa.String(length=50),
+                nullable=False,
+                server_default="notify",
+            ),
+        )
+    elif not _is_sqlite() and (guarantee_mode is None or guarantee_mode["nullable"]):
+        # Older Postgres rewrites the whole table to add a column with a
+        # default, so add it without one (a catalog-only change), backfill, then
+        # set the default and NOT NULL. A column left nullable by an interrupted
+        # run resumes at the backfill.
+        if guarantee_mode is None:
+            op.add_column(
+                "assets",
+                sa.Column("guarantee_mode", sa.String(length=50), nullable=True),
+            )
+        op.execute("UPDATE assets SET guarantee_mode = 'notify' WHERE guarantee_mode IS NULL")
+        op.alter_column(
+            "assets",
+            "guarantee_mode",
+            existing_type=sa.String(length=50),
+            server_default="notify",
+            nullable=False,
+        )
+
+    # Add auth columns to users in a single ALTER TABLE so the table is only
+    # locked and its catalog entry rewritten once.
+    missing = [name for name in USER_AUTH_COLUMNS if name not in user_columns]
+    if not missing:
+        return
+    if _is_sqlite():
+        with op.batch_alter_table("users") as batch_op:
+            for column in _user_auth_columns():
+                if column.name in missing:
+                    batch_op.add_column(column)
+    else:
+        op.execute(
+            "ALTER TABLE users "
+            + ", ".join(f"ADD COLUMN {name} {USER_AUTH_COLUMNS[name]}" for name in missing)
+        )
 
 
 def downgrade():
-    op.drop_column("users", "notification_preferences")
-    op.drop_column("users", "role")
-    op.drop_column("users", "password_hash")
-    op.drop_column("assets", "guarantee_mode")
+    # Offline there is no catalog, so every column is dropped
+    user_columns = _column_info("users")
+    present = [
+        name for name in reversed(USER_AUTH_COLUMNS) if user_columns is None or name in user_columns
+    ]
+    if present:
+        if not _is_sqlite():
+            op.execute("ALTER TABLE users " + ", ".join(f"DROP COLUMN {name}" for name in present))
+        else:
+            with op.batch_alter_table("users") as batch_op:
+                for name in present:
+                    batch_op.drop_column(name)
+    asset_columns = _column_info("assets")
+    if asset_columns is None or "guarantee_mode" in asset_columns:
+        op.drop_column("assets", "guarantee_mode")
@@ -25,11 +25,23 @@ def _is_sqlite() -> bool:
     return bind.dialect.name == "sqlite"
 
 
+def _is_postgres() -> bool:
+    """Check if we're running against PostgreSQL."""
+    bind = op.get_bind()
+    return bind.dialect.name == "postgresql"
+
+
 def upgrade() -> None:
     """Expand key_prefix to fit longer prefixes."""
     if _is_sqlite():
         return
 
+    # Widening a varchar is a catalog-only change on Postgres; issue it directly
+    # so the ACCESS EXCLUSIVE lock is held for just this one statement.
+    if _is_postgres():
+        op.execute("ALTER TABLE core.api_keys ALTER COLUMN key_prefix TYPE varchar(32)")
+        return
+
     op.alter_column(
         "api_keys",
         "key_prefix",
@@ -44,6 +56,10 @@ def downgrade() -> None:
     if _is_sqlite():
         return
 
+    if _is_postgres():
+        op.execute("ALTER TABLE core.api_keys ALTER COLUMN key_prefix TYPE varchar(20)")
+        return
+
     op.alter_column(
         "api_keys",
         "key_prefix",
@@ -8,94 +8,173 @@ This script is self-contained - it creates all the data it needs.
 Run with: uv run python examples/quickstart.py
 """
 
+import asyncio
+import importlib.util
+import json
 import os
+
 import httpx
 
+# Encode and decode the example payloads with orjson when it is installed
+try:
+    import orjson
+
+    def _dumps(obj: object) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
 BASE_URL = "http://localhost:8000/api/v1"
 API_KEY = os.environ.get("TESSERA_API_KEY", "tessera-dev-key")
-CLIENT = httpx.Client(timeout=30.0, headers={"Authorization": f"Bearer {API_KEY}"})
+# One pooled keep-alive async client for every example, speaking HTTP/2 when
+# httpx's http2 extra is installed
+CLIENT = httpx.AsyncClient(
+    timeout=30.0,
+    http2=importlib.util.find_spec("h2") is not None,
+    limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30.0),
+    headers={"Authorization": f"Bearer {API_KEY}"},
+)
+
+ASSET_FQN = "warehouse.analytics.dim_customers"
+
+# Schemas used by the examples. They never change, so build them once.
+INITIAL_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "customer_id": {"type": "integer"},
+        "email": {"type": "string", "format": "email"},
+        "name": {"type": "string"},
+        "created_at": {"type": "string", "format": "date-time"},
+    },
+    "required": ["customer_id", "email"],
+}
+
+# Proposed schema that removes the 'email' field
+PROPOSED_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "customer_id": {"type": "integer"},
+        "name": {"type": "string"},
+        # email field removed!
+    },
+    "required": ["customer_id"],
+}
+# Sent as-is, so serialize it once instead of on every request
+PROPOSED_SCHEMA_BYTES = _dumps(PROPOSED_SCHEMA)
+
+BREAKING_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "customer_id": {"type": "integer"},
+        "full_name": {"type": "string"},  # renamed from 'name'
+        # 'email' removed - breaking change!
+    },
+    "required": ["customer_id"],
+}
+
+LOYALTY_TIER_PROP = {
+    "type": "string",
+    "enum": ["bronze", "silver", "gold", "platinum"],
+    "description": "Customer loyalty program tier",
+}
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Active contract per asset ID; entries are dropped whenever a contract is published.
+_active_contract_cache: dict[str, dict | None] = {}
+
+
+async def get_active_contract(asset_id: str, force_refresh: bool = False) -> dict | None:
+    """Return the active contract for an asset, reusing the previous lookup if possible."""
+    if force_refresh or asset_id not in _active_contract_cache:
+        # Let the server filter to the single active contract instead of
+        # downloading the asset's whole contract history and scanning it here.
+        resp = await CLIENT.get(
+            f"{BASE_URL}/contracts",
+            params={"asset_id": asset_id, "status": "active", "limit": 1},
+        )
+        contracts = _results(resp)
+        _active_contract_cache[asset_id] = contracts[0] if contracts else None
+    return _active_contract_cache[asset_id]
+
+
+def _json(resp: httpx.Response):
+    """Decode a response body."""
+    return _loads(resp.content)
+
 
+async def post_json(url: str, payload: object, **kwargs) -> httpx.Response:
+    """POST a JSON body encoded with the module's serializer."""
+    return await CLIENT.post(url, content=_dumps(payload), headers=JSON_HEADERS, **kwargs)
 
-def setup():
+
+def _results(resp: httpx.Response) -> list[dict]:
+    """Return the items of a list response, paginated or not."""
+    data = _json(resp)
+    return data.get("results", data) if isinstance(data, dict) else data
+
+
+async def ensure_team(name: str, teams_by_name: dict[str, dict]) -> dict:
+    """Return the named team, creating it if it doesn't exist yet."""
+    if name in teams_by_name:
+        return teams_by_name[name]
+    resp = await post_json(f"{BASE_URL}/teams", payload={"name": name})
+    if resp.status_code != 201:
+        raise Exception(f"Could not create {name} team: {resp.text}")
+    return _json(resp)
+
+
+async def setup():
     """Create the teams, asset, and initial contract needed for the examples."""
     print("Setting up test data...")
 
-    # Create producer team
-    resp = CLIENT.post(f"{BASE_URL}/teams", json={"name": "data-platform"})
-    if resp.status_code == 201:
-        producer = resp.json()
-    else:
-        # Team might already exist, try to find it
-        teams_resp = CLIENT.get(f"{BASE_URL}/teams").json()
-        teams = (
-            teams_resp.get("results", teams_resp) if isinstance(teams_resp, dict) else teams_resp
-        )
-        producer = next((t for t in teams if t["name"] == "data-platform"), None)
-        if not producer:
-            raise Exception("Could not create or find data-platform team")
-
-    # Create consumer team
-    resp = CLIENT.post(f"{BASE_URL}/teams", json={"name": "ml-team"})
-    if resp.status_code == 201:
-        consumer = resp.json()
-    else:
-        teams_resp = CLIENT.get(f"{BASE_URL}/teams").json()
-        teams = (
-            teams_resp.get("results", teams_resp) if isinstance(teams_resp, dict) else teams_resp
-        )
-        consumer = next((t for t in teams if t["name"] == "ml-team"), None)
-        if not consumer:
-            raise Exception("Could not create or find ml-team")
-
-    # Create an asset
-    resp = CLIENT.post(
-        f"{BASE_URL}/assets",
-        json={
-            "fqn": "warehouse.analytics.dim_customers",
-            "owner_team_id": producer["id"],
-            "metadata": {"description": "Customer dimension table"},
-        },
+    # Fetch what already exists once and index it, so re-runs don't need a
+    # failed POST plus a re-fetch for every entity.
+    teams_resp, assets_resp = await asyncio.gather(
+        CLIENT.get(f"{BASE_URL}/teams", params={"limit": 100}),
+        CLIENT.get(f"{BASE_URL}/assets", params={"fqn": ASSET_FQN}),
+    )
+    teams_by_name = {t["name"]: t for t in _results(teams_resp)}
+    assets_by_fqn = {a["fqn"]: a for a in _results(assets_resp)}
+
+    # The producer and consumer teams don't depend on each other, so create both at once
+    producer, consumer = await asyncio.gather(
+        ensure_team("data-platform", teams_by_name), ensure_team("ml-team", teams_by_name)
     )
-    if resp.status_code == 201:
-        asset = resp.json()
-    else:
-        # Asset might already exist
-        assets_resp = CLIENT.get(f"{BASE_URL}/assets").json()
-        assets = (
-            assets_resp.get("results", assets_resp)
-            if isinstance(assets_resp, dict)
-            else assets_resp
+
+    # Create the asset unless it already exists
+    asset = assets_by_fqn.get(ASSET_FQN)
+    if asset is None:
+        resp = await post_json(
+            f"{BASE_URL}/assets",
+            payload={
+                "fqn": ASSET_FQN,
+                "owner_team_id": producer["id"],
+                "metadata": {"description": "Customer dimension table"},
+            },
         )
-        asset = next((a for a in assets if a["fqn"] == "warehouse.analytics.dim_customers"), None)
-        if not asset:
-            raise Exception("Could not create or find asset")
+        if resp.status_code != 201:
+            raise Exception(f"Could not create asset: {resp.text}")
+        asset = _json(resp)
 
     # Publish initial contract
-    contracts_resp = CLIENT.get(f"{BASE_URL}/assets/{asset['id']}/contracts").json()
-    contracts = (
-        contracts_resp.get("results", contracts_resp)
-        if isinstance(contracts_resp, dict)
-        else contracts_resp
-    )
-    if not any(c["status"] == "active" for c in contracts):
-        resp = CLIENT.post(
+    if await get_active_contract(asset["id"]) is None:
+        resp = await post_json(
             f"{BASE_URL}/assets/{asset['id']}/contracts",
             params={"published_by": producer["id"]},
-            json={
+            payload={
                 "version": "1.0.0",
-                "schema": {
-                    "type": "object",
-                    "properties": {
-                        "customer_id": {"type": "integer"},
-                        "email": {"type": "string", "format": "email"},
-                        "name": {"type": "string"},
-                        "created_at": {"type": "string", "format": "date-time"},
-                    },
-                    "required": ["customer_id", "email"],
-                },
+                "schema": INITIAL_SCHEMA,
                 "compatibility_mode": "backward",
             },
         )
+        _active_contract_cache.pop(asset["id"], None)
         if resp.status_code != 201:
             raise Exception(f"Could not create contract: {resp.text}")
 
@@ -107,7 +186,7 @@ def setup():
     return producer, consumer, asset
 
 
-def example_1_register_as_consumer(asset: dict, consumer: dict):
+async def example_1_register_as_consumer(asset: dict, consumer: dict):
     """
     EXAMPLE 1: Register as a Consumer
     ---------------------------------
@@ -119,13 +198,7 @@ def example_1_register_as_consumer(asset: dict, consumer: dict):
     print("=" * 70)
 
     # Get the active contract
-    contracts_resp = CLIENT.get(f"{BASE_URL}/assets/{asset['id']}/contracts").json()
-    contracts = (
-        contracts_resp.get("results", contracts_resp)
-        if isinstance(contracts_resp, dict)
-        else contracts_resp
-    )
-    contract = next((c for c in contracts if c["status"] == "active"), None)
+    contract = await get_active_contract(asset["id"])
 
     if not contract:
         print("No active contract found.")
@@ -134,12 +207,12 @@ def example_1_register_as_consumer(asset: dict, consumer: dict):
     print(f"Found contract: {contract['id']} (v{contract['version']})")
 
     # Register as a consumer
-    resp = CLIENT.post(
+    resp = await post_json(
         f"{BASE_URL}/registrations",
         params={"contract_id": contract["id"]},
-        json={"consumer_team_id": consumer["id"]},
+        payload={"consumer_team_id": consumer["id"]},
     )
-    registration = resp.json()
+    registration = _json(resp)
 
     print(f"\n✓ Registered as consumer!")
     print(f"  Registration ID: {registration['id']}")
@@ -148,7 +221,7 @@ def example_1_register_as_consumer(asset: dict, consumer: dict):
     return contract
 
 
-def example_2_check_impact(asset: dict):
+async def example_2_check_impact(asset: dict):
     """
     EXAMPLE 2: Impact Analysis
     --------------------------
@@ -158,18 +231,13 @@ def example_2_check_impact(asset: dict):
     print("EXAMPLE 2: Check Impact Before Making Changes")
     print("=" * 70)
 
-    # Proposed schema that removes the 'email' field
-    proposed_schema = {
-        "type": "object",
-        "properties": {
-            "customer_id": {"type": "integer"},
-            "name": {"type": "string"},
-            # email field removed!
-        },
-        "required": ["customer_id"],
-    }
-
-    impact = CLIENT.post(f"{BASE_URL}/assets/{asset['id']}/impact", json=proposed_schema).json()
+    # Check the proposed schema that removes the 'email' field
+    resp = await CLIENT.post(
+        f"{BASE_URL}/assets/{asset['id']}/impact",
+        content=PROPOSED_SCHEMA_BYTES,
+        headers=JSON_HEADERS,
+    )
+    impact = _json(resp)
 
     print(f"\nChange type: {impact['change_type'].upper()}")
     print(f"Safe to publish: {impact['safe_to_publish']}")
@@ -187,7 +255,7 @@ def example_2_check_impact(asset: dict):
     return impact
 
 
-def example_3_breaking_change_creates_proposal(asset: dict, producer: dict):
+async def example_3_breaking_change_creates_proposal(asset: dict, producer: dict):
     """
     EXAMPLE 3: Breaking Change → Proposal
     -------------------------------------
@@ -199,23 +267,17 @@ def example_3_breaking_change_creates_proposal(asset: dict, producer: dict):
     print("=" * 70)
 
     # Try to publish a breaking change (removing 'email')
-    result = CLIENT.post(
+    resp = await post_json(
         f"{BASE_URL}/assets/{asset['id']}/contracts",
         params={"published_by": producer["id"]},
-        json={
+        payload={
             "version": "2.0.0",
-            "schema": {
-                "type": "object",
-                "properties": {
-                    "customer_id": {"type": "integer"},
-                    "full_name": {"type": "string"},  # renamed from 'name'
-                    # 'email' removed - breaking change!
-                },
-                "required": ["customer_id"],
-            },
+            "schema": BREAKING_SCHEMA,
             "compatibility_mode": "backward",
         },
-    ).json()
+    )
+    result = _json(resp)
+    _active_contract_cache.pop(asset["id"], None)
 
     print(f"\nAction: {result['action']}")
 
@@ -233,7 +295,7 @@ def example_3_breaking_change_creates_proposal(asset: dict, producer: dict):
     return None
 
 
-def example_4_acknowledge_proposal(proposal: dict, consumer: dict):
+async def example_4_acknowledge_proposal(proposal: dict, consumer: dict):
     """
     EXAMPLE 4: Consumer Acknowledges Proposal
     -----------------------------------------
@@ -243,14 +305,15 @@ def example_4_acknowledge_proposal(proposal: dict, consumer: dict):
     print("EXAMPLE 4: Consumer Acknowledges the Proposal")
     print("=" * 70)
 
-    ack = CLIENT.post(
+    resp = await post_json(
         f"{BASE_URL}/proposals/{proposal['id']}/acknowledge",
-        json={
+        payload={
             "consumer_team_id": consumer["id"],
             "response": "acknowledged",
             "notes": "We've updated our ML pipeline. Ready for the change.",
         },
-    ).json()
+    )
+    ack = _json(resp)
 
     print(f"\n✓ Proposal acknowledged!")
     print(f"  Status: {ack.get('status', 'acknowledged')}")
@@ -259,7 +322,7 @@ def example_4_acknowledge_proposal(proposal: dict, consumer: dict):
     return ack
 
 
-def example_5_compatible_change_auto_publishes(asset: dict, producer: dict):
+async def example_5_compatible_change_auto_publishes(asset: dict, producer: dict):
     """
     EXAMPLE 5: Compatible Change Auto-Publishes
     -------------------------------------------
@@ -271,13 +334,7 @@ def example_5_compatible_change_auto_publishes(asset: dict, producer: dict):
     print("=" * 70)
 
     # Get current contract
-    contracts_resp = CLIENT.get(f"{BASE_URL}/assets/{asset['id']}/contracts").json()
-    contracts = (
-        contracts_resp.get("results", contracts_resp)
-        if isinstance(contracts_resp, dict)
-        else contracts_resp
-    )
-    current = next((c for c in contracts if c["status"] == "active"), None)
+    current = await get_active_contract(asset["id"])
 
     if not current:
         print("\n⚠ No active contract found.")
@@ -290,20 +347,18 @@ def example_5_compatible_change_auto_publishes(asset: dict, producer: dict):
         "type": "object",
         "properties": {
             **current_schema.get("properties", {}),
-            "loyalty_tier": {
-                "type": "string",
-                "enum": ["bronze", "silver", "gold", "platinum"],
-                "description": "Customer loyalty program tier",
-            },
+            "loyalty_tier": LOYALTY_TIER_PROP,
         },
         "required": current_schema.get("required", []),
     }
 
-    result = CLIENT.post(
+    resp = await post_json(
         f"{BASE_URL}/assets/{asset['id']}/contracts",
         params={"published_by": producer["id"]},
-        json={"version": "1.1.0", "schema": new_schema, "compatibility_mode": "backward"},
-    ).json()
+        payload={"version": "1.1.0", "schema": new_schema, "compatibility_mode": "backward"},
+    )
+    result = _json(resp)
+    _active_contract_cache.pop(asset["id"], None)
 
     print(f"\nAction: {result['action']}")
 
@@ -316,37 +371,44 @@ def example_5_compatible_change_auto_publishes(asset: dict, producer: dict):
     return result
 
 
-def main():
+async def main():
     """Run all examples."""
     print("\n" + "🔷" * 35)
     print("  TESSERA QUICKSTART EXAMPLES")
     print("🔷" * 35 + "\n")
 
-    # Check server is running
+    # Check server is running. The liveness probe answers without the database
+    # checks /health runs.
     try:
-        CLIENT.get(f"{BASE_URL.replace('/api/v1', '')}/health")
-    except httpx.ConnectError:
+        resp = await CLIENT.get(f"{BASE_URL.replace('/api/v1', '')}/health/live", timeout=2.0)
+    except (httpx.ConnectError, httpx.ConnectTimeout):
         print("❌ Server not running. Start it with:")
         print("   uv run uvicorn tessera.main:app --reload")
         return
+    if resp.status_code != 200:
+        print(f"❌ Server is not healthy: {resp.status_code}")
+        return
 
     try:
         # Setup: create teams, asset, and initial contract
-        producer, consumer, asset = setup()
+        producer, consumer, asset = await setup()
 
-        # Run examples
-        example_1_register_as_consumer(asset, consumer)
-        example_2_check_impact(asset)
-        proposal = example_3_breaking_change_creates_proposal(asset, producer)
+        # Run examples. These stay sequential: each one builds on the server-side
+        # state left by the previous one (registration -> impact -> proposal -> ack).
+        await example_1_register_as_consumer(asset, consumer)
+        await example_2_check_impact(asset)
+        proposal = await example_3_breaking_change_creates_proposal(asset, producer)
         if proposal:
-            example_4_acknowledge_proposal(proposal, consumer)
-        example_5_compatible_change_auto_publishes(asset, producer)
+            await example_4_acknowledge_proposal(proposal, consumer)
+        await example_5_compatible_change_auto_publishes(asset, producer)
 
     except httpx.HTTPStatusError as e:
         print(f"\n❌ HTTP Error: {e.response.status_code}")
         print(e.response.text)
     except Exception as e:
         print(f"\n❌ Error: {e}")
+    finally:
+        await CLIENT.aclose()
 
     print("\n" + "=" * 70)
     print("✅ All examples complete!")
@@ -354,4 +416,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
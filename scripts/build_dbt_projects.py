@@ -5,10 +5,13 @@ This script is called by Docker to build dbt projects before the seeder runs.
 Each project generates a manifest.json that the seeder imports into Tessera.
 """
 
-import subprocess
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from dbt.cli.main import dbtRunner
+
 # Demo dbt projects directory
 DEMO_PROJECTS_DIR = Path("/app/tests/fixtures/demo_dbt_projects")
 
@@ -19,53 +22,64 @@ PROJECTS = [
     {"name": "finance", "team": "finance-analytics"},
 ]
 
+# In-process dbt runner, so each build reuses the already-imported dbt instead
+# of paying a fresh interpreter start for every dbt command.
+DBT = dbtRunner()
+
+
+def build_project(project_dir: Path, project_name: str) -> Path | None:
+    """Build a single dbt project.
 
-def build_project(project_dir: Path, project_name: str) -> bool:
-    """Build a single dbt project."""
+    Returns the path of the generated manifest, or None if the build failed.
+    """
     print(f"\n{'='*60}")
     print(f"Building {project_name} project...")
     print(f"{'='*60}")
 
+    dbt_args = ["--project-dir", str(project_dir), "--profiles-dir", str(project_dir)]
+
     # Install dependencies
     print("  Installing dbt deps...")
-    deps_result = subprocess.run(
-        ["dbt", "deps", "--profiles-dir", "."],
-        cwd=project_dir,
-        capture_output=True,
-        text=True,
-    )
-    if deps_result.returncode != 0:
+    deps_result = DBT.invoke(["deps", "--quiet", *dbt_args])
+    if not deps_result.success:
         print("  ERROR: dbt deps failed")
-        print(deps_result.stderr)
-        return False
+        print(deps_result.exception)
+        return None
     print("  Dependencies installed")
 
     # Build project (seeds, models, tests)
     print("  Running dbt build...")
-    build_result = subprocess.run(
-        ["dbt", "build", "--profiles-dir", "."],
-        cwd=project_dir,
-        capture_output=True,
-        text=True,
-    )
+    build_result = DBT.invoke(["build", "--quiet", *dbt_args])
 
     # Check if manifest was generated (even if some tests failed)
     manifest_path = project_dir / "target" / "manifest.json"
-    if manifest_path.exists():
-        print(f"  Manifest generated: {manifest_path}")
-
-        # Parse output for summary
-        output = build_result.stdout
-        if "PASS=" in output:
-            # Extract test counts
-            for line in output.split("\n"):
-                if "Done." in line and "PASS=" in line:
-                    print(f"  {line.strip()}")
-        return True
-    else:
+    try:
+        manifest_size = manifest_path.stat().st_size
+    except FileNotFoundError:
         print("  ERROR: No manifest generated")
-        print(build_result.stderr)
-        return False
+        print(build_result.exception)
+        return None
+
+    print(f"  Manifest generated: {manifest_path} ({manifest_size} bytes)")
+    if build_result.result is not None:
+        # Summarize from the per-node results rather than scraping dbt's log
+        statuses = Counter(str(r.status) for r in build_result.result.results)
+        passed = statuses["success"] + statuses["pass"]
+        errors = statuses["error"] + statuses["fail"]
+        print(
+            f"  Done. PASS={passed} WARN={statuses['warn']} ERROR={errors} "
+            f"SKIP={statuses['skipped']} TOTAL={sum(statuses.values())}"
+        )
+    return manifest_path
+
+
+def _build_one(project: dict[str, str]) -> Path | None:
+    """Build one entry of PROJECTS; runs in a worker process."""
+    project_dir = DEMO_PROJECTS_DIR / project["name"]
+    if not project_dir.exists():
+        print(f"\nWARNING: Project directory not found: {project_dir}")
+        return None
+    return build_project(project_dir, project["name"])
 
 
 def main() -> int:
@@ -78,20 +92,18 @@ def main() -> int:
         print(f"ERROR: Demo projects directory not found: {DEMO_PROJECTS_DIR}")
         return 1
 
-    successful = 0
-    failed = 0
-
-    for project in PROJECTS:
-        project_dir = DEMO_PROJECTS_DIR / project["name"]
-        if not project_dir.exists():
-            print(f"\nWARNING: Project directory not found: {project_dir}")
-            failed += 1
-            continue
+    # Projects are independent (each uses its own in-memory DuckDB), so build
+    # them in parallel. Per-project output may interleave.
+    with ProcessPoolExecutor(max_workers=len(PROJECTS)) as executor:
+        results = list(executor.map(_build_one, PROJECTS))
 
-        if build_project(project_dir, project["name"]):
-            successful += 1
-        else:
-            failed += 1
+    manifests: dict[str, Path] = {
+        project["name"]: manifest_path
+        for project, manifest_path in zip(PROJECTS, results)
+        if manifest_path is not None
+    }
+    successful = len(manifests)
+    failed = len(PROJECTS) - successful
 
     # Summary
     print("\n" + "=" * 60)
@@ -104,9 +116,8 @@ def main() -> int:
     if successful > 0:
         print("\nManifests ready for import:")
         for project in PROJECTS:
-            manifest_path = DEMO_PROJECTS_DIR / project["name"] / "target" / "manifest.json"
-            if manifest_path.exists():
-                print(f"  - {project['name']}: {manifest_path}")
+            if project["name"] in manifests:
+                print(f"  - {project['name']}: {manifests[project['name']]}")
                 print(f"    Owner team: {project['team']}")
 
     return 0 if failed == 0 else 1
@@ -0,0 +1,203 @@
+"""Helpers shared by the scripts in this directory.
+
+The scripts run as ``python scripts/<name>.py``, which puts this directory on
+``sys.path``, so they import from here with ``from common import ...``.
+"""
+
+import asyncio
+import functools
+import importlib.util
+import json
+import random
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+import httpx
+
+# orjson encodes and decodes several times faster than the stdlib codec, working
+# on bytes directly, but is optional
+try:
+    import orjson
+
+    def dumps(obj: object) -> bytes:
+        return orjson.dumps(obj)
+
+    loads = orjson.loads
+except ImportError:
+
+    def dumps(obj: object) -> bytes:
+        return json.dumps(obj).encode()
+
+    loads = json.loads
+
+# HTTP/2 multiplexes concurrent requests over one connection, but httpx needs
+# the optional h2 package for it (pip install "httpx[http2]")
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Most requests to the API in flight at once
+MAX_CONCURRENCY = 16
+
+T = TypeVar("T")
+RequestFunc = Callable[..., Awaitable[httpx.Response]]
+
+
+def retry(
+    on: tuple[type[Exception], ...],
+    tries: int = 3,
+    backoff: float = 0.2,
+    server_errors: bool = True,
+) -> Callable[[RequestFunc], RequestFunc]:
+    """Retry an async request function on transient failures.
+
+    A call is retried when it raises one of ``on`` or, if ``server_errors`` is
+    set, the server answers with a 5xx status, waiting ``backoff`` seconds,
+    doubled after each attempt and stretched by up to half again at random so
+    that retries don't line up. The last of ``tries`` attempts returns or
+    raises whatever it gets.
+    """
+
+    def decorator(func: RequestFunc) -> RequestFunc:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> httpx.Response:
+            for attempt in range(tries - 1):
+                try:
+                    resp = await func(*args, **kwargs)
+                    if resp.status_code < 500 or not server_errors:
+                        return resp
+                except on:
+                    pass
+                await asyncio.sleep(backoff * 2**attempt * random.uniform(1.0, 1.5))
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+async def gather_bounded(aws: Iterable[Awaitable[T]]) -> list[T]:
+    """Await all of ``aws`` concurrently, at most MAX_CONCURRENCY at a time.
+
+    Results are returned in the order of ``aws``.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def bounded(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(bounded(aw) for aw in aws))
+
+
+@dataclass(slots=True)
+class ModelTestCounts:
+    """Test outcome counts for a single model."""
+
+    passed: int = 0
+    failed: int = 0
+    errored: int = 0
+    skipped: int = 0
+    failed_tests: list[dict[str, str]] = field(default_factory=list)
+
+
+def get_model_fqn_for_test(
+    test_node: dict[str, Any],
+    nodes: dict[str, Any],
+    sources: dict[str, Any],
+    fqn_cache: dict[str, str | None],
+) -> str | None:
+    """Get the FQN of the model that a test depends on.
+
+    Uses database.schema.name format which matches how Tessera stores FQNs
+    from dbt manifest imports.
+
+    ``fqn_cache`` maps model and source node IDs to the FQNs already built for
+    them, so the many tests on one model share a single lookup.
+    """
+    depends_on = test_node.get("depends_on", {}).get("nodes", [])
+
+    # Find the first model/source this test depends on
+    for node_id in depends_on:
+        if node_id.startswith(("model.", "source.")):
+            if node_id not in fqn_cache:
+                node = nodes.get(node_id) or sources.get(node_id)
+                fqn_cache[node_id] = None
+                if node:
+                    database = node.get("database", "")
+                    schema = node.get("schema", "")
+                    name = node.get("name", "")
+                    fqn_cache[node_id] = f"{database}.{schema}.{name}".lower()
+            if fqn_cache[node_id]:
+                return fqn_cache[node_id]
+    return None
+
+
+def build_test_fqn_index(manifest: dict[str, Any]) -> dict[str, str]:
+    """Map each test node ID in the manifest to the FQN of the model it tests.
+
+    Built in one pass over the manifest so that extracting results needs only a
+    dict lookup per test. Tests without a resolvable model are left out.
+    """
+    nodes = manifest.get("nodes") or {}
+    sources = manifest.get("sources") or {}
+    fqn_cache: dict[str, str | None] = {}
+
+    index: dict[str, str] = {}
+    for unique_id, node in nodes.items():
+        if unique_id.startswith("test."):
+            model_fqn = get_model_fqn_for_test(node, nodes, sources, fqn_cache)
+            if model_fqn:
+                index[unique_id] = model_fqn
+    return index
+
+
+def extract_test_results(
+    run_results: dict[str, Any], manifest: dict[str, Any]
+) -> dict[str, ModelTestCounts]:
+    """Extract test results grouped by model FQN.
+
+    Returns:
+        Dict mapping model FQN to its ModelTestCounts.
+    """
+    results_by_model: dict[str, ModelTestCounts] = {}
+
+    nodes = manifest.get("nodes") or {}
+    test_fqns = build_test_fqn_index(manifest)
+
+    for result in run_results.get("results") or []:
+        unique_id = result.get("unique_id", "")
+        if not unique_id.startswith("test."):
+            continue
+
+        # Find which model this test is for
+        model_fqn = test_fqns.get(unique_id)
+        if not model_fqn:
+            continue
+
+        status = result.get("status", "").lower()
+        model_results = results_by_model.setdefault(model_fqn, ModelTestCounts())
+
+        if status == "pass":
+            model_results.passed += 1
+        elif status == "fail":
+            model_results.failed += 1
+            model_results.failed_tests.append(
+                {
+                    "name": nodes[unique_id].get("name", unique_id),
+                    "message": result.get("message", "Test failed"),
+                    "unique_id": unique_id,
+                }
+            )
+        elif status == "error":
+            model_results.errored += 1
+            model_results.failed_tests.append(
+                {
+                    "name": nodes[unique_id].get("name", unique_id),
+                    "message": result.get("message", "Test errored"),
+                    "unique_id": unique_id,
+                }
+            )
+        elif status == "skipped":
+            model_results.skipped += 1
+
+    return results_by_model
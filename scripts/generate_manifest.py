@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
 """Generate a realistic dbt manifest with ~250 models, tests, and tessera meta for testing."""
 
+import argparse
+import functools
 import json
 import random
+from collections import Counter
 from pathlib import Path
 
+# Write the manifest with orjson when it is installed; it is much faster at this size
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Domain-specific schemas and naming with teams
 DOMAINS = {
     "core": {
@@ -104,225 +113,417 @@ MART_MODELS = [
     "mart_{domain}_forecasts",
 ]
 
+# Model layers, in the order the summary reports them
+LAYERS = ("staging", "intermediate", "dimension", "fact", "mart", "utility")
+
+# Raw source tables the staging models read from
+RAW_SOURCES = [
+    "raw_users",
+    "raw_events",
+    "raw_transactions",
+    "raw_products",
+    "raw_orders",
+    "raw_customers",
+    "raw_campaigns",
+    "raw_sessions",
+    "raw_pageviews",
+    "raw_clicks",
+    "raw_conversions",
+    "raw_accounts",
+    "raw_invoices",
+    "raw_payments",
+    "raw_subscriptions",
+    "raw_tickets",
+]
 
-def generate_columns(model_name: str, layer: str) -> dict:
-    """Generate appropriate columns for a model based on its name and layer."""
-    columns = {}
+MODEL_TEMPLATES = {
+    "staging": STAGING_MODELS,
+    "intermediate": INTERMEDIATE_MODELS,
+    "dimension": DIMENSION_MODELS,
+    "fact": FACT_MODELS,
+    "mart": MART_MODELS,
+}
 
-    # Always include ID and timestamps
-    pk_name = f"{model_name.split('_')[-1].rstrip('s')}_id"
-    columns[pk_name] = {
-        "name": pk_name,
-        "description": f"Primary key for {model_name}",
-        "data_type": "integer",
+# Model names per domain prefix and layer, expanded from the templates once
+MODEL_NAMES = {
+    config["prefix"]: {
+        layer: tuple(template.format(domain=config["prefix"]) for template in templates)
+        for layer, templates in MODEL_TEMPLATES.items()
     }
-    columns["created_at"] = {
+    for config in DOMAINS.values()
+}
+
+
+# Model-name keywords that drive column and test generation, one bit each. A
+# model's keywords are matched once into a bitmask by model_features().
+FEATURE_KEYWORDS = (
+    "user",
+    "transaction",
+    "revenue",
+    "event",
+    "campaign",
+    "marketing",
+    "metric",
+    "summary",
+    "rollup",
+    "order",
+    "ticket",
+    "support",
+    "payment",
+    "subscription",
+)
+(
+    USER,
+    TRANSACTION,
+    REVENUE,
+    EVENT,
+    CAMPAIGN,
+    MARKETING,
+    METRIC,
+    SUMMARY,
+    ROLLUP,
+    ORDER,
+    TICKET,
+    SUPPORT,
+    PAYMENT,
+    SUBSCRIPTION,
+) = (1 << bit for bit in range(len(FEATURE_KEYWORDS)))
+
+
+def model_features(model_name: str) -> int:
+    """Return the bitmask of FEATURE_KEYWORDS contained in a model name."""
+    features = 0
+    for bit, keyword in enumerate(FEATURE_KEYWORDS):
+        if keyword in model_name:
+            features |= 1 << bit
+    return features
+
+
+# Id columns that are foreign keys rather than a model's own primary key
+FOREIGN_KEY_COLUMNS = ("user_id", "customer_id")
+
+# Foreign key columns that get a relationships test, mapped to the token that
+# identifies a likely parent model among a model's dependencies
+RELATIONSHIP_TOKENS = {"user_id": "user", "customer_id": "customer", "order_id": "order"}
+
+# Fixed column groups added by generate_columns. Built once at import; models
+# share these entries by reference since they're never mutated afterwards.
+BASE_COLUMNS = {
+    "created_at": {
         "name": "created_at",
         "description": "Record creation timestamp",
         "data_type": "timestamp",
-    }
+    },
+}
+
+STAGING_COLUMNS = {
+    "_loaded_at": {
+        "name": "_loaded_at",
+        "description": "ETL load timestamp",
+        "data_type": "timestamp",
+    },
+    "_source": {
+        "name": "_source",
+        "description": "Source system identifier",
+        "data_type": "string",
+    },
+}
+
+UPDATED_AT_COLUMNS = {
+    "updated_at": {
+        "name": "updated_at",
+        "description": "Last update timestamp",
+        "data_type": "timestamp",
+    },
+}
+
+USER_COLUMNS = {
+    "email": {
+        "name": "email",
+        "description": "User email address",
+        "data_type": "string",
+    },
+    "name": {"name": "name", "description": "User display name", "data_type": "string"},
+    "signup_date": {
+        "name": "signup_date",
+        "description": "User signup date",
+        "data_type": "date",
+    },
+    "status": {
+        "name": "status",
+        "description": "User status",
+        "data_type": "string",
+    },
+}
+
+TRANSACTION_COLUMNS = {
+    "amount": {
+        "name": "amount",
+        "description": "Transaction amount in USD",
+        "data_type": "number",
+    },
+    "currency": {
+        "name": "currency",
+        "description": "Currency code",
+        "data_type": "string",
+    },
+    "transaction_date": {
+        "name": "transaction_date",
+        "description": "Transaction date",
+        "data_type": "date",
+    },
+    "status": {
+        "name": "status",
+        "description": "Payment status",
+        "data_type": "string",
+    },
+}
+
+EVENT_COLUMNS = {
+    "event_type": {
+        "name": "event_type",
+        "description": "Type of event",
+        "data_type": "string",
+    },
+    "event_timestamp": {
+        "name": "event_timestamp",
+        "description": "When event occurred",
+        "data_type": "timestamp",
+    },
+    "user_id": {
+        "name": "user_id",
+        "description": "Foreign key to users",
+        "data_type": "integer",
+    },
+    "properties": {
+        "name": "properties",
+        "description": "Event properties JSON",
+        "data_type": "object",
+    },
+}
+
+CAMPAIGN_COLUMNS = {
+    "campaign_name": {
+        "name": "campaign_name",
+        "description": "Campaign name",
+        "data_type": "string",
+    },
+    "channel": {
+        "name": "channel",
+        "description": "Marketing channel",
+        "data_type": "string",
+    },
+    "spend": {
+        "name": "spend",
+        "description": "Campaign spend in USD",
+        "data_type": "number",
+    },
+    "status": {
+        "name": "status",
+        "description": "Campaign status",
+        "data_type": "string",
+    },
+}
+
+METRIC_COLUMNS = {
+    "metric_date": {
+        "name": "metric_date",
+        "description": "Metric date",
+        "data_type": "date",
+    },
+    "total_count": {
+        "name": "total_count",
+        "description": "Total count",
+        "data_type": "integer",
+    },
+    "total_amount": {
+        "name": "total_amount",
+        "description": "Total amount",
+        "data_type": "number",
+    },
+    "avg_value": {
+        "name": "avg_value",
+        "description": "Average value",
+        "data_type": "number",
+    },
+}
+
+ORDER_COLUMNS = {
+    "order_id": {
+        "name": "order_id",
+        "description": "Order identifier",
+        "data_type": "integer",
+    },
+    "customer_id": {
+        "name": "customer_id",
+        "description": "Customer identifier",
+        "data_type": "integer",
+    },
+    "status": {
+        "name": "status",
+        "description": "Order status",
+        "data_type": "string",
+    },
+}
+
+TICKET_COLUMNS = {
+    "ticket_id": {
+        "name": "ticket_id",
+        "description": "Support ticket ID",
+        "data_type": "integer",
+    },
+    "priority": {
+        "name": "priority",
+        "description": "Ticket priority",
+        "data_type": "string",
+    },
+    "status": {
+        "name": "status",
+        "description": "Ticket status",
+        "data_type": "string",
+    },
+}
+
+# Columns of every raw source table
+SOURCE_COLUMNS = {
+    "id": {"name": "id", "description": "Source record ID", "data_type": "integer"},
+    "data": {"name": "data", "description": "Raw JSON payload", "data_type": "object"},
+    "_loaded_at": {
+        "name": "_loaded_at",
+        "description": "Load timestamp",
+        "data_type": "timestamp",
+    },
+}
+
+
+@functools.cache
+def shared_columns(pk_name: str, layer: str, features: int) -> tuple[str | None, dict]:
+    """Build the columns a model gets besides its own primary key entry.
+
+    Models from the same template in different domains usually agree on all
+    three arguments, so the result is cached and built once per family. The
+    returned dict is shared between callers and must not be mutated.
+    Returns ``(pk_column, columns)``; pk_column is None if the model has no
+    usable key.
+    """
+    columns = {}
+    columns.update(BASE_COLUMNS)
 
     # Add layer-specific columns
     if layer == "staging":
-        columns["_loaded_at"] = {
-            "name": "_loaded_at",
-            "description": "ETL load timestamp",
-            "data_type": "timestamp",
-        }
-        columns["_source"] = {
-            "name": "_source",
-            "description": "Source system identifier",
-            "data_type": "string",
-        }
+        columns.update(STAGING_COLUMNS)
 
     if layer in ("dimension", "mart"):
-        columns["updated_at"] = {
-            "name": "updated_at",
-            "description": "Last update timestamp",
-            "data_type": "timestamp",
-        }
+        columns.update(UPDATED_AT_COLUMNS)
 
     # Add domain-specific columns
-    if "user" in model_name:
-        columns.update(
-            {
-                "email": {
-                    "name": "email",
-                    "description": "User email address",
-                    "data_type": "string",
-                },
-                "name": {"name": "name", "description": "User display name", "data_type": "string"},
-                "signup_date": {
-                    "name": "signup_date",
-                    "description": "User signup date",
-                    "data_type": "date",
-                },
-                "status": {
-                    "name": "status",
-                    "description": "User status",
-                    "data_type": "string",
-                },
-            }
-        )
+    if features & USER:
+        columns.update(USER_COLUMNS)
 
-    if "transaction" in model_name or "revenue" in model_name:
-        columns.update(
-            {
-                "amount": {
-                    "name": "amount",
-                    "description": "Transaction amount in USD",
-                    "data_type": "number",
-                },
-                "currency": {
-                    "name": "currency",
-                    "description": "Currency code",
-                    "data_type": "string",
-                },
-                "transaction_date": {
-                    "name": "transaction_date",
-                    "description": "Transaction date",
-                    "data_type": "date",
-                },
-                "status": {
-                    "name": "status",
-                    "description": "Payment status",
-                    "data_type": "string",
-                },
-            }
-        )
+    if features & (TRANSACTION | REVENUE):
+        columns.update(TRANSACTION_COLUMNS)
 
-    if "event" in model_name:
-        columns.update(
-            {
-                "event_type": {
-                    "name": "event_type",
-                    "description": "Type of event",
-                    "data_type": "string",
-                },
-                "event_timestamp": {
-                    "name": "event_timestamp",
-                    "description": "When event occurred",
-                    "data_type": "timestamp",
-                },
-                "user_id": {
-                    "name": "user_id",
-                    "description": "Foreign key to users",
-                    "data_type": "integer",
-                },
-                "properties": {
-                    "name": "properties",
-                    "description": "Event properties JSON",
-                    "data_type": "object",
-                },
-            }
-        )
+    if features & EVENT:
+        columns.update(EVENT_COLUMNS)
 
-    if "campaign" in model_name or "marketing" in model_name:
-        columns.update(
-            {
-                "campaign_name": {
-                    "name": "campaign_name",
-                    "description": "Campaign name",
-                    "data_type": "string",
-                },
-                "channel": {
-                    "name": "channel",
-                    "description": "Marketing channel",
-                    "data_type": "string",
-                },
-                "spend": {
-                    "name": "spend",
-                    "description": "Campaign spend in USD",
-                    "data_type": "number",
-                },
-                "status": {
-                    "name": "status",
-                    "description": "Campaign status",
-                    "data_type": "string",
-                },
-            }
-        )
+    if features & (CAMPAIGN | MARKETING):
+        columns.update(CAMPAIGN_COLUMNS)
 
-    if "metric" in model_name or "summary" in model_name or "rollup" in model_name:
-        columns.update(
-            {
-                "metric_date": {
-                    "name": "metric_date",
-                    "description": "Metric date",
-                    "data_type": "date",
-                },
-                "total_count": {
-                    "name": "total_count",
-                    "description": "Total count",
-                    "data_type": "integer",
-                },
-                "total_amount": {
-                    "name": "total_amount",
-                    "description": "Total amount",
-                    "data_type": "number",
-                },
-                "avg_value": {
-                    "name": "avg_value",
-                    "description": "Average value",
-                    "data_type": "number",
-                },
-            }
-        )
+    if features & (METRIC | SUMMARY | ROLLUP):
+        columns.update(METRIC_COLUMNS)
 
-    if "order" in model_name:
-        columns.update(
-            {
-                "order_id": {
-                    "name": "order_id",
-                    "description": "Order identifier",
-                    "data_type": "integer",
-                },
-                "customer_id": {
-                    "name": "customer_id",
-                    "description": "Customer identifier",
-                    "data_type": "integer",
-                },
-                "status": {
-                    "name": "status",
-                    "description": "Order status",
-                    "data_type": "string",
-                },
-            }
-        )
+    if features & ORDER:
+        columns.update(ORDER_COLUMNS)
 
-    if "ticket" in model_name or "support" in model_name:
-        columns.update(
-            {
-                "ticket_id": {
-                    "name": "ticket_id",
-                    "description": "Support ticket ID",
-                    "data_type": "integer",
-                },
-                "priority": {
-                    "name": "priority",
-                    "description": "Ticket priority",
-                    "data_type": "string",
-                },
-                "status": {
-                    "name": "status",
-                    "description": "Ticket status",
-                    "data_type": "string",
-                },
-            }
+    if features & (TICKET | SUPPORT):
+        columns.update(TICKET_COLUMNS)
+
+    # user_id/customer_id are treated as foreign keys, so a model keyed by one
+    # of them falls back to its next id column.
+    pk_column = pk_name
+    if pk_name in FOREIGN_KEY_COLUMNS:
+        pk_column = next(
+            (c for c in columns if c.endswith("_id") and c not in FOREIGN_KEY_COLUMNS), None
         )
 
-    return columns
+    return pk_column, columns
+
+
+def generate_columns(model_name: str, layer: str, features: int) -> tuple[str | None, str, dict]:
+    """Generate appropriate columns for a model based on its name and layer.
+
+    ``features`` is the model_features() bitmask of ``model_name``. Returns
+    ``(pk_column, date_column, columns)``; pk_column is None if the model has
+    no usable key, and date_column is the first date-like column.
+    """
+    # Always include ID and timestamps
+    pk_name = f"{model_name.split('_')[-1].rstrip('s')}_id"
+    pk_column, shared = shared_columns(pk_name, layer, features)
+
+    # Only the primary key's description mentions the model itself; everything
+    # else is copied from the cached family columns.
+    columns = {
+        pk_name: {
+            "name": pk_name,
+            "description": f"Primary key for {model_name}",
+            "data_type": "integer",
+        }
+    }
+    columns.update(shared)
+
+    # The primary key comes first and created_at always second, so the first
+    # date-like column is known without scanning (e.g. dim_date's date_id)
+    date_column = pk_name if "date" in pk_name else "created_at"
+    return pk_column, date_column, columns
+
+
+def make_test(
+    test_prefix: str,
+    test_name: str,
+    depends_on: dict,
+    column_name: str | None,
+    metadata_name: str,
+    kwargs: dict,
+    namespace: str | None = None,
+) -> tuple[str, dict]:
+    """Build a dbt test node, returning ``(unique_id, node)``.
+
+    ``test_prefix`` is the ``"test.<project>."`` unique_id prefix.
+    """
+    test_id = test_prefix + test_name
+    node = {
+        "name": test_name,
+        "resource_type": "test",
+        "unique_id": test_id,
+        "depends_on": depends_on,
+    }
+    if column_name is not None:
+        node["column_name"] = column_name
+    test_metadata = {"name": metadata_name}
+    if namespace is not None:
+        test_metadata["namespace"] = namespace
+    test_metadata["kwargs"] = kwargs
+    node["test_metadata"] = test_metadata
+    return test_id, node
 
 
 def generate_tests_for_model(
     model_name: str,
     model_id: str,
     columns: dict,
+    pk_column: str | None,
+    date_column: str,
     depends_on_models: list[str],
+    features: int,
+    row_count_check: bool = False,
     project_name: str = "ecommerce",
-) -> dict:
+) -> list[tuple[str, dict]]:
     """Generate dbt test nodes for a model's columns.
 
+    ``features`` is the model_features() bitmask of ``model_name``, and
+    ``date_column`` its first date-like column. ``row_count_check`` adds the
+    custom SQL row count test.
+
     Supports:
     - not_null tests (standard dbt)
     - unique tests (standard dbt)
@@ -331,195 +532,157 @@ def generate_tests_for_model(
     - dbt_utils tests (expression_is_true, at_least_one, etc.)
     - dbt_expectations tests
     - Custom SQL tests
-    """
-    tests = {}
-    pk_column = None
 
-    # Find primary key column
-    for col_name in columns:
-        if col_name.endswith("_id") and col_name != "user_id" and col_name != "customer_id":
-            pk_column = col_name
-            break
+    Returns ``(unique_id, node)`` pairs so callers can bulk-insert them.
+    """
+    tests = []
+    test_prefix = f"test.{project_name}."
+    # Tests that only depend on the model itself share one depends_on mapping
+    depends_on_self = {"nodes": [model_id]}
+
+    # Index the parent model for each foreign key in one pass over the deps:
+    # the first upstream model whose ID mentions the key's entity
+    parent_by_column = {}
+    for dep in depends_on_models:
+        for fk_column, token in RELATIONSHIP_TOKENS.items():
+            if token in dep and fk_column not in parent_by_column:
+                parent_by_column[fk_column] = dep
 
     # Generate tests for each column
     for col_name, col_info in columns.items():
+        suffix = f"{model_name}_{col_name}"
+
         # not_null tests for important columns
         if col_name in [pk_column, "created_at", "email", "name", "amount", "status"]:
-            test_id = f"test.{project_name}.not_null_{model_name}_{col_name}"
-            tests[test_id] = {
-                "name": f"not_null_{model_name}_{col_name}",
-                "resource_type": "test",
-                "unique_id": test_id,
-                "depends_on": {"nodes": [model_id]},
-                "column_name": col_name,
-                "test_metadata": {
-                    "name": "not_null",
-                    "kwargs": {"column_name": col_name},
-                },
-            }
+            tests.append(
+                make_test(
+                    test_prefix,
+                    "not_null_" + suffix,
+                    depends_on_self,
+                    col_name,
+                    "not_null",
+                    {"column_name": col_name},
+                )
+            )
 
         # unique test for primary key
         if col_name == pk_column:
-            test_id = f"test.{project_name}.unique_{model_name}_{col_name}"
-            tests[test_id] = {
-                "name": f"unique_{model_name}_{col_name}",
-                "resource_type": "test",
-                "unique_id": test_id,
-                "depends_on": {"nodes": [model_id]},
-                "column_name": col_name,
-                "test_metadata": {
-                    "name": "unique",
-                    "kwargs": {"column_name": col_name},
-                },
-            }
+            tests.append(
+                make_test(
+                    test_prefix,
+                    "unique_" + suffix,
+                    depends_on_self,
+                    col_name,
+                    "unique",
+                    {"column_name": col_name},
+                )
+            )
 
         # accepted_values for status columns
         if col_name == "status":
             # Determine which status values to use based on model name
             status_key = "user_status"  # default
-            if "order" in model_name:
+            if features & ORDER:
                 status_key = "order_status"
-            elif "payment" in model_name or "transaction" in model_name:
+            elif features & (PAYMENT | TRANSACTION):
                 status_key = "payment_status"
-            elif "subscription" in model_name:
+            elif features & SUBSCRIPTION:
                 status_key = "subscription_status"
-            elif "ticket" in model_name or "support" in model_name:
+            elif features & (TICKET | SUPPORT):
                 status_key = "ticket_status"
-            elif "campaign" in model_name:
+            elif features & CAMPAIGN:
                 status_key = "campaign_status"
 
-            test_id = f"test.{project_name}.accepted_values_{model_name}_{col_name}"
-            tests[test_id] = {
-                "name": f"accepted_values_{model_name}_{col_name}",
-                "resource_type": "test",
-                "unique_id": test_id,
-                "depends_on": {"nodes": [model_id]},
-                "column_name": col_name,
-                "test_metadata": {
-                    "name": "accepted_values",
-                    "kwargs": {
-                        "column_name": col_name,
-                        "values": STATUS_VALUES[status_key],
-                    },
-                },
-            }
+            tests.append(
+                make_test(
+                    test_prefix,
+                    "accepted_values_" + suffix,
+                    depends_on_self,
+                    col_name,
+                    "accepted_values",
+                    {"column_name": col_name, "values": STATUS_VALUES[status_key]},
+                )
+            )
 
         # relationships tests for foreign keys
-        if col_name in ["user_id", "customer_id", "order_id"] and depends_on_models:
-            # Find a parent model that likely has this column as PK
-            parent_model = None
-            for dep in depends_on_models:
-                if "user" in dep and col_name == "user_id":
-                    parent_model = dep
-                    break
-                elif "customer" in dep and col_name == "customer_id":
-                    parent_model = dep
-                    break
-                elif "order" in dep and col_name == "order_id":
-                    parent_model = dep
-                    break
-
-            if parent_model:
-                test_id = f"test.{project_name}.relationships_{model_name}_{col_name}"
-                tests[test_id] = {
-                    "name": f"relationships_{model_name}_{col_name}",
-                    "resource_type": "test",
-                    "unique_id": test_id,
-                    "depends_on": {"nodes": [model_id, parent_model]},
-                    "column_name": col_name,
-                    "test_metadata": {
-                        "name": "relationships",
-                        "kwargs": {
-                            "column_name": col_name,
-                            "to": parent_model.split(".")[-1],
-                            "field": col_name,
-                        },
+        parent_model = parent_by_column.get(col_name)
+        if parent_model:
+            tests.append(
+                make_test(
+                    test_prefix,
+                    "relationships_" + suffix,
+                    {"nodes": [model_id, parent_model]},
+                    col_name,
+                    "relationships",
+                    {
+                        "column_name": col_name,
+                        "to": parent_model.split(".")[-1],
+                        "field": col_name,
                     },
-                }
+                )
+            )
 
     # dbt_utils tests for certain models
     if "amount" in columns or "total_amount" in columns:
         amount_col = "amount" if "amount" in columns else "total_amount"
         # expression_is_true: amount >= 0
-        test_id = (
-            f"test.{project_name}.dbt_utils_expression_is_true_{model_name}_{amount_col}_positive"
+        tests.append(
+            make_test(
+                test_prefix,
+                "dbt_utils_expression_is_true_" + model_name + "_" + amount_col + "_positive",
+                depends_on_self,
+                amount_col,
+                "dbt_utils.expression_is_true",
+                {"expression": f"{amount_col} >= 0"},
+                namespace="dbt_utils",
+            )
         )
-        tests[test_id] = {
-            "name": f"dbt_utils_expression_is_true_{model_name}_{amount_col}_positive",
-            "resource_type": "test",
-            "unique_id": test_id,
-            "depends_on": {"nodes": [model_id]},
-            "column_name": amount_col,
-            "test_metadata": {
-                "name": "dbt_utils.expression_is_true",
-                "namespace": "dbt_utils",
-                "kwargs": {
-                    "expression": f"{amount_col} >= 0",
-                },
-            },
-        }
 
     # dbt_utils.at_least_one for staging tables
     if model_name.startswith("stg_") and pk_column:
-        test_id = f"test.{project_name}.dbt_utils_at_least_one_{model_name}_{pk_column}"
-        tests[test_id] = {
-            "name": f"dbt_utils_at_least_one_{model_name}_{pk_column}",
-            "resource_type": "test",
-            "unique_id": test_id,
-            "depends_on": {"nodes": [model_id]},
-            "column_name": pk_column,
-            "test_metadata": {
-                "name": "dbt_utils.at_least_one",
-                "namespace": "dbt_utils",
-                "kwargs": {
-                    "column_name": pk_column,
-                },
-            },
-        }
-
-    # dbt_expectations tests for date columns
-    for col_name in columns:
-        if "date" in col_name or col_name.endswith("_at"):
-            # expect_column_values_to_be_of_type
-            test_id = (
-                f"test.{project_name}.dbt_expectations_expect_column_to_exist_"
-                f"{model_name}_{col_name}"
+        tests.append(
+            make_test(
+                test_prefix,
+                "dbt_utils_at_least_one_" + model_name + "_" + pk_column,
+                depends_on_self,
+                pk_column,
+                "dbt_utils.at_least_one",
+                {"column_name": pk_column},
+                namespace="dbt_utils",
             )
-            tests[test_id] = {
-                "name": f"dbt_expectations_expect_column_to_exist_{model_name}_{col_name}",
-                "resource_type": "test",
-                "unique_id": test_id,
-                "depends_on": {"nodes": [model_id]},
-                "column_name": col_name,
-                "test_metadata": {
-                    "name": "dbt_expectations.expect_column_to_exist",
-                    "namespace": "dbt_expectations",
-                    "kwargs": {
-                        "column_name": col_name,
-                    },
-                },
-            }
-            break  # Only one per model
+        )
+
+    # dbt_expectations test for the first date column (only one per model)
+    tests.append(
+        make_test(
+            test_prefix,
+            "dbt_expectations_expect_column_to_exist_" + model_name + "_" + date_column,
+            depends_on_self,
+            date_column,
+            "dbt_expectations.expect_column_to_exist",
+            {"column_name": date_column},
+            namespace="dbt_expectations",
+        )
+    )
 
     # Custom SQL test for some models (row count check)
-    if model_name.startswith("mart_") and random.random() > 0.7:
-        test_id = f"test.{project_name}.{model_name}_row_count_check"
-        tests[test_id] = {
-            "name": f"{model_name}_row_count_check",
-            "resource_type": "test",
-            "unique_id": test_id,
-            "depends_on": {"nodes": [model_id]},
-            "test_metadata": {
-                "name": "custom_sql",
-                "kwargs": {
+    if row_count_check:
+        tests.append(
+            make_test(
+                test_prefix,
+                model_name + "_row_count_check",
+                depends_on_self,
+                None,
+                "custom_sql",
+                {
                     "sql": (
                         f"SELECT CASE WHEN COUNT(*) > 0 THEN 0 ELSE 1 END "
                         f"AS failures FROM {{{{ ref('{model_name}') }}}}"
                     ),
                     "description": "Ensures mart has at least one row",
                 },
-            },
-        }
+            )
+        )
 
     return tests
 
@@ -531,14 +694,16 @@ def generate_model(
     depends_on: list[str],
     tags: list[str],
     domain_config: dict,
-) -> tuple[dict, dict]:
-    """Generate a dbt model node and its tests."""
+    rng: random.Random,
+    row_count_check: bool = False,
+) -> tuple[dict, list[tuple[str, dict]]]:
+    """Generate a dbt model node and its ``(unique_id, node)`` test pairs."""
     schema = "staging" if layer == "staging" else "analytics"
     model_id = f"model.ecommerce.{name}"
 
     # Pick owner from domain config
-    owner_team = random.choice(domain_config["teams"])
-    owner_user = random.choice(domain_config["users"]) if domain_config["users"] else None
+    owner_team = rng.choice(domain_config["teams"])
+    owner_user = rng.choice(domain_config["users"]) if domain_config["users"] else None
 
     # Generate tessera meta for ownership
     tessera_meta = {
@@ -559,15 +724,16 @@ def generate_model(
         }
 
     # Add consumer declarations for some models
-    if layer == "mart" and random.random() > 0.5:
+    if layer == "mart" and rng.random() > 0.5:
         # Other teams might consume this mart
         other_teams = ["marketing-analytics", "finance-analytics", "product-analytics", "sales-ops"]
         other_teams = [t for t in other_teams if t != owner_team]
         if other_teams:
-            consumers = [{"team": random.choice(other_teams), "purpose": "Reporting"}]
+            consumers = [{"team": rng.choice(other_teams), "purpose": "Reporting"}]
             tessera_meta["consumers"] = consumers
 
-    columns = generate_columns(name, layer)
+    features = model_features(name)
+    pk_column, date_column, columns = generate_columns(name, layer, features)
 
     model = {
         "name": name,
@@ -587,7 +753,9 @@ def generate_model(
     }
 
     # Generate tests for this model
-    tests = generate_tests_for_model(name, model_id, columns, depends_on)
+    tests = generate_tests_for_model(
+        name, model_id, columns, pk_column, date_column, depends_on, features, row_count_check
+    )
 
     return model, tests
 
@@ -602,143 +770,131 @@ def generate_source(name: str, domain: str) -> dict:
         "unique_id": f"source.ecommerce.{name}",
         "source_name": domain,
         "description": f"Raw {name.replace('_', ' ')} data from {domain} source system",
-        "columns": {
-            "id": {"name": "id", "description": "Source record ID", "data_type": "integer"},
-            "data": {"name": "data", "description": "Raw JSON payload", "data_type": "object"},
-            "_loaded_at": {
-                "name": "_loaded_at",
-                "description": "Load timestamp",
-                "data_type": "timestamp",
-            },
-        },
+        "columns": SOURCE_COLUMNS,
     }
 
 
-def generate_manifest() -> dict:
-    """Generate a complete dbt manifest with tests."""
-    nodes = {}
-    sources = {}
+def pick(rng: random.Random, seq: list, k: int) -> list:
+    """Return up to ``k`` distinct random items of ``seq``.
 
-    # Generate sources first (raw data)
-    raw_sources = [
-        "raw_users",
-        "raw_events",
-        "raw_transactions",
-        "raw_products",
-        "raw_orders",
-        "raw_customers",
-        "raw_campaigns",
-        "raw_sessions",
-        "raw_pageviews",
-        "raw_clicks",
-        "raw_conversions",
-        "raw_accounts",
-        "raw_invoices",
-        "raw_payments",
-        "raw_subscriptions",
-        "raw_tickets",
+    Draws like ``rng.sample(seq, min(k, len(seq)))``, but handles the k <= 2
+    cases that almost every dependency draw here uses without sample()'s
+    general-purpose overhead.
+    """
+    n = len(seq)
+    k = min(k, n)
+    if k == 0:
+        return []
+    if k == 1:
+        return [seq[rng.randrange(n)]]
+    if k == 2:
+        i = rng.randrange(n)
+        j = rng.randrange(n - 1)
+        if j >= i:
+            j += 1
+        return [seq[i], seq[j]]
+    return rng.sample(seq, k)
+
+
+def build_domain(
+    domain: str, config: dict, raw_sources: list[str], seed: int, layer_counts: Counter
+) -> list[tuple[str, dict]]:
+    """Generate every model and test node for one domain, as ``(unique_id, node)`` pairs.
+
+    A domain only needs other domains' node IDs (which are fixed by name), not
+    their generated models, so each domain is built independently from its own
+    generator derived from ``seed`` and ``domain``. Each model generated is
+    counted under its layer in ``layer_counts``.
+    """
+    rng = random.Random(f"{seed}:{domain}")
+    node_pairs = []
+    names = MODEL_NAMES[config["prefix"]]
+    layer_ids = {
+        layer: [f"model.ecommerce.{name}" for name in layer_names]
+        for layer, layer_names in names.items()
+    }
+
+    def add(
+        name: str, layer: str, deps: list[str], tags: list[str], row_count_check: bool = False
+    ) -> None:
+        model, tests = generate_model(name, domain, layer, deps, tags, config, rng, row_count_check)
+        node_pairs.append((f"model.ecommerce.{name}", model))
+        node_pairs.extend(tests)
+        layer_counts[layer] += 1
+
+    # Staging models (depend on sources)
+    for name in names["staging"]:
+        source_deps = [f"source.ecommerce.{s}" for s in pick(rng, raw_sources, 2)]
+        add(name, "staging", source_deps, config["tags"] + ["staging"])
+
+    # Intermediate models (depend on staging)
+    staging = layer_ids["staging"]
+    for name in names["intermediate"]:
+        deps = pick(rng, staging, 2)
+        add(name, "intermediate", deps, config["tags"] + ["intermediate"])
+
+    # Dimension models (depend on staging + intermediate)
+    all_upstream = layer_ids["staging"] + layer_ids["intermediate"]
+    for name in names["dimension"]:
+        deps = pick(rng, all_upstream, 3)
+        add(name, "dimension", deps, config["tags"] + ["dimension"])
+
+    # Fact models (depend on dimensions + intermediate)
+    dims = layer_ids["dimension"]
+    ints = layer_ids["intermediate"]
+    for name in names["fact"]:
+        deps = pick(rng, dims, 2) + pick(rng, ints, 1)
+        add(name, "fact", deps, config["tags"] + ["fact"])
+
+    # Mart models (depend on facts + dimensions, can cross domains)
+    facts = layer_ids["fact"]
+
+    # Cross-domain dependencies for some marts: the first fact of other domains
+    other_domains = [d for d in DOMAINS if d != domain]
+    cross_domain_facts = [
+        f"model.ecommerce.{MODEL_NAMES[DOMAINS[other]['prefix']]['fact'][0]}"
+        for other in pick(rng, other_domains, 2)
     ]
 
-    for source_name in raw_sources:
-        domain = random.choice(list(DOMAINS.keys()))
-        source_id = f"source.ecommerce.{source_name}"
-        sources[source_id] = generate_source(source_name, domain)
+    # Decide up front which marts get a row count check, in one batch
+    row_count_checks = [rng.random() > 0.7 for _ in names["mart"]]
 
-    # Track model dependencies for each domain
-    domain_models = {
-        d: {"staging": [], "intermediate": [], "dimension": [], "fact": [], "mart": []}
-        for d in DOMAINS
-    }
+    for name, row_count_check in zip(names["mart"], row_count_checks):
+        deps = pick(rng, facts, 2) + pick(rng, dims, 1)
 
-    # Generate staging models (depend on sources)
-    for domain, config in DOMAINS.items():
-        for template in STAGING_MODELS:
-            name = template.format(domain=config["prefix"])
-            source_deps = [
-                f"source.ecommerce.{s}"
-                for s in random.sample(raw_sources, k=min(2, len(raw_sources)))
-            ]
-            tags = config["tags"] + ["staging"]
-
-            model, tests = generate_model(name, domain, "staging", source_deps, tags, config)
-            node_id = f"model.ecommerce.{name}"
-            nodes[node_id] = model
-            nodes.update(tests)
-            domain_models[domain]["staging"].append(node_id)
-
-    # Generate intermediate models (depend on staging)
-    for domain, config in DOMAINS.items():
-        staging = domain_models[domain]["staging"]
-        for template in INTERMEDIATE_MODELS:
-            name = template.format(domain=config["prefix"])
-            deps = random.sample(staging, k=min(2, len(staging))) if staging else []
-            tags = config["tags"] + ["intermediate"]
-
-            model, tests = generate_model(name, domain, "intermediate", deps, tags, config)
-            node_id = f"model.ecommerce.{name}"
-            nodes[node_id] = model
-            nodes.update(tests)
-            domain_models[domain]["intermediate"].append(node_id)
-
-    # Generate dimension models (depend on staging + intermediate)
-    for domain, config in DOMAINS.items():
-        all_upstream = domain_models[domain]["staging"] + domain_models[domain]["intermediate"]
-        for template in DIMENSION_MODELS:
-            name = template.format(domain=config["prefix"])
-            deps = random.sample(all_upstream, k=min(3, len(all_upstream))) if all_upstream else []
-            tags = config["tags"] + ["dimension"]
-
-            model, tests = generate_model(name, domain, "dimension", deps, tags, config)
-            node_id = f"model.ecommerce.{name}"
-            nodes[node_id] = model
-            nodes.update(tests)
-            domain_models[domain]["dimension"].append(node_id)
-
-    # Generate fact models (depend on dimensions + intermediate)
-    for domain, config in DOMAINS.items():
-        dims = domain_models[domain]["dimension"]
-        ints = domain_models[domain]["intermediate"]
-        for template in FACT_MODELS:
-            name = template.format(domain=config["prefix"])
-            deps = random.sample(dims, k=min(2, len(dims))) + random.sample(
-                ints, k=min(1, len(ints))
-            )
-            tags = config["tags"] + ["fact"]
+        # Some marts have cross-domain deps
+        if rng.random() > 0.5 and cross_domain_facts:
+            deps.append(rng.choice(cross_domain_facts))
 
-            model, tests = generate_model(name, domain, "fact", deps, tags, config)
-            node_id = f"model.ecommerce.{name}"
-            nodes[node_id] = model
-            nodes.update(tests)
-            domain_models[domain]["fact"].append(node_id)
+        add(name, "mart", deps, config["tags"] + ["mart", "business-critical"], row_count_check)
 
-    # Generate mart models (depend on facts + dimensions, can cross domains)
-    for domain, config in DOMAINS.items():
-        facts = domain_models[domain]["fact"]
-        dims = domain_models[domain]["dimension"]
-
-        # Cross-domain dependencies for some marts
-        other_domains = [d for d in DOMAINS if d != domain]
-        cross_domain_facts = []
-        for other in random.sample(other_domains, k=min(2, len(other_domains))):
-            cross_domain_facts.extend(domain_models[other]["fact"][:1])
-
-        for template in MART_MODELS:
-            name = template.format(domain=config["prefix"])
-            deps = random.sample(facts, k=min(2, len(facts))) + random.sample(
-                dims, k=min(1, len(dims))
-            )
+    return node_pairs
 
-            # Some marts have cross-domain deps
-            if random.random() > 0.5 and cross_domain_facts:
-                deps.append(random.choice(cross_domain_facts))
 
-            tags = config["tags"] + ["mart", "business-critical"]
+def generate_manifest(seed: int = 0) -> tuple[dict, Counter]:
+    """Generate a complete dbt manifest with tests.
 
-            model, tests = generate_model(name, domain, "mart", deps, tags, config)
-            node_id = f"model.ecommerce.{name}"
-            nodes[node_id] = model
-            nodes.update(tests)
-            domain_models[domain]["mart"].append(node_id)
+    All randomness is derived from ``seed``, so the same seed always produces
+    the same manifest. Returns the manifest and the number of models generated
+    per layer.
+    """
+    rng = random.Random(seed)
+    # Collect (unique_id, node) pairs and build the nodes dict once at the end
+    node_pairs = []
+    sources = {}
+    layer_counts = Counter()
+
+    # Generate sources first (raw data)
+    for source_name in RAW_SOURCES:
+        domain = rng.choice(list(DOMAINS.keys()))
+        source_id = f"source.ecommerce.{source_name}"
+        sources[source_id] = generate_source(source_name, domain)
+
+    # Domains are independent of each other. Generating all of them takes a
+    # few milliseconds, far less than starting a process pool, so they're
+    # built in-process one after another.
+    for domain, config in DOMAINS.items():
+        node_pairs.extend(build_domain(domain, config, RAW_SOURCES, seed, layer_counts))
 
     # Add some shared/utility models
     shared_config = {
@@ -761,47 +917,56 @@ def generate_manifest() -> dict:
     ]
 
     for name, deps, tags in shared_models:
-        model, tests = generate_model(name, "shared", "utility", deps, tags, shared_config)
-        node_id = f"model.ecommerce.{name}"
-        nodes[node_id] = model
-        nodes.update(tests)
+        model, tests = generate_model(name, "shared", "utility", deps, tags, shared_config, rng)
+        node_pairs.append((f"model.ecommerce.{name}", model))
+        node_pairs.extend(tests)
+        layer_counts["utility"] += 1
 
-    return {
+    manifest = {
         "metadata": {
             "dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v11.json",
             "generated_at": "2025-01-01T00:00:00Z",
             "project_name": "ecommerce",
         },
-        "nodes": nodes,
+        "nodes": dict(node_pairs),
         "sources": sources,
     }
+    return manifest, layer_counts
 
 
 def main():
-    manifest = generate_manifest()
-
-    # Count models by layer and tests
-    layers = {"staging": 0, "intermediate": 0, "dimension": 0, "fact": 0, "mart": 0, "utility": 0}
-    test_count = 0
-    for node_id, node in manifest["nodes"].items():
-        if node.get("resource_type") == "test":
-            test_count += 1
-        else:
-            for tag in node.get("tags", []):
-                if tag in layers:
-                    layers[tag] += 1
-                    break
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--pretty", action="store_true", help="Indent the manifest JSON for human reading"
+    )
+    args = parser.parse_args()
+
+    manifest, layer_counts = generate_manifest()
+
+    # Every node that isn't a model is a test
+    model_count = sum(layer_counts.values())
+    test_count = len(manifest["nodes"]) - model_count
 
     print("Generated manifest with:")
     print(f"  Sources: {len(manifest['sources'])}")
-    print(f"  Models: {sum(layers.values())}")
-    for layer, count in layers.items():
-        print(f"    {layer}: {count}")
+    print(f"  Models: {model_count}")
+    for layer in LAYERS:
+        print(f"    {layer}: {layer_counts[layer]}")
     print(f"  Tests: {test_count}")
 
     # Write manifest
     output_path = Path(__file__).parent.parent / "examples" / "data" / "manifest.json"
-    output_path.write_text(json.dumps(manifest, indent=2))
+    # The manifest is machine-read, so write it compact unless asked otherwise
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if args.pretty else 0
+        output_path.write_bytes(orjson.dumps(manifest, option=option))
+    else:
+        # Stream straight into the file rather than building the whole document in memory first
+        with output_path.open("w") as f:
+            if args.pretty:
+                json.dump(manifest, f, indent=2)
+            else:
+                json.dump(manifest, f, separators=(",", ":"))
     print(f"\nWritten to {output_path}")
 
 
@@ -9,18 +9,50 @@ Features:
 - Creates asset dependencies in the database
 """
 
-import json
+import asyncio
+import functools
 import os
+import re
 import sys
-import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import httpx
+from common import HTTP2, dumps, gather_bounded, loads, retry
+
+# ijson parses the manifest incrementally, so a large manifest is never held in
+# memory as one string alongside its parsed form. It's optional; without it the
+# manifest is parsed with the stdlib json module.
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 API_URL = os.environ.get("API_URL", "http://localhost:8000")
 MANIFEST_PATH = Path("/app/examples/data/manifest.json")
 
+# One pooled keep-alive async client for every request, since they all go to the
+# same API host. Closed at the end of main(). The transport retries failed
+# connection attempts with exponential backoff.
+CLIENT = httpx.AsyncClient(
+    base_url=API_URL,
+    timeout=10,
+    transport=httpx.AsyncHTTPTransport(
+        retries=3,
+        http2=HTTP2,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    ),
+)
+
+# Most items the API's bulk endpoints accept per request
+BULK_BATCH_SIZE = 100
+
+# Largest page the API's list endpoints return
+PAGE_SIZE = 100
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 # dbt type to JSON Schema type mapping
 TYPE_MAPPING = {
     "string": "string",
@@ -72,17 +104,45 @@ DOMAIN_TEAMS = {
     "support": "support-team",
 }
 
+# Finds every domain occurring in a string in one scan. The lookahead reports
+# overlapping matches too, so the highest-priority (first listed) domain present
+# can always be picked, exactly as checking each domain in turn would.
+DOMAIN_PATTERN = re.compile("(?=(" + "|".join(re.escape(domain) for domain in DOMAIN_TEAMS) + "))")
+DOMAIN_PRIORITY = {domain: priority for priority, domain in enumerate(DOMAIN_TEAMS)}
+
+# Data layers with guarantee presets, in order of precedence when a path
+# mentions more than one
+LAYERS = ("mart", "intermediate", "staging")
+LAYER_PATTERN = re.compile("(?=(" + "|".join(LAYERS) + "))")
+
+
+@functools.lru_cache(maxsize=512)
+def json_schema_type(data_type: str | None) -> str:
+    """Map a dbt data type such as ``VARCHAR(255)`` to a JSON Schema type.
+
+    Manifests repeat a handful of type strings across every column, so results
+    are cached.
+    """
+    base_type = (data_type or "string").lower().split("(")[0].strip()
+    return TYPE_MAPPING.get(base_type, "string")
+
+
+@functools.lru_cache(maxsize=4096)
+def column_metadata_entry(description: str, data_type: str | None) -> dict[str, Any]:
+    """Build the asset metadata entry for one column.
+
+    The same columns recur from staging through to mart models, so entries are
+    cached and shared between assets. Callers must not modify them.
+    """
+    return {"description": description, "data_type": data_type}
+
 
 def dbt_columns_to_json_schema(columns: dict[str, Any]) -> dict[str, Any]:
     """Convert dbt column definitions to JSON Schema."""
     properties: dict[str, Any] = {}
 
     for col_name, col_info in columns.items():
-        data_type = (col_info.get("data_type") or "string").lower()
-        base_type = data_type.split("(")[0].strip()
-
-        json_type = TYPE_MAPPING.get(base_type, "string")
-        prop: dict[str, Any] = {"type": json_type}
+        prop: dict[str, Any] = {"type": json_schema_type(col_info.get("data_type"))}
 
         if col_info.get("description"):
             prop["description"] = col_info["description"]
@@ -96,44 +156,71 @@ def dbt_columns_to_json_schema(columns: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def wait_for_api(max_attempts: int = 30) -> bool:
-    """Wait for API to be ready."""
-    for attempt in range(max_attempts):
-        try:
-            resp = httpx.get(f"{API_URL}/health", timeout=5)
-            if resp.status_code == 200:
-                print("API is ready!")
-                return True
-        except Exception:
-            pass
-        print(f"Attempt {attempt + 1}/{max_attempts} - API not ready yet...")
-        time.sleep(2)
+@retry(on=(httpx.ReadError, httpx.RemoteProtocolError))
+async def api_get(url: str, **kwargs: Any) -> httpx.Response:
+    """GET from the API, retrying dropped connections and server errors."""
+    return await CLIENT.get(url, **kwargs)
+
+
+async def post_json(url: str, payload: object, **kwargs: Any) -> httpx.Response:
+    """POST a JSON body encoded with the module's serializer.
+
+    Writes are not retried once sent: if a create went through but its response
+    was lost, a retry would get 409 and the new resource's ID would never be
+    recorded. Failed connection attempts are still retried by the transport.
+    """
+    return await CLIENT.post(url, content=dumps(payload), headers=JSON_HEADERS, **kwargs)
+
+
+async def wait_for_api(max_attempts: int = 30) -> bool:
+    """Wait for API to be ready.
+
+    Polls with exponential backoff from 50ms up to 2s, so an API that comes up
+    quickly is picked up almost immediately. The probe uses its own client:
+    CLIENT's transport retries refused connections with its own backoff, which
+    would hold each poll for 1.5s while the API is down.
+    """
+    async with httpx.AsyncClient(base_url=API_URL, timeout=1) as probe:
+        for attempt in range(max_attempts):
+            try:
+                resp = await probe.get("/health")
+                if resp.status_code == 200:
+                    print("API is ready!")
+                    return True
+            except Exception:
+                pass
+            print(f"Attempt {attempt + 1}/{max_attempts} - API not ready yet...")
+            await asyncio.sleep(min(2.0, 0.05 * 2**attempt))
     return False
 
 
-def get_or_create_team(name: str) -> str | None:
-    """Get or create a team by name, return team ID."""
+async def get_or_create_team(name: str, existing_teams: dict[str, str]) -> str | None:
+    """Get or create a team by name, return team ID.
+
+    ``existing_teams`` maps the names of teams fetched up front to their IDs.
+    """
+    if name in existing_teams:
+        return existing_teams[name]
+
     # Try to create team
     try:
-        resp = httpx.post(
-            f"{API_URL}/api/v1/teams",
-            json={"name": name},
-            timeout=10,
+        resp = await post_json(
+            "/api/v1/teams",
+            payload={"name": name},
         )
         if resp.status_code == 201:
-            return resp.json()["id"]
+            return loads(resp.content)["id"]
     except Exception:
         pass
 
     # Team might already exist, try to find it
     try:
-        resp = httpx.get(
-            f"{API_URL}/api/v1/teams",
+        resp = await api_get(
+            "/api/v1/teams",
             params={"name": name},
-            timeout=10,
         )
         if resp.status_code == 200:
-            results = resp.json().get("results", [])
+            results = loads(resp.content).get("results", [])
             for team in results:
                 if team.get("name") == name:
                     return team["id"]
@@ -143,42 +230,35 @@ def get_or_create_team(name: str) -> str | None:
     return None
 
 
-def get_or_create_asset(
-    fqn: str, team_id: str, metadata: dict[str, Any]
-) -> tuple[str | None, bool]:
-    """Get existing asset or create new one. Returns (asset_id, was_created)."""
-    # First try to get existing asset
+async def create_asset_batch(batch: list[dict[str, Any]]) -> list[tuple[str | None, bool]]:
+    """Create up to BULK_BATCH_SIZE assets in one bulk request.
+
+    Assets that already exist are skipped and returned as found. Returns
+    (asset_id, was_created) for each asset, with asset_id None on failure.
+    """
+    outcomes: list[tuple[str | None, bool]] = [(None, False)] * len(batch)
     try:
-        resp = httpx.get(
-            f"{API_URL}/api/v1/assets",
-            params={"fqn": fqn},
-            timeout=10,
+        resp = await post_json(
+            "/api/v1/bulk/assets",
+            payload={"assets": batch, "skip_duplicates": True},
         )
         if resp.status_code == 200:
-            results = resp.json().get("results", [])
-            for asset in results:
-                if asset.get("fqn") == fqn:
-                    return asset["id"], False
+            for result in loads(resp.content).get("results", []):
+                if result.get("success"):
+                    skipped = result.get("details", {}).get("skipped", False)
+                    outcomes[result["index"]] = (result["id"], not skipped)
     except Exception:
         pass
+    return outcomes
 
-    # Create new asset
-    try:
-        resp = httpx.post(
-            f"{API_URL}/api/v1/assets",
-            json={
-                "fqn": fqn,
-                "owner_team_id": team_id,
-                "metadata": metadata,
-            },
-            timeout=10,
-        )
-        if resp.status_code in (200, 201):
-            return resp.json()["id"], True
-    except Exception:
-        pass
 
-    return None, False
+async def bulk_create_assets(assets: list[dict[str, Any]]) -> list[tuple[str | None, bool]]:
+    """Create assets in bulk batches. Returns (asset_id, was_created) per asset, in order."""
+    batches = [
+        assets[start : start + BULK_BATCH_SIZE] for start in range(0, len(assets), BULK_BATCH_SIZE)
+    ]
+    results = await gather_bounded(create_asset_batch(batch) for batch in batches)
+    return [outcome for batch_outcomes in results for outcome in batch_outcomes]
 
 
 def get_guarantees_for_layer(layer: str) -> dict[str, Any] | None:
@@ -224,7 +304,7 @@ def get_guarantees_for_layer(layer: str) -> dict[str, Any] | None:
     return guarantees.get(layer)
 
 
-def publish_contract(
+async def publish_contract(
     asset_id: str,
     team_id: str,
     schema_def: dict[str, Any],
@@ -241,14 +321,13 @@ def publish_contract(
         if guarantees:
             payload["guarantees"] = guarantees
 
-        resp = httpx.post(
-            f"{API_URL}/api/v1/assets/{asset_id}/contracts",
+        resp = await post_json(
+            f"/api/v1/assets/{asset_id}/contracts",
             params={"published_by": team_id},
-            json=payload,
-            timeout=10,
+            payload=payload,
         )
         if resp.status_code in (200, 201):
-            result = resp.json()
+            result = loads(resp.content)
             contract_id = result.get("contract", {}).get("id") or result.get("id")
             return True, "created", contract_id
         elif resp.status_code == 409:
@@ -259,16 +338,17 @@ def publish_contract(
         return False, f"exception: {e}", None
 
 
-def get_active_contract(asset_id: str) -> str | None:
+async def get_active_contract(asset_id: str) -> str | None:
     """Get the active contract ID for an asset."""
     try:
-        resp = httpx.get(
-            f"{API_URL}/api/v1/assets/{asset_id}/contracts",
-            params={"status": "active"},
-            timeout=10,
+        # /assets/{id}/contracts has no status filter, so ask the contracts
+        # listing for the single active one
+        resp = await api_get(
+            "/api/v1/contracts",
+            params={"asset_id": asset_id, "status": "active", "limit": 1},
         )
         if resp.status_code == 200:
-            results = resp.json().get("results", [])
+            results = loads(resp.content).get("results", [])
             if results:
                 return results[0]["id"]
     except Exception:
@@ -276,21 +356,56 @@ def get_active_contract(asset_id: str) -> str | None:
     return None
 
 
-def register_consumer(contract_id: str, consumer_team_id: str) -> bool:
+async def register_consumer(contract_id: str, consumer_team_id: str) -> bool:
     """Register a team as consumer of a contract."""
     try:
-        resp = httpx.post(
-            f"{API_URL}/api/v1/registrations",
+        resp = await post_json(
+            "/api/v1/registrations",
             params={"contract_id": contract_id},
-            json={"consumer_team_id": consumer_team_id},
-            timeout=10,
+            payload={"consumer_team_id": consumer_team_id},
         )
         return resp.status_code in (200, 201, 409)  # 409 = already registered
     except Exception:
         return False
 
 
-def create_breaking_change_proposals(
+async def publish_columns_contract(
+    asset_id: str,
+    team_id: str,
+    columns: dict[str, Any],
+    active_contracts: dict[str, str],
+    guarantees: dict[str, Any] | None = None,
+) -> bool:
+    """Publish a contract built from an asset's dbt columns. Returns success.
+
+    A newly published contract is recorded in ``active_contracts`` (asset ID to
+    contract ID).
+    """
+    schema_def = dbt_columns_to_json_schema(columns)
+    success, _, contract_id = await publish_contract(
+        asset_id, team_id, schema_def, guarantees=guarantees
+    )
+    if contract_id:
+        active_contracts[asset_id] = contract_id
+    return success
+
+
+async def register_dependency(
+    dep_asset_id: str, consumer_team_id: str, active_contracts: dict[str, str]
+) -> bool | None:
+    """Register a team as consumer of a dependency's active contract.
+
+    ``active_contracts`` maps asset IDs to their active contract IDs. Returns
+    whether the registration succeeded, or None if the dependency has no
+    active contract.
+    """
+    contract_id = active_contracts.get(dep_asset_id)
+    if not contract_id:
+        return None
+    return await register_consumer(contract_id, consumer_team_id)
+
+
+async def create_breaking_change_proposals(
     fqn_to_asset_id: dict[str, str],
     fqn_to_team_id: dict[str, str],
 ) -> int:
@@ -307,15 +422,14 @@ def create_breaking_change_proposals(
 
     # Find contracts that have columns (properties)
     try:
-        resp = httpx.get(
-            f"{API_URL}/api/v1/contracts",
+        resp = await api_get(
+            "/api/v1/contracts",
             params={"limit": 100},
-            timeout=10,
         )
         if resp.status_code != 200:
             print(f"    Failed to get contracts: {resp.status_code}")
             return 0
-        contracts = resp.json().get("results", [])
+        contracts = loads(resp.content).get("results", [])
         print(f"    Found {len(contracts)} contracts")
     except Exception as e:
         print(f"    Exception getting contracts: {e}")
@@ -337,8 +451,8 @@ def create_breaking_change_proposals(
 
     # Get available teams for creating cross-team registrations
     try:
-        resp = httpx.get(f"{API_URL}/api/v1/teams", params={"limit": 20}, timeout=10)
-        teams = resp.json().get("results", []) if resp.status_code == 200 else []
+        resp = await api_get("/api/v1/teams", params={"limit": 20})
+        teams = loads(resp.content).get("results", []) if resp.status_code == 200 else []
         team_ids = [t["id"] for t in teams]
     except Exception:
         team_ids = []
@@ -362,10 +476,10 @@ def create_breaking_change_proposals(
                 continue
 
             # Get asset details
-            resp = httpx.get(f"{API_URL}/api/v1/assets/{asset_id}", timeout=10)
+            resp = await api_get(f"/api/v1/assets/{asset_id}")
             if resp.status_code != 200:
                 continue
-            asset = resp.json()
+            asset = loads(resp.content)
             owner_team_id = asset.get("owner_team_id")
             fqn = asset.get("fqn", "")
 
@@ -383,11 +497,10 @@ def create_breaking_change_proposals(
                 continue
 
             # Register the consumer
-            resp = httpx.post(
-                f"{API_URL}/api/v1/registrations",
+            resp = await post_json(
+                "/api/v1/registrations",
                 params={"contract_id": contract_id},
-                json={"consumer_team_id": consumer_team},
-                timeout=10,
+                payload={"consumer_team_id": consumer_team},
             )
             if resp.status_code not in (200, 201, 409):
                 print(f"      Failed to register consumer: {resp.status_code}")
@@ -396,8 +509,9 @@ def create_breaking_change_proposals(
 
             # Create a breaking change (remove a column)
             properties = current_schema.get("properties", {})
-            first_col = list(properties.keys())[0]
-            new_properties = {k: v for k, v in properties.items() if k != first_col}
+            first_col = next(iter(properties))
+            new_properties = dict(properties)
+            del new_properties[first_col]
             new_schema = {
                 "type": "object",
                 "properties": new_properties,
@@ -407,18 +521,17 @@ def create_breaking_change_proposals(
             print(f"      Publishing breaking change (removing '{first_col}')")
 
             # Publish with breaking change
-            resp = httpx.post(
-                f"{API_URL}/api/v1/assets/{asset_id}/contracts",
+            resp = await post_json(
+                f"/api/v1/assets/{asset_id}/contracts",
                 params={"published_by": owner_team_id},
-                json={
+                payload={
                     "version": "2.0.0",
                     "schema": new_schema,
                     "compatibility_mode": "backward",
                 },
-                timeout=10,
             )
             if resp.status_code in (200, 201):
-                result = resp.json()
+                result = loads(resp.content)
                 action = result.get("action")
                 print(f"      Result: {action}")
                 if action == "proposal_created":
@@ -435,39 +548,74 @@ def create_breaking_change_proposals(
     return proposals_created
 
 
+def match_domain_team(text: str) -> str | None:
+    """Return the team of the first DOMAIN_TEAMS domain that occurs in ``text``."""
+    found = DOMAIN_PATTERN.findall(text.lower())
+    if not found:
+        return None
+    return DOMAIN_TEAMS[min(found, key=DOMAIN_PRIORITY.__getitem__)]
+
+
+def detect_layer(path: str) -> str | None:
+    """Return the data layer named in a lowercased node path, if any."""
+    found = LAYER_PATTERN.findall(path)
+    if not found:
+        return None
+    return min(found, key=LAYERS.index)
+
+
 def infer_team_from_node(node: dict[str, Any]) -> str:
     """Infer the owning team from a node's path, tags, or schema."""
-    # Try to get team from path
-    path = node.get("path", "")
-    for domain, team in DOMAIN_TEAMS.items():
-        if domain in path.lower():
+    # Try the path first, then the schema, then each tag
+    for text in (node.get("path", ""), node.get("schema", ""), *node.get("tags", [])):
+        team = match_domain_team(text)
+        if team:
             return team
 
-    # Try to get from schema
-    schema = node.get("schema", "").lower()
-    for domain, team in DOMAIN_TEAMS.items():
-        if domain in schema:
-            return team
-
-    # Try to get from tags
-    tags = node.get("tags", [])
-    for tag in tags:
-        tag_lower = tag.lower()
-        for domain, team in DOMAIN_TEAMS.items():
-            if domain in tag_lower:
-                return team
-
     # Default team
     return "data-platform"
 
 
-def import_manifest() -> bool:
-    """Import the dbt manifest with full data."""
+def load_manifest(path: Path) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Load the nodes and sources of a dbt manifest."""
+    if ijson is None:
+        manifest = loads(path.read_bytes())
+        return manifest.get("nodes", {}), manifest.get("sources", {})
+
+    # Stream each section in its own pass; the rest of the manifest is skipped
+    sections = []
+    for prefix in ("nodes", "sources"):
+        with path.open("rb") as f:
+            sections.append(dict(ijson.kvitems(f, prefix, use_float=True)))
+    nodes, sources = sections
+    return nodes, sources
+
+
+def iter_records(
+    nodes: dict[str, Any], sources: dict[str, Any]
+) -> Iterator[tuple[str, str, dict[str, Any]]]:
+    """Yield ``(kind, unique_id, record)`` for every model-like node and source.
+
+    ``kind`` is ``"model"`` for models, seeds, and snapshots and ``"source"``
+    for sources; other node types (tests, macros, ...) are skipped.
+    """
+    for node_id, node in nodes.items():
+        if node.get("resource_type") in ("model", "seed", "snapshot"):
+            yield "model", node_id, node
+    for source_id, source in sources.items():
+        yield "source", source_id, source
+
+
+async def import_manifest() -> tuple[bool, dict[str, str]]:
+    """Import the dbt manifest with full data.
+
+    Returns whether the import succeeded and the IDs of all known teams by name.
+    """
     if not MANIFEST_PATH.exists():
         print(f"Manifest not found at {MANIFEST_PATH}")
-        return False
+        return False, {}
 
-    manifest = json.loads(MANIFEST_PATH.read_text())
+    nodes, sources = load_manifest(MANIFEST_PATH)
 
     # Stats
     teams_created = set()
@@ -479,33 +627,23 @@ def import_manifest() -> bool:
     # Build lookups
     node_id_to_fqn: dict[str, str] = {}
     node_id_to_team: dict[str, str] = {}
+    node_id_to_layer: dict[str, str | None] = {}
     fqn_to_asset_id: dict[str, str] = {}
     fqn_to_team_id: dict[str, str] = {}
 
-    nodes = manifest.get("nodes", {})
-    sources = manifest.get("sources", {})
-
     # First pass: collect FQNs and infer teams
     print("\n[Phase 1] Analyzing manifest structure...")
 
-    for node_id, node in nodes.items():
-        resource_type = node.get("resource_type")
-        if resource_type not in ("model", "seed", "snapshot"):
-            continue
-        database = node.get("database", "")
-        schema = node.get("schema", "")
-        name = node.get("name", "")
-        fqn = f"{database}.{schema}.{name}".lower()
-        node_id_to_fqn[node_id] = fqn
-        node_id_to_team[node_id] = infer_team_from_node(node)
-
-    for source_id, source in sources.items():
-        database = source.get("database", "")
-        schema = source.get("schema", "")
-        name = source.get("name", "")
-        fqn = f"{database}.{schema}.{name}".lower()
-        node_id_to_fqn[source_id] = fqn
-        node_id_to_team[source_id] = "data-engineering"  # Sources owned by data eng
+    for kind, record_id, record in iter_records(nodes, sources):
+        database = record.get("database", "")
+        schema = record.get("schema", "")
+        name = record.get("name", "")
+        node_id_to_fqn[record_id] = f"{database}.{schema}.{name}".lower()
+        if kind == "source":
+            node_id_to_team[record_id] = "data-engineering"  # Sources owned by data eng
+        else:
+            node_id_to_team[record_id] = infer_team_from_node(record)
+            node_id_to_layer[record_id] = detect_layer(record.get("path", "").lower())
 
     print(f"  Found {len(nodes)} nodes and {len(sources)} sources")
 
@@ -513,12 +651,27 @@ def import_manifest() -> bool:
     unique_teams = set(node_id_to_team.values())
     print(f"  Inferred {len(unique_teams)} teams: {', '.join(sorted(unique_teams))}")
 
+    # Fetch what already exists once, so each entity below is a dict lookup
+    # instead of its own GET
+    teams, assets, contracts = await asyncio.gather(
+        get_all("/api/v1/teams"),
+        get_all("/api/v1/assets"),
+        get_all("/api/v1/contracts", {"status": "active"}),
+    )
+    existing_teams = {team["name"]: team["id"] for team in teams}
+    existing_assets = {asset["fqn"]: asset["id"] for asset in assets}
+    active_contracts: dict[str, str] = {}
+    for contract in contracts:
+        # Newest first, so keep the first contract seen per asset
+        active_contracts.setdefault(contract["asset_id"], contract["id"])
+
     # Create teams
     print("\n[Phase 2] Creating teams...")
     team_name_to_id: dict[str, str] = {}
 
-    for team_name in unique_teams:
-        team_id = get_or_create_team(team_name)
+    team_names = sorted(unique_teams)
+    team_ids = await gather_bounded(get_or_create_team(name, existing_teams) for name in team_names)
+    for team_name, team_id in zip(team_names, team_ids):
         if team_id:
             team_name_to_id[team_name] = team_id
             teams_created.add(team_name)
@@ -528,107 +681,89 @@ def import_manifest() -> bool:
 
     # Import assets
     print("\n[Phase 3] Importing assets...")
-
-    # Process nodes (models)
-    for node_id, node in nodes.items():
-        resource_type = node.get("resource_type")
-        if resource_type not in ("model", "seed", "snapshot"):
-            continue
-
-        fqn = node_id_to_fqn[node_id]
-        team_name = node_id_to_team[node_id]
+    # (fqn, team_id, metadata, columns, guarantees) of every asset to import
+    pending_assets: list[
+        tuple[str, str, dict[str, Any], dict[str, Any], dict[str, Any] | None]
+    ] = []
+    # (consumer team_id, FQNs of the assets it depends on) of every model
+    model_dependencies: list[tuple[str, list[str]]] = []
+
+    for kind, record_id, record in iter_records(nodes, sources):
+        fqn = node_id_to_fqn[record_id]
+        team_name = node_id_to_team[record_id]
         team_id = team_name_to_id.get(team_name)
 
         if not team_id:
             continue
 
-        columns = node.get("columns", {})
-        depends_on = node.get("depends_on", {}).get("nodes", [])
-
-        metadata = {
-            "dbt_node_id": node_id,
-            "resource_type": resource_type,
-            "description": node.get("description", ""),
-            "tags": node.get("tags", []),
-            "dbt_fqn": node.get("fqn", []),
-            "path": node.get("path", ""),
-            "columns": {
-                col_name: {
-                    "description": col_info.get("description", ""),
-                    "data_type": col_info.get("data_type"),
-                }
-                for col_name, col_info in columns.items()
-            },
-            "depends_on": [node_id_to_fqn.get(dep, dep) for dep in depends_on],
+        columns = record.get("columns", {})
+        column_metadata = {
+            col_name: column_metadata_entry(
+                col_info.get("description", ""), col_info.get("data_type")
+            )
+            for col_name, col_info in columns.items()
         }
 
-        asset_id, was_created = get_or_create_asset(fqn, team_id, metadata)
-        if asset_id:
-            fqn_to_asset_id[fqn] = asset_id
-            fqn_to_team_id[fqn] = team_id
-            if was_created:
-                assets_created += 1
-            else:
-                assets_found += 1
-
-            # Publish contract if columns defined
-            if columns:
-                schema_def = dbt_columns_to_json_schema(columns)
-                # Determine layer from path for guarantees
-                path = node.get("path", "").lower()
-                layer = None
-                if "mart" in path:
-                    layer = "mart"
-                elif "intermediate" in path:
-                    layer = "intermediate"
-                elif "staging" in path:
-                    layer = "staging"
-                guarantees = get_guarantees_for_layer(layer) if layer else None
-                success, msg, contract_id = publish_contract(
-                    asset_id, team_id, schema_def, guarantees=guarantees
-                )
-                if success:
-                    contracts_created += 1
-
-    # Process sources
-    for source_id, source in sources.items():
-        fqn = node_id_to_fqn[source_id]
-        team_name = node_id_to_team[source_id]
-        team_id = team_name_to_id.get(team_name)
-
-        if not team_id:
+        if kind == "source":
+            metadata = {
+                "dbt_source_id": record_id,
+                "resource_type": "source",
+                "source_name": record.get("source_name", ""),
+                "description": record.get("description", ""),
+                "columns": column_metadata,
+            }
+            guarantees = None
+        else:
+            depends_on = record.get("depends_on", {}).get("nodes", [])
+            metadata = {
+                "dbt_node_id": record_id,
+                "resource_type": record.get("resource_type"),
+                "description": record.get("description", ""),
+                "tags": record.get("tags", []),
+                "dbt_fqn": record.get("fqn", []),
+                "path": record.get("path", ""),
+                "columns": column_metadata,
+                "depends_on": [node_id_to_fqn.get(dep, dep) for dep in depends_on],
+            }
+            model_dependencies.append(
+                (team_id, [node_id_to_fqn[dep] for dep in depends_on if dep in node_id_to_fqn])
+            )
+            # Layer (from the path, see Phase 1) decides the guarantees
+            layer = node_id_to_layer[record_id]
+            guarantees = get_guarantees_for_layer(layer) if layer else None
+
+        pending_assets.append((fqn, team_id, metadata, columns, guarantees))
+
+    # Create all missing assets through the bulk endpoint
+    new_assets = [
+        {"fqn": fqn, "owner_team_id": team_id, "metadata": metadata}
+        for fqn, team_id, metadata, _, _ in pending_assets
+        if fqn not in existing_assets
+    ]
+    assets_found = len(pending_assets) - len(new_assets)
+    for asset, (asset_id, was_created) in zip(new_assets, await bulk_create_assets(new_assets)):
+        if not asset_id:
             continue
+        existing_assets[asset["fqn"]] = asset_id
+        if was_created:
+            assets_created += 1
+        else:
+            assets_found += 1
 
-        columns = source.get("columns", {})
-
-        metadata = {
-            "dbt_source_id": source_id,
-            "resource_type": "source",
-            "source_name": source.get("source_name", ""),
-            "description": source.get("description", ""),
-            "columns": {
-                col_name: {
-                    "description": col_info.get("description", ""),
-                    "data_type": col_info.get("data_type"),
-                }
-                for col_name, col_info in columns.items()
-            },
-        }
-
-        asset_id, was_created = get_or_create_asset(fqn, team_id, metadata)
-        if asset_id:
-            fqn_to_asset_id[fqn] = asset_id
-            fqn_to_team_id[fqn] = team_id
-            if was_created:
-                assets_created += 1
-            else:
-                assets_found += 1
-
-            if columns:
-                schema_def = dbt_columns_to_json_schema(columns)
-                success, msg, contract_id = publish_contract(asset_id, team_id, schema_def)
-                if success:
-                    contracts_created += 1
+    # There's no bulk contract endpoint, so publish contracts concurrently
+    pending_contracts = []
+    for fqn, team_id, _, columns, guarantees in pending_assets:
+        asset_id = existing_assets.get(fqn)
+        if not asset_id:
+            continue
+        fqn_to_asset_id[fqn] = asset_id
+        fqn_to_team_id[fqn] = team_id
+        # Publish contract if columns defined
+        if columns:
+            pending_contracts.append(
+                publish_columns_contract(asset_id, team_id, columns, active_contracts, guarantees)
+            )
+    contracts_created = sum(await gather_bounded(pending_contracts))
 
     print(f"  Created {assets_created} assets, found {assets_found} existing")
     print(f"  Created {contracts_created} contracts")
@@ -636,46 +771,43 @@ def import_manifest() -> bool:
     # Infer and create registrations from depends_on
     print("\n[Phase 4] Creating contract registrations from dependencies...")
 
-    cross_team_deps = 0
     no_contract = 0
+    # (dependency asset_id, consumer team_id) of every cross-team dependency
+    cross_team_deps: list[tuple[str, str]] = []
 
-    for node_id, node in nodes.items():
-        resource_type = node.get("resource_type")
-        if resource_type not in ("model", "seed", "snapshot"):
-            continue
-
-        consumer_team_name = node_id_to_team.get(node_id)
-        consumer_team_id = team_name_to_id.get(consumer_team_name)
-
-        if not consumer_team_id:
-            continue
-
-        depends_on = node.get("depends_on", {}).get("nodes", [])
-
-        for dep_node_id in depends_on:
-            dep_fqn = node_id_to_fqn.get(dep_node_id)
-            if not dep_fqn:
-                continue
-
+    for consumer_team_id, dep_fqns in model_dependencies:
+        for dep_fqn in dep_fqns:
             dep_asset_id = fqn_to_asset_id.get(dep_fqn)
             dep_team_id = fqn_to_team_id.get(dep_fqn)
 
             # Only register if different team owns the dependency
             if dep_asset_id and dep_team_id and dep_team_id != consumer_team_id:
-                cross_team_deps += 1
-                contract_id = get_active_contract(dep_asset_id)
-                if contract_id:
-                    if register_consumer(contract_id, consumer_team_id):
-                        registrations_created += 1
-                else:
-                    no_contract += 1
-
-    print(f"  Cross-team deps: {cross_team_deps}, no contract: {no_contract}")
+                cross_team_deps.append((dep_asset_id, consumer_team_id))
+
+    # Most dependencies have many consumers, so look up each active contract not
+    # fetched up front or published above once per asset, not once per consumer
+    unknown = list(dict.fromkeys(dep for dep, _ in cross_team_deps if dep not in active_contracts))
+    for asset_id, contract_id in zip(
+        unknown, await gather_bounded(get_active_contract(asset_id) for asset_id in unknown)
+    ):
+        if contract_id:
+            active_contracts[asset_id] = contract_id
+
+    for registered in await gather_bounded(
+        register_dependency(dep_asset_id, consumer_team_id, active_contracts)
+        for dep_asset_id, consumer_team_id in cross_team_deps
+    ):
+        if registered is None:
+            no_contract += 1
+        elif registered:
+            registrations_created += 1
+
+    print(f"  Cross-team deps: {len(cross_team_deps)}, no contract: {no_contract}")
     print(f"  Created {registrations_created} contract registrations")
 
     # Create some breaking change proposals
     print("\n[Phase 5] Creating breaking change proposals...")
-    proposals_created = create_breaking_change_proposals(fqn_to_asset_id, fqn_to_team_id)
+    proposals_created = await create_breaking_change_proposals(fqn_to_asset_id, fqn_to_team_id)
     print(f"  Created {proposals_created} breaking change proposals")
 
     print("\n" + "=" * 50)
@@ -687,7 +819,7 @@ def import_manifest() -> bool:
     print(f"  Proposals: {proposals_created}")
     print("=" * 50)
 
-    return True
+    return True, {**existing_teams, **team_name_to_id}
 
 
 # Sample users to create - 2 per team
@@ -705,29 +837,27 @@ SAMPLE_USERS = [
 ]
 
 
-def get_or_create_user(name: str, email: str, team_id: str | None) -> str | None:
+async def get_or_create_user(name: str, email: str, team_id: str | None) -> str | None:
     """Get or create a user by email, return user ID."""
     # Try to create user
     try:
-        resp = httpx.post(
-            f"{API_URL}/api/v1/users",
-            json={"name": name, "email": email, "team_id": team_id},
-            timeout=10,
+        resp = await post_json(
+            "/api/v1/users",
+            payload={"name": name, "email": email, "team_id": team_id},
         )
         if resp.status_code == 201:
-            return resp.json()["id"]
+            return loads(resp.content)["id"]
     except Exception:
         pass
 
     # User might already exist, try to find it
     try:
-        resp = httpx.get(
-            f"{API_URL}/api/v1/users",
+        resp = await api_get(
+            "/api/v1/users",
             params={"email": email},
-            timeout=10,
         )
         if resp.status_code == 200:
-            results = resp.json().get("results", [])
+            results = loads(resp.content).get("results", [])
             for user in results:
                 if user.get("email") == email:
                     return user["id"]
@@ -737,18 +867,20 @@ def get_or_create_user(name: str, email: str, team_id: str | None) -> str | None
     return None
 
 
-def create_sample_users(team_name_to_id: dict[str, str]) -> list[str]:
+async def create_sample_users(team_name_to_id: dict[str, str]) -> list[str]:
     """Create sample users and assign to teams. Returns list of user IDs."""
     print("\n--- Creating sample users ---")
     user_ids = []
 
-    for user_data in SAMPLE_USERS:
-        team_id = team_name_to_id.get(user_data["team"])
-        user_id = get_or_create_user(
+    results = await gather_bounded(
+        get_or_create_user(
             name=user_data["name"],
             email=user_data["email"],
-            team_id=team_id,
+            team_id=team_name_to_id.get(user_data["team"]),
         )
+        for user_data in SAMPLE_USERS
+    )
+    for user_data, user_id in zip(SAMPLE_USERS, results):
         if user_id:
             user_ids.append(user_id)
             print(f"  Created/found user: {user_data['name']} ({user_data['email']})")
@@ -759,35 +891,59 @@ def create_sample_users(team_name_to_id: dict[str, str]) -> list[str]:
     return user_ids
 
 
-def get_all_assets() -> list[dict[str, Any]]:
-    """Fetch all assets with pagination."""
-    assets: list[dict[str, Any]] = []
-    offset = 0
-    limit = 100
+async def get_page(path: str, params: dict[str, Any], offset: int) -> dict[str, Any] | None:
+    """Fetch one page of a list endpoint, or None if the request failed."""
+    try:
+        resp = await api_get(
+            path,
+            params={**params, "limit": PAGE_SIZE, "offset": offset},
+            timeout=30,
+        )
+        if resp.status_code == 200:
+            return loads(resp.content)
+    except Exception:
+        pass
+    return None
 
-    while True:
-        try:
-            resp = httpx.get(
-                f"{API_URL}/api/v1/assets",
-                params={"limit": limit, "offset": offset},
-                timeout=30,
-            )
-            if resp.status_code != 200:
-                break
-            data = resp.json()
-            batch = data.get("results", [])
-            assets.extend(batch)
-
-            if len(batch) < limit:
-                break
-            offset += limit
-        except Exception:
+
+async def get_all(path: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+    """Fetch every result of a paginated list endpoint.
+
+    The first page reports the total, so the remaining pages are fetched
+    concurrently rather than one after another.
+    """
+    params = params or {}
+    first = await get_page(path, params, 0)
+    if first is None:
+        return []
+    items: list[dict[str, Any]] = first.get("results", [])
+    total = first.get("total", len(items))
+
+    pages = await gather_bounded(
+        get_page(path, params, offset) for offset in range(PAGE_SIZE, total, PAGE_SIZE)
+    )
+    for page in pages:
+        if page is None:
             break
+        items.extend(page.get("results", []))
 
-    return assets
+    return items
 
 
-def assign_random_owners(user_ids: list[str]) -> int:
+async def set_asset_owner(asset_id: str, owner_id: str) -> bool:
+    """Set an asset's owner user. Returns whether the update succeeded."""
+    try:
+        resp = await CLIENT.patch(
+            f"/api/v1/assets/{asset_id}",
+            content=dumps({"owner_user_id": owner_id}),
+            headers=JSON_HEADERS,
+        )
+        return resp.status_code == 200
+    except Exception:
+        return False
+
+
+async def assign_random_owners(user_ids: list[str]) -> int:
     """Assign random users as owners to assets. Returns count of assignments."""
     import random
 
@@ -797,64 +953,51 @@ def assign_random_owners(user_ids: list[str]) -> int:
 
     print("\n--- Assigning random asset owners ---")
 
-    assets = get_all_assets()
+    assets = await get_all("/api/v1/assets")
     if not assets:
         print("Failed to fetch assets")
         return 0
 
     print(f"  Found {len(assets)} assets")
-    assigned = 0
+    pending = []
     for asset in assets:
         # Randomly assign an owner (70% chance to have an owner)
         if random.random() < 0.7:
             owner_id = random.choice(user_ids)
-            try:
-                resp = httpx.patch(
-                    f"{API_URL}/api/v1/assets/{asset['id']}",
-                    json={"owner_user_id": owner_id},
-                    timeout=10,
-                )
-                if resp.status_code == 200:
-                    assigned += 1
-            except Exception:
-                pass
+            pending.append(set_asset_owner(asset["id"], owner_id))
+
+    assigned = sum(await gather_bounded(pending))
 
     print(f"Assigned owners to {assigned}/{len(assets)} assets")
     return assigned
 
 
-def main():
+async def main():
     """Main entry point."""
     print("=" * 50)
     print("Tessera Init: Importing sample dbt manifest")
     print("=" * 50)
 
-    if not wait_for_api():
-        print("Warning: API did not become ready, exiting")
-        sys.exit(1)
-
-    if not import_manifest():
-        print("Warning: Manifest import failed")
-        sys.exit(1)
-
-    # Get team name to ID mapping
-    team_name_to_id = {}
     try:
-        resp = httpx.get(f"{API_URL}/api/v1/teams", params={"limit": 100}, timeout=10)
-        if resp.status_code == 200:
-            for team in resp.json().get("results", []):
-                team_name_to_id[team["name"]] = team["id"]
-    except Exception:
-        pass
+        if not await wait_for_api():
+            print("Warning: API did not become ready, exiting")
+            sys.exit(1)
+
+        imported, team_name_to_id = await import_manifest()
+        if not imported:
+            print("Warning: Manifest import failed")
+            sys.exit(1)
 
-    # Create users and assign to teams
-    user_ids = create_sample_users(team_name_to_id)
+        # Create users and assign to teams
+        user_ids = await create_sample_users(team_name_to_id)
 
-    # Assign random owners to assets
-    assign_random_owners(user_ids)
+        # Assign random owners to assets
+        await assign_random_owners(user_ids)
 
-    print("\nInit complete! Sample data imported successfully.")
+        print("\nInit complete! Sample data imported successfully.")
+    finally:
+        await CLIENT.aclose()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -22,21 +22,35 @@ Exit codes:
     1: Error reporting results to Tessera
 """
 
-import json
+import asyncio
 import os
 import sys
-from collections import defaultdict
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-import requests
+import httpx
+from common import HTTP2, ModelTestCounts, dumps, extract_test_results, gather_bounded, loads
 
 # Configuration from environment
 TESSERA_URL = os.getenv("TESSERA_URL", "http://localhost:8000")
 TESSERA_API_KEY = os.getenv("TESSERA_API_KEY")
 DBT_TARGET_PATH = Path(os.getenv("DBT_TARGET_PATH", "target"))
 
+AUTH_HEADERS = {"Authorization": f"Bearer {TESSERA_API_KEY}"} if TESSERA_API_KEY else {}
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Largest page the API's list endpoints return
+PAGE_SIZE = 100
+
+# Shared client, so every request reuses pooled keep-alive connections.
+CLIENT = httpx.AsyncClient(
+    base_url=TESSERA_URL,
+    http2=HTTP2,
+    headers=AUTH_HEADERS,
+)
+
 
 def load_run_results() -> dict[str, Any] | None:
     """Load dbt run_results.json from the target directory."""
@@ -45,8 +59,7 @@ def load_run_results() -> dict[str, Any] | None:
         print(f"No run_results.json found at {results_path}")
         return None
 
-    with open(results_path) as f:
-        return json.load(f)
+    return loads(results_path.read_bytes())
 
 
 def load_manifest() -> dict[str, Any] | None:
@@ -56,116 +69,74 @@ def load_manifest() -> dict[str, Any] | None:
         print(f"No manifest.json found at {manifest_path}")
         return None
 
-    with open(manifest_path) as f:
-        return json.load(f)
-
-
-def get_model_fqn_for_test(test_node: dict[str, Any], manifest: dict[str, Any]) -> str | None:
-    """Get the FQN of the model that a test depends on."""
-    depends_on = test_node.get("depends_on", {}).get("nodes", [])
-
-    # Find the first model/source this test depends on
-    for node_id in depends_on:
-        if node_id.startswith("model.") or node_id.startswith("source."):
-            node = manifest.get("nodes", {}).get(node_id) or manifest.get("sources", {}).get(
-                node_id
-            )
-            if node:
-                database = node.get("database", "")
-                schema = node.get("schema", "")
-                name = node.get("name", "")
-                return f"{database}.{schema}.{name}".lower()
-    return None
+    return loads(manifest_path.read_bytes())
 
 
-def extract_test_results(
-    run_results: dict[str, Any], manifest: dict[str, Any]
-) -> dict[str, dict[str, Any]]:
-    """Extract test results grouped by model FQN.
+async def check_access() -> bool:
+    """Check that Tessera is reachable and accepts the configured API key.
 
-    Returns:
-        Dict mapping model FQN to {
-            "passed": int,
-            "failed": int,
-            "errored": int,
-            "skipped": int,
-            "failed_tests": [{"name": str, "message": str}]
-        }
+    Makes one cheap request up front, so a wrong URL or key fails the run
+    immediately instead of once per asset lookup and report.
     """
-    results_by_model: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {"passed": 0, "failed": 0, "errored": 0, "skipped": 0, "failed_tests": []}
-    )
-
-    for result in run_results.get("results", []):
-        unique_id = result.get("unique_id", "")
-        if not unique_id.startswith("test."):
-            continue
-
-        # Get test node from manifest
-        test_node = manifest.get("nodes", {}).get(unique_id, {})
-        if not test_node:
-            continue
-
-        # Find which model this test is for
-        model_fqn = get_model_fqn_for_test(test_node, manifest)
-        if not model_fqn:
-            continue
-
-        status = result.get("status", "").lower()
-        model_results = results_by_model[model_fqn]
-
-        if status == "pass":
-            model_results["passed"] += 1
-        elif status == "fail":
-            model_results["failed"] += 1
-            model_results["failed_tests"].append(
-                {
-                    "name": test_node.get("name", unique_id),
-                    "message": result.get("message", "Test failed"),
-                    "unique_id": unique_id,
-                }
-            )
-        elif status == "error":
-            model_results["errored"] += 1
-            model_results["failed_tests"].append(
-                {
-                    "name": test_node.get("name", unique_id),
-                    "message": result.get("message", "Test errored"),
-                    "unique_id": unique_id,
-                }
-            )
-        elif status == "skipped":
-            model_results["skipped"] += 1
-
-    return dict(results_by_model)
-
-
-def get_asset_id_by_fqn(fqn: str) -> str | None:
-    """Look up Tessera asset ID by FQN."""
-    headers = {"Authorization": f"Bearer {TESSERA_API_KEY}"} if TESSERA_API_KEY else {}
+    try:
+        response = await CLIENT.get("/api/v1/assets", params={"limit": 1}, timeout=10)
+    except httpx.HTTPError as e:
+        print(f"Could not reach Tessera at {TESSERA_URL}: {e}")
+        return False
 
+    if response.status_code in (401, 403):
+        print(f"Tessera rejected the API key ({response.status_code}). Check TESSERA_API_KEY.")
+        return False
+    if response.is_error:
+        print(f"Tessera returned {response.status_code} for {response.url}. Check TESSERA_URL.")
+        return False
+    return True
+
+
+async def get_asset_id_by_fqn(fqn: str) -> str | None:
+    """Look up the Tessera asset ID for one FQN.
+
+    The API's fqn filter is a case-insensitive substring match, so the results
+    are checked for the exact FQN.
+    """
     try:
-        response = requests.get(
-            f"{TESSERA_URL}/api/v1/assets",
-            params={"fqn": fqn},
-            headers=headers,
+        response = await CLIENT.get(
+            "/api/v1/assets",
+            params={"fqn": fqn, "limit": PAGE_SIZE},
             timeout=10,
         )
         response.raise_for_status()
-        assets = response.json()
-        if assets:
-            return assets[0].get("id")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"Failed to look up asset {fqn}: {e}")
+        return None
+
+    wanted = fqn.lower()
+    for asset in loads(response.content).get("results", []):
+        if asset.get("fqn", "").lower() == wanted:
+            return asset["id"]
     return None
 
 
-def report_to_tessera(
-    asset_id: str, model_fqn: str, results: dict[str, Any], invocation_id: str
+async def get_asset_ids_by_fqn(fqns: Iterable[str]) -> dict[str, str]:
+    """Look up Tessera asset IDs for many FQNs, keyed by lowercased FQN.
+
+    The API has no multi-FQN filter, so this sends one filtered lookup per FQN,
+    concurrently. FQNs with no matching asset are left out of the result.
+    """
+    fqns = list(fqns)
+    asset_ids = await gather_bounded(get_asset_id_by_fqn(fqn) for fqn in fqns)
+    return {fqn.lower(): asset_id for fqn, asset_id in zip(fqns, asset_ids) if asset_id}
+
+
+async def report_to_tessera(
+    asset_id: str, model_fqn: str, results: ModelTestCounts, invocation_id: str, run_at: str
 ) -> bool:
-    """Report test results for a single asset to Tessera."""
-    total_checked = results["passed"] + results["failed"] + results["errored"]
-    total_failed = results["failed"] + results["errored"]
+    """Report test results for a single asset to Tessera.
+
+    ``run_at`` is the ISO 8601 timestamp shared by every report in this run.
+    """
+    total_checked = results.passed + results.failed + results.errored
+    total_failed = results.failed + results.errored
 
     if total_checked == 0:
         return True  # No tests to report
@@ -173,7 +144,7 @@ def report_to_tessera(
     # Determine status
     if total_failed > 0:
         status = "failed"
-    elif results["skipped"] > 0 and results["passed"] == 0:
+    elif results.skipped > 0 and results.passed == 0:
         status = "partial"
     else:
         status = "passed"
@@ -181,83 +152,88 @@ def report_to_tessera(
     payload = {
         "status": status,
         "guarantees_checked": total_checked,
-        "guarantees_passed": results["passed"],
+        "guarantees_passed": results.passed,
         "guarantees_failed": total_failed,
         "triggered_by": "dbt_test",
         "run_id": invocation_id,
         "details": {
-            "failed_tests": results["failed_tests"],
-            "skipped": results["skipped"],
+            "failed_tests": results.failed_tests,
+            "skipped": results.skipped,
         },
-        "run_at": datetime.utcnow().isoformat() + "Z",
+        "run_at": run_at,
     }
 
-    headers = {"Authorization": f"Bearer {TESSERA_API_KEY}"} if TESSERA_API_KEY else {}
-    headers["Content-Type"] = "application/json"
-
     try:
-        response = requests.post(
-            f"{TESSERA_URL}/api/v1/assets/{asset_id}/audit-results",
-            json=payload,
-            headers=headers,
+        response = await CLIENT.post(
+            f"/api/v1/assets/{asset_id}/audit-results",
+            content=dumps(payload),
+            headers=JSON_HEADERS,
             timeout=30,
         )
         response.raise_for_status()
-        print(f"  Reported: {model_fqn} - {status} ({results['passed']}/{total_checked} passed)")
+        print(f"  Reported: {model_fqn} - {status} ({results.passed}/{total_checked} passed)")
         return True
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"  Failed to report {model_fqn}: {e}")
         return False
 
 
-def main() -> int:
+async def main() -> int:
     """Main entry point."""
-    print("Tessera dbt Test Reporter")
-    print("=" * 40)
+    try:
+        print("Tessera dbt Test Reporter")
+        print("=" * 40)
+
+        # Load dbt artifacts
+        run_results = load_run_results()
+        if not run_results:
+            print("No run results found. Exiting.")
+            return 0
 
-    # Load dbt artifacts
-    run_results = load_run_results()
-    if not run_results:
-        print("No run results found. Exiting.")
-        return 0
+        manifest = load_manifest()
+        if not manifest:
+            print("No manifest found. Exiting.")
+            return 0
 
-    manifest = load_manifest()
-    if not manifest:
-        print("No manifest found. Exiting.")
-        return 0
+        invocation_id = run_results.get("metadata", {}).get("invocation_id", "unknown")
+        print(f"Invocation ID: {invocation_id}")
 
-    invocation_id = run_results.get("metadata", {}).get("invocation_id", "unknown")
-    print(f"Invocation ID: {invocation_id}")
+        # Extract test results by model
+        results_by_model = extract_test_results(run_results, manifest)
+        if not results_by_model:
+            print("No test results found.")
+            return 0
 
-    # Extract test results by model
-    results_by_model = extract_test_results(run_results, manifest)
-    if not results_by_model:
-        print("No test results found.")
-        return 0
+        print(f"Found test results for {len(results_by_model)} models")
+        print()
 
-    print(f"Found test results for {len(results_by_model)} models")
-    print()
+        if not await check_access():
+            return 1
 
-    # Report to Tessera
-    success_count = 0
-    error_count = 0
+        # Report to Tessera, stamping every result with the same run time
+        run_at = datetime.now(UTC).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+        asset_ids = await get_asset_ids_by_fqn(results_by_model)
 
-    for model_fqn, results in results_by_model.items():
-        asset_id = get_asset_id_by_fqn(model_fqn)
-        if not asset_id:
-            print(f"  Skipping {model_fqn}: not found in Tessera")
-            continue
+        pending = []
+        for model_fqn, results in results_by_model.items():
+            asset_id = asset_ids.get(model_fqn)
+            if not asset_id:
+                print(f"  Skipping {model_fqn}: not found in Tessera")
+                continue
+            pending.append(report_to_tessera(asset_id, model_fqn, results, invocation_id, run_at))
 
-        if report_to_tessera(asset_id, model_fqn, results, invocation_id):
-            success_count += 1
-        else:
-            error_count += 1
+        # Each model's results are independent, so report them concurrently
+        reported = await gather_bounded(pending)
+        success_count = sum(reported)
+        error_count = len(reported) - success_count
 
-    print()
-    print(f"Results: {success_count} reported, {error_count} failed")
+        print()
+        print(f"Results: {success_count} reported, {error_count} failed")
 
-    return 1 if error_count > 0 else 0
+        return 1 if error_count > 0 else 0
+    finally:
+        await CLIENT.aclose()
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))
@@ -13,26 +13,51 @@ Creates:
 - A handful of proposals (breaking changes in progress)
 """
 
+import asyncio
 import json
+import mmap
 import os
+import random
 import sys
 import time
+import zlib
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 import httpx
+from common import HTTP2, ModelTestCounts, dumps, extract_test_results, gather_bounded, loads, retry
 
 API_URL = os.environ.get("TESSERA_API_URL", "http://api:8000")
 BOOTSTRAP_API_KEY = os.environ.get("BOOTSTRAP_API_KEY", "")
 
+# Headers for every API request, with the API key if one is configured
+HEADERS: dict[str, str] = {
+    "Content-Type": "application/json",
+    **({"Authorization": f"Bearer {BOOTSTRAP_API_KEY}"} if BOOTSTRAP_API_KEY else {}),
+}
 
-# Build headers with API key if available
-def get_headers() -> dict[str, str]:
-    """Get headers for API requests, including auth if configured."""
-    headers = {"Content-Type": "application/json"}
-    if BOOTSTRAP_API_KEY:
-        headers["Authorization"] = f"Bearer {BOOTSTRAP_API_KEY}"
-    return headers
-
+# Read timeouts, in seconds, for ordinary requests (teams, users, assets), which
+# the API answers in well under a second, and for dbt manifest uploads, which
+# import a whole project in one request. Connecting, writing a chunk and
+# waiting for a pooled connection get short limits too, so a stuck API fails
+# the run quickly instead of hanging.
+READ_TIMEOUT_FAST = 5
+READ_TIMEOUT_BULK = 60
+TIMEOUT = httpx.Timeout(connect=2.0, read=READ_TIMEOUT_FAST, write=5.0, pool=2.0)
+UPLOAD_TIMEOUT = httpx.Timeout(connect=2.0, read=READ_TIMEOUT_BULK, write=5.0, pool=2.0)
+
+# Shared client, so every request reuses pooled keep-alive connections to the API.
+# The pool keeps more idle connections than MAX_CONCURRENCY requests need, so
+# concurrent phases don't close and reopen them.
+CLIENT = httpx.AsyncClient(
+    base_url=API_URL,
+    headers=HEADERS,
+    timeout=TIMEOUT,
+    http2=HTTP2,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+)
 
 # Default manifest path (synthetic)
 MANIFEST_PATH = Path("/app/examples/data/manifest.json")
@@ -53,8 +78,22 @@ DBT_PROJECTS = {
         "owner_team": "finance-analytics",
     },
 }
-MAX_RETRIES = 30
-RETRY_DELAY = 2
+# Seconds to keep polling /health before giving up
+API_READY_TIMEOUT = 30
+
+# Largest page the API's list endpoints return
+PAGE_SIZE = 100
+
+# Bytes of a manifest file compressed per chunk of a streamed upload
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Failures worth retrying: the connection could not be made or was dropped.
+# Timeouts are not retried, so a slow API is not sent the same work again.
+TRANSIENT_ERRORS = (httpx.ConnectError, httpx.ReadError, httpx.RemoteProtocolError)
+
+# Failures that happen before a request reaches the API, the only ones after
+# which a create can be sent again without risking a lost or doubled write
+UNSENT_ERRORS = (httpx.ConnectError,)
 
 # Teams to create
 TEAMS = [
@@ -120,113 +159,719 @@ USERS = [
     {"name": "Kate Jackson", "email": "kate@company.com", "team": "sales-ops"},
 ]
 
+# Sample Avro schemas representing typical Kafka topics
+KAFKA_SCHEMAS = [
+    {
+        "fqn": "kafka.events.user_activity",
+        "schema": {
+            "type": "record",
+            "name": "UserActivity",
+            "namespace": "com.company.events",
+            "doc": "User activity events from web and mobile apps",
+            "fields": [
+                {"name": "event_id", "type": {"type": "string", "logicalType": "uuid"}},
+                {"name": "user_id", "type": "long"},
+                {
+                    "name": "event_type",
+                    "type": {
+                        "type": "enum",
+                        "name": "EventType",
+                        "symbols": ["PAGE_VIEW", "CLICK", "PURCHASE", "SIGN_UP"],
+                    },
+                },
+                {
+                    "name": "timestamp",
+                    "type": {"type": "long", "logicalType": "timestamp-millis"},
+                },
+                {
+                    "name": "properties",
+                    "type": ["null", {"type": "map", "values": "string"}],
+                    "default": None,
+                },
+            ],
+        },
+        "team": "data-platform",
+    },
+    {
+        "fqn": "kafka.orders.order_created",
+        "schema": {
+            "type": "record",
+            "name": "OrderCreated",
+            "namespace": "com.company.orders",
+            "doc": "Order creation events from the e-commerce platform",
+            "fields": [
+                {"name": "order_id", "type": {"type": "string", "logicalType": "uuid"}},
+                {"name": "customer_id", "type": "long"},
+                {
+                    "name": "items",
+                    "type": {
+                        "type": "array",
+                        "items": {
+                            "type": "record",
+                            "name": "OrderItem",
+                            "fields": [
+                                {"name": "product_id", "type": "string"},
+                                {"name": "quantity", "type": "int"},
+                                {
+                                    "name": "unit_price",
+                                    "type": {
+                                        "type": "bytes",
+                                        "logicalType": "decimal",
+                                        "precision": 10,
+                                        "scale": 2,
+                                    },
+                                },
+                            ],
+                        },
+                    },
+                },
+                {
+                    "name": "total",
+                    "type": {
+                        "type": "bytes",
+                        "logicalType": "decimal",
+                        "precision": 12,
+                        "scale": 2,
+                    },
+                },
+                {
+                    "name": "created_at",
+                    "type": {"type": "long", "logicalType": "timestamp-millis"},
+                },
+            ],
+        },
+        "team": "sales-ops",
+    },
+    {
+        "fqn": "kafka.marketing.campaign_attribution",
+        "schema": {
+            "type": "record",
+            "name": "CampaignAttribution",
+            "namespace": "com.company.marketing",
+            "doc": "Marketing campaign attribution events",
+            "fields": [
+                {"name": "attribution_id", "type": {"type": "string", "logicalType": "uuid"}},
+                {"name": "user_id", "type": "long"},
+                {"name": "campaign_id", "type": "string"},
+                {
+                    "name": "channel",
+                    "type": {
+                        "type": "enum",
+                        "name": "Channel",
+                        "symbols": ["EMAIL", "SOCIAL", "PAID_SEARCH", "ORGANIC", "DIRECT"],
+                    },
+                },
+                {"name": "conversion_value", "type": ["null", "double"], "default": None},
+                {
+                    "name": "attributed_at",
+                    "type": {"type": "long", "logicalType": "timestamp-millis"},
+                },
+            ],
+        },
+        "team": "marketing-analytics",
+    },
+]
+
+# (fqn, owning team, contract body) per Kafka topic. The contract bodies don't
+# depend on anything created at runtime, so they are encoded once here.
+KAFKA_TOPICS = [
+    (
+        topic["fqn"],
+        topic["team"],
+        dumps(
+            {
+                "version": "1.0.0",
+                "schema": topic["schema"],
+                "schema_format": "avro",
+                "compatibility_mode": "backward",
+            }
+        ),
+    )
+    for topic in KAFKA_SCHEMAS
+]
+
+# Sample OpenAPI 3.0 spec representing a typical User API
+OPENAPI_SPEC = {
+    "openapi": "3.0.0",
+    "info": {
+        "title": "User Service API",
+        "version": "1.0.0",
+        "description": "API for managing users, orders, and products",
+    },
+    "paths": {
+        "/v1/users": {
+            "get": {
+                "operationId": "listUsers",
+                "summary": "List all users",
+                "description": "Returns a paginated list of users",
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "content": {
+                            "application/json": {
+                                "schema": {
+                                    "type": "array",
+                                    "items": {"$ref": "#/components/schemas/User"},
+                                }
+                            }
+                        },
+                    }
+                },
+            },
+            "post": {
+                "operationId": "createUser",
+                "summary": "Create a new user",
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/CreateUserRequest"}
+                        }
+                    },
+                },
+                "responses": {
+                    "201": {
+                        "description": "Created",
+                        "content": {
+                            "application/json": {"schema": {"$ref": "#/components/schemas/User"}}
+                        },
+                    }
+                },
+            },
+        },
+        "/v1/users/{id}": {
+            "get": {
+                "operationId": "getUser",
+                "summary": "Get a user by ID",
+                "parameters": [
+                    {
+                        "name": "id",
+                        "in": "path",
+                        "required": True,
+                        "schema": {"type": "integer"},
+                    }
+                ],
+                "responses": {
+                    "200": {
+                        "description": "Success",
+                        "content": {
+                            "application/json": {"schema": {"$ref": "#/components/schemas/User"}}
+                        },
+                    },
+                    "404": {"description": "User not found"},
+                },
+            },
+        },
+        "/v1/orders": {
+            "post": {
+                "operationId": "createOrder",
+                "summary": "Create a new order",
+                "requestBody": {
+                    "required": True,
+                    "content": {
+                        "application/json": {
+                            "schema": {"$ref": "#/components/schemas/CreateOrderRequest"}
+                        }
+                    },
+                },
+                "responses": {
+                    "201": {
+                        "description": "Created",
+                        "content": {
+                            "application/json": {"schema": {"$ref": "#/components/schemas/Order"}}
+                        },
+                    }
+                },
+            },
+        },
+    },
+    "components": {
+        "schemas": {
+            "User": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "email": {"type": "string", "format": "email"},
+                    "name": {"type": "string"},
+                    "created_at": {"type": "string", "format": "date-time"},
+                    "plan": {"type": "string", "enum": ["free", "pro", "enterprise"]},
+                },
+                "required": ["id", "email", "name", "created_at", "plan"],
+            },
+            "CreateUserRequest": {
+                "type": "object",
+                "properties": {
+                    "email": {"type": "string", "format": "email"},
+                    "name": {"type": "string"},
+                    "plan": {"type": "string", "enum": ["free", "pro", "enterprise"]},
+                },
+                "required": ["email", "name"],
+            },
+            "Order": {
+                "type": "object",
+                "properties": {
+                    "order_id": {"type": "string", "format": "uuid"},
+                    "customer_id": {"type": "integer"},
+                    "items": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "sku": {"type": "string"},
+                                "quantity": {"type": "integer", "minimum": 1},
+                                "unit_price": {"type": "number"},
+                            },
+                            "required": ["sku", "quantity", "unit_price"],
+                        },
+                    },
+                    "total": {"type": "number"},
+                    "status": {
+                        "type": "string",
+                        "enum": ["pending", "confirmed", "shipped", "delivered"],
+                    },
+                },
+                "required": ["order_id", "customer_id", "items", "total", "status"],
+            },
+            "CreateOrderRequest": {
+                "type": "object",
+                "properties": {
+                    "customer_id": {"type": "integer"},
+                    "items": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "sku": {"type": "string"},
+                                "quantity": {"type": "integer", "minimum": 1},
+                            },
+                            "required": ["sku", "quantity"],
+                        },
+                    },
+                },
+                "required": ["customer_id", "items"],
+            },
+        }
+    },
+}
+OPENAPI_SPEC_JSON = dumps(OPENAPI_SPEC)
+
+# Sample GraphQL introspection result representing an Analytics API
+GRAPHQL_INTROSPECTION = {
+    "__schema": {
+        "queryType": {"name": "Query"},
+        "mutationType": {"name": "Mutation"},
+        "types": [
+            {
+                "kind": "OBJECT",
+                "name": "Query",
+                "fields": [
+                    {
+                        "name": "campaigns",
+                        "description": "List all marketing campaigns",
+                        "args": [
+                            {
+                                "name": "status",
+                                "type": {"kind": "ENUM", "name": "CampaignStatus"},
+                            },
+                            {
+                                "name": "limit",
+                                "type": {"kind": "SCALAR", "name": "Int"},
+                            },
+                        ],
+                        "type": {
+                            "kind": "LIST",
+                            "ofType": {"kind": "OBJECT", "name": "Campaign"},
+                        },
+                    },
+                    {
+                        "name": "campaign",
+                        "description": "Get a campaign by ID",
+                        "args": [
+                            {
+                                "name": "id",
+                                "type": {
+                                    "kind": "NON_NULL",
+                                    "ofType": {"kind": "SCALAR", "name": "ID"},
+                                },
+                            }
+                        ],
+                        "type": {"kind": "OBJECT", "name": "Campaign"},
+                    },
+                    {
+                        "name": "campaignMetrics",
+                        "description": "Get performance metrics for a campaign",
+                        "args": [
+                            {
+                                "name": "campaignId",
+                                "type": {
+                                    "kind": "NON_NULL",
+                                    "ofType": {"kind": "SCALAR", "name": "ID"},
+                                },
+                            },
+                            {
+                                "name": "startDate",
+                                "type": {"kind": "SCALAR", "name": "String"},
+                            },
+                            {
+                                "name": "endDate",
+                                "type": {"kind": "SCALAR", "name": "String"},
+                            },
+                        ],
+                        "type": {"kind": "OBJECT", "name": "CampaignMetrics"},
+                    },
+                ],
+            },
+            {
+                "kind": "OBJECT",
+                "name": "Mutation",
+                "fields": [
+                    {
+                        "name": "createCampaign",
+                        "description": "Create a new marketing campaign",
+                        "args": [
+                            {
+                                "name": "input",
+                                "type": {
+                                    "kind": "NON_NULL",
+                                    "ofType": {
+                                        "kind": "INPUT_OBJECT",
+                                        "name": "CreateCampaignInput",
+                                    },
+                                },
+                            }
+                        ],
+                        "type": {"kind": "OBJECT", "name": "Campaign"},
+                    },
+                    {
+                        "name": "updateCampaignStatus",
+                        "description": "Update campaign status",
+                        "args": [
+                            {
+                                "name": "id",
+                                "type": {
+                                    "kind": "NON_NULL",
+                                    "ofType": {"kind": "SCALAR", "name": "ID"},
+                                },
+                            },
+                            {
+                                "name": "status",
+                                "type": {
+                                    "kind": "NON_NULL",
+                                    "ofType": {"kind": "ENUM", "name": "CampaignStatus"},
+                                },
+                            },
+                        ],
+                        "type": {"kind": "OBJECT", "name": "Campaign"},
+                    },
+                ],
+            },
+            {
+                "kind": "OBJECT",
+                "name": "Campaign",
+                "fields": [
+                    {
+                        "name": "id",
+                        "type": {
+                            "kind": "NON_NULL",
+                            "ofType": {"kind": "SCALAR", "name": "ID"},
+                        },
+                    },
+                    {"name": "name", "type": {"kind": "SCALAR", "name": "String"}},
+                    {"name": "description", "type": {"kind": "SCALAR", "name": "String"}},
+                    {"name": "status", "type": {"kind": "ENUM", "name": "CampaignStatus"}},
+                    {"name": "budget", "type": {"kind": "SCALAR", "name": "Float"}},
+                    {"name": "startDate", "type": {"kind": "SCALAR", "name": "String"}},
+                    {"name": "endDate", "type": {"kind": "SCALAR", "name": "String"}},
+                ],
+            },
+            {
+                "kind": "OBJECT",
+                "name": "CampaignMetrics",
+                "fields": [
+                    {
+                        "name": "campaignId",
+                        "type": {
+                            "kind": "NON_NULL",
+                            "ofType": {"kind": "SCALAR", "name": "ID"},
+                        },
+                    },
+                    {"name": "impressions", "type": {"kind": "SCALAR", "name": "Int"}},
+                    {"name": "clicks", "type": {"kind": "SCALAR", "name": "Int"}},
+                    {"name": "conversions", "type": {"kind": "SCALAR", "name": "Int"}},
+                    {"name": "spend", "type": {"kind": "SCALAR", "name": "Float"}},
+                    {"name": "revenue", "type": {"kind": "SCALAR", "name": "Float"}},
+                    {"name": "roas", "type": {"kind": "SCALAR", "name": "Float"}},
+                ],
+            },
+            {
+                "kind": "ENUM",
+                "name": "CampaignStatus",
+                "enumValues": [
+                    {"name": "DRAFT"},
+                    {"name": "ACTIVE"},
+                    {"name": "PAUSED"},
+                    {"name": "ENDED"},
+                ],
+            },
+            {
+                "kind": "INPUT_OBJECT",
+                "name": "CreateCampaignInput",
+                "inputFields": [
+                    {
+                        "name": "name",
+                        "type": {
+                            "kind": "NON_NULL",
+                            "ofType": {"kind": "SCALAR", "name": "String"},
+                        },
+                    },
+                    {"name": "description", "type": {"kind": "SCALAR", "name": "String"}},
+                    {"name": "budget", "type": {"kind": "SCALAR", "name": "Float"}},
+                    {"name": "startDate", "type": {"kind": "SCALAR", "name": "String"}},
+                    {"name": "endDate", "type": {"kind": "SCALAR", "name": "String"}},
+                ],
+            },
+        ],
+    }
+}
+GRAPHQL_INTROSPECTION_JSON = dumps(GRAPHQL_INTROSPECTION)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the API circuit is open.
+
+    Unlike a failed request, this is not caught by the seeding steps, so it
+    aborts the run.
+    """
+
+
+@dataclass(slots=True)
+class CircuitBreaker:
+    """Stop calling the API for a while once it keeps failing.
+
+    After ``threshold`` consecutive failed requests (no response or a 5xx) the
+    circuit opens, and for the next ``cooldown`` seconds requests raise
+    CircuitOpenError without being sent. Any other response closes it again.
+    """
+
+    threshold: int = 5
+    cooldown: float = 30.0
+    failures: int = 0
+    open_until: float = 0.0
+
+    def check(self) -> None:
+        """Raise CircuitOpenError if requests should not be sent right now."""
+        if time.monotonic() < self.open_until:
+            raise CircuitOpenError("API is failing repeatedly; aborting")
+
+    def record(self, ok: bool) -> None:
+        """Record the outcome of a request."""
+        if ok:
+            self.failures = 0
+            return
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.open_until = time.monotonic() + self.cooldown
+            self.failures = 0
+
+
+BREAKER = CircuitBreaker()
+
+
+async def send(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """Send one request to the API through the circuit breaker."""
+    BREAKER.check()
+    try:
+        resp = await CLIENT.request(method, url, **kwargs)
+    except httpx.RequestError:
+        BREAKER.record(ok=False)
+        raise
+    BREAKER.record(ok=resp.status_code < 500)
+    return resp
+
+
+@retry(on=TRANSIENT_ERRORS, tries=4, backoff=0.5)
+async def api_get(url: str, **kwargs: Any) -> httpx.Response:
+    """GET ``url`` from the API, retrying transient failures."""
+    return await send("GET", url, **kwargs)
+
+
+@retry(on=UNSENT_ERRORS, tries=4, backoff=0.5, server_errors=False)
+async def api_post(url: str, **kwargs: Any) -> httpx.Response:
+    """POST to ``url`` on the API, retrying only if it never reached the API.
+
+    A create that went through but whose response was lost would get 409 when
+    sent again, and what it created would never be picked up (a Kafka topic's
+    contract would not be published), so POSTs are not retried once sent.
+    """
+    return await send("POST", url, **kwargs)
+
+
+# Set once /health has answered, so later wait_for_api() calls return at once
+_api_ready = False
+
+
+async def wait_for_api() -> bool:
+    """Wait for API to be healthy.
+
+    Polls with jittered exponential backoff from 100ms up to 2s, so an API that
+    comes up quickly is picked up almost immediately. Once the API has been
+    seen healthy, later calls in the same process return True without polling.
+    """
+    global _api_ready
+    if _api_ready:
+        return True
 
-def wait_for_api() -> bool:
-    """Wait for API to be healthy."""
     print("Waiting for API to be ready...")
-    for attempt in range(MAX_RETRIES):
+    deadline = time.monotonic() + API_READY_TIMEOUT
+    delay = 0.1
+    attempt = 0
+    while time.monotonic() < deadline:
+        attempt += 1
         try:
-            resp = httpx.get(f"{API_URL}/health", timeout=5)
+            resp = await CLIENT.get("/health", timeout=5)
             if resp.status_code == 200:
                 print("API is ready!")
+                _api_ready = True
                 return True
         except httpx.RequestError:
             pass
-        print(f"Attempt {attempt + 1}/{MAX_RETRIES} - API not ready yet...")
-        time.sleep(RETRY_DELAY)
+        print(f"Attempt {attempt} - API not ready yet...")
+        await asyncio.sleep(min(delay, 2.0) * random.uniform(1.0, 1.5))
+        delay *= 1.5
     return False
 
 
-def create_team(name: str, metadata: dict | None = None) -> str | None:
-    """Create a team and return its ID."""
+async def bulk_create(resource: str, items: list[dict]) -> list[dict]:
+    """Create items through /api/v1/bulk/{resource} in one request.
+
+    Items that already exist are skipped, and their existing IDs are returned.
+    Returns the per-item results in request order, or an empty list if the
+    request failed.
+    """
     try:
-        resp = httpx.post(
-            f"{API_URL}/api/v1/teams",
-            json={"name": name, "metadata": metadata or {}},
-            headers=get_headers(),
-            timeout=10,
+        resp = await api_post(
+            f"/api/v1/bulk/{resource}",
+            content=dumps({resource: items, "skip_duplicates": True}),
         )
-        if resp.status_code == 201:
-            team_id = resp.json()["id"]
-            print(f"  Created team '{name}' -> {team_id[:8]}...")
-            return team_id
-        elif resp.status_code == 409:
-            # Team exists, fetch it
-            list_resp = httpx.get(
-                f"{API_URL}/api/v1/teams?name={name}", headers=get_headers(), timeout=10
-            )
-            if list_resp.status_code == 200:
-                results = list_resp.json().get("results", [])
-                if results:
-                    team_id = results[0]["id"]
-                    print(f"  Team '{name}' exists -> {team_id[:8]}...")
-                    return team_id
-        print(f"  Failed to create team '{name}': {resp.status_code}")
+        if resp.status_code == 200:
+            return loads(resp.content)["results"]
+        print(f"  Failed to create {resource}: {resp.status_code} - {resp.text[:100]}")
     except httpx.RequestError as e:
-        print(f"  Error creating team '{name}': {e}")
-    return None
+        print(f"  Error creating {resource}: {e}")
+    return []
 
 
-def create_user(
-    name: str,
-    email: str,
-    team_id: str,
-    password: str | None = None,
-    role: str = "user",
-) -> str | None:
-    """Create a user and return their ID."""
-    try:
-        payload: dict = {"name": name, "email": email, "team_id": team_id, "role": role}
-        if password:
-            payload["password"] = password
-
-        resp = httpx.post(
-            f"{API_URL}/api/v1/users",
-            json=payload,
-            headers=get_headers(),
-            timeout=10,
-        )
-        if resp.status_code == 201:
-            user_id = resp.json()["id"]
-            role_label = f" [{role}]" if role != "user" else ""
-            print(f"  Created user '{name}' ({email}){role_label} -> {user_id[:8]}...")
-            return user_id
-        elif resp.status_code == 409:
+async def create_teams(teams: list[dict]) -> dict[str, str]:
+    """Create teams and return their IDs by name."""
+    team_ids: dict[str, str] = {}
+    payload = [{"name": team["name"], "metadata": team.get("metadata") or {}} for team in teams]
+    for team, result in zip(teams, await bulk_create("teams", payload)):
+        name = team["name"]
+        if not result["success"]:
+            print(f"  Failed to create team '{name}': {result['error']}")
+            continue
+        team_id = result["id"]
+        if result["details"].get("skipped"):
+            print(f"  Team '{name}' exists -> {team_id[:8]}...")
+        else:
+            print(f"  Created team '{name}' -> {team_id[:8]}...")
+        team_ids[name] = team_id
+    return team_ids
+
+
+async def create_users(users: list[dict], team_ids: dict[str, str]) -> int:
+    """Create users in their teams. Returns how many were created or already existed.
+
+    Users whose team is missing from ``team_ids`` are skipped.
+    """
+    users = [user for user in users if user["team"] in team_ids]
+    payload = []
+    for user in users:
+        item = {
+            "name": user["name"],
+            "email": user["email"],
+            "team_id": team_ids[user["team"]],
+            "role": user.get("role", "user"),
+        }
+        if user.get("password"):
+            item["password"] = user["password"]
+        payload.append(item)
+
+    created = 0
+    for user, result in zip(users, await bulk_create("users", payload)):
+        name, email, role = user["name"], user["email"], user.get("role", "user")
+        if not result["success"]:
+            print(f"  Failed to create user '{name}': {result['error']}")
+            continue
+        if result["details"].get("skipped"):
             print(f"  User '{email}' already exists")
-            return "exists"
-        print(f"  Failed to create user '{name}': {resp.status_code} - {resp.text[:100]}")
-    except httpx.RequestError as e:
-        print(f"  Error creating user '{name}': {e}")
-    return None
+        else:
+            role_label = f" [{role}]" if role != "user" else ""
+            print(f"  Created user '{name}' ({email}){role_label} -> {result['id'][:8]}...")
+        created += 1
+    return created
+
 
+async def gzip_manifest_body(manifest_path: Path, options: bytes) -> AsyncIterator[bytes]:
+    """Yield a gzipped ``{"manifest": ..., **options}`` upload body in chunks.
 
-def import_manifest(default_team_id: str) -> dict | None:
+    The manifest file is read through a memory map, UPLOAD_CHUNK_SIZE bytes at
+    a time, and its bytes are spliced in as they are. ``options`` is the JSON
+    encoding of the remaining request fields.
+    """
+    # wbits=MAX_WBITS | 16 writes a gzip header and trailer
+    compressor = zlib.compressobj(1, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    yield compressor.compress(b'{"manifest": ')
+    with (
+        open(manifest_path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as manifest,
+    ):
+        for start in range(0, len(manifest), UPLOAD_CHUNK_SIZE):
+            chunk = compressor.compress(manifest[start : start + UPLOAD_CHUNK_SIZE])
+            if chunk:
+                yield chunk
+    yield compressor.compress(b", " + options[1:]) + compressor.flush()
+
+
+@retry(on=UNSENT_ERRORS, tries=4, backoff=0.5, server_errors=False)
+async def upload_manifest(manifest_path: Path, owner_team_id: str) -> httpx.Response:
+    """POST a dbt manifest file to /api/v1/sync/dbt/upload.
+
+    The file's bytes are spliced into the request body as they are, so the
+    manifest is never parsed and re-serialized on this side. Manifests are large
+    and very repetitive, so the body is gzipped at the fastest level and streamed
+    as it is compressed, keeping only one chunk of it in memory at a time.
+    """
+    options = dumps(
+        {
+            "owner_team_id": owner_team_id,
+            "conflict_mode": "ignore",
+            "auto_publish_contracts": True,
+            "auto_register_consumers": True,
+            "infer_consumers_from_refs": True,
+        }
+    )
+    return await send(
+        "POST",
+        "/api/v1/sync/dbt/upload",
+        content=gzip_manifest_body(manifest_path, options),
+        headers={"Content-Encoding": "gzip"},
+        timeout=UPLOAD_TIMEOUT,
+    )
+
+
+async def import_manifest(default_team_id: str) -> dict | None:
     """Import the dbt manifest using the upload endpoint."""
     if not MANIFEST_PATH.exists():
         print(f"Manifest not found at {MANIFEST_PATH}")
         return None
 
-    print(f"Loading manifest from {MANIFEST_PATH}...")
-    manifest = json.loads(MANIFEST_PATH.read_text())
-
-    print("Importing manifest via /api/v1/sync/dbt/upload...")
+    print(f"Importing manifest from {MANIFEST_PATH} via /api/v1/sync/dbt/upload...")
     print("  (with auto_publish_contracts and meta.tessera ownership)")
     try:
-        resp = httpx.post(
-            f"{API_URL}/api/v1/sync/dbt/upload",
-            json={
-                "manifest": manifest,
-                "owner_team_id": default_team_id,
-                "conflict_mode": "ignore",
-                "auto_publish_contracts": True,
-                "auto_register_consumers": True,
-                "infer_consumers_from_refs": True,
-            },
-            headers=get_headers(),
-            timeout=180,
-        )
+        resp = await upload_manifest(MANIFEST_PATH, default_team_id)
         if resp.status_code == 200:
-            result = resp.json()
+            result = loads(resp.content)
             print("Import successful!")
             print(f"  Assets created: {result['assets']['created']}")
             print(f"  Assets updated: {result['assets']['updated']}")
@@ -243,7 +888,7 @@ def import_manifest(default_team_id: str) -> dict | None:
     return None
 
 
-def import_multi_project_manifests(team_ids: dict[str, str]) -> dict:
+async def import_multi_project_manifests(team_ids: dict[str, str]) -> dict:
     """Import manifests from multiple dbt projects, each to its respective team.
 
     This demonstrates Tessera's multi-project support where different teams
@@ -264,230 +909,123 @@ def import_multi_project_manifests(team_ids: dict[str, str]) -> dict:
 
         if not team_id:
             print(f"  Skipping {project_name}: team '{owner_team}' not found")
-            continue
-
-        if not manifest_path.exists():
-            print(f"  Skipping {project_name}: manifest not found at {manifest_path}")
-            continue
-
-        print(f"\n  Importing {project_name} project -> {owner_team} team...")
-
-        try:
-            manifest = json.loads(manifest_path.read_text())
-            resp = httpx.post(
-                f"{API_URL}/api/v1/sync/dbt/upload",
-                json={
-                    "manifest": manifest,
-                    "owner_team_id": team_id,
-                    "conflict_mode": "ignore",
-                    "auto_publish_contracts": True,
-                    "auto_register_consumers": True,
-                    "infer_consumers_from_refs": True,
-                },
-                headers=get_headers(),
-                timeout=180,
-            )
-
-            if resp.status_code == 200:
-                result = resp.json()
-                results["projects_imported"] += 1
-                results["total_assets"] += result["assets"]["created"]
-                results["total_contracts"] += result["contracts"]["published"]
-                results["total_guarantees"] += result.get("guarantees_extracted", 0)
-
-                print(f"    Assets: {result['assets']['created']}")
-                print(f"    Contracts: {result['contracts']['published']}")
-                print(f"    Guarantees: {result.get('guarantees_extracted', 0)}")
-            else:
-                print(f"    Failed: {resp.status_code} - {resp.text[:100]}")
-
-        except httpx.RequestError as e:
-            print(f"    Error: {e}")
-
-    return results
-
-
-def create_kafka_assets(team_ids: dict[str, str]) -> int:
-    """Create sample Kafka assets with Avro schemas to demonstrate schema format support.
-
-    This shows how Tessera handles Avro schemas from Kafka topics.
-    """
-    print("\nCreating Kafka assets with Avro schemas...")
-    assets_created = 0
-
-    # Sample Avro schemas representing typical Kafka topics
-    kafka_schemas = [
-        {
-            "fqn": "kafka.events.user_activity",
-            "schema": {
-                "type": "record",
-                "name": "UserActivity",
-                "namespace": "com.company.events",
-                "doc": "User activity events from web and mobile apps",
-                "fields": [
-                    {"name": "event_id", "type": {"type": "string", "logicalType": "uuid"}},
-                    {"name": "user_id", "type": "long"},
-                    {
-                        "name": "event_type",
-                        "type": {
-                            "type": "enum",
-                            "name": "EventType",
-                            "symbols": ["PAGE_VIEW", "CLICK", "PURCHASE", "SIGN_UP"],
-                        },
-                    },
-                    {
-                        "name": "timestamp",
-                        "type": {"type": "long", "logicalType": "timestamp-millis"},
-                    },
-                    {
-                        "name": "properties",
-                        "type": ["null", {"type": "map", "values": "string"}],
-                        "default": None,
-                    },
-                ],
-            },
-            "team": "data-platform",
-        },
-        {
-            "fqn": "kafka.orders.order_created",
-            "schema": {
-                "type": "record",
-                "name": "OrderCreated",
-                "namespace": "com.company.orders",
-                "doc": "Order creation events from the e-commerce platform",
-                "fields": [
-                    {"name": "order_id", "type": {"type": "string", "logicalType": "uuid"}},
-                    {"name": "customer_id", "type": "long"},
-                    {
-                        "name": "items",
-                        "type": {
-                            "type": "array",
-                            "items": {
-                                "type": "record",
-                                "name": "OrderItem",
-                                "fields": [
-                                    {"name": "product_id", "type": "string"},
-                                    {"name": "quantity", "type": "int"},
-                                    {
-                                        "name": "unit_price",
-                                        "type": {
-                                            "type": "bytes",
-                                            "logicalType": "decimal",
-                                            "precision": 10,
-                                            "scale": 2,
-                                        },
-                                    },
-                                ],
-                            },
-                        },
-                    },
-                    {
-                        "name": "total",
-                        "type": {
-                            "type": "bytes",
-                            "logicalType": "decimal",
-                            "precision": 12,
-                            "scale": 2,
-                        },
-                    },
-                    {
-                        "name": "created_at",
-                        "type": {"type": "long", "logicalType": "timestamp-millis"},
-                    },
-                ],
-            },
-            "team": "sales-ops",
-        },
-        {
-            "fqn": "kafka.marketing.campaign_attribution",
-            "schema": {
-                "type": "record",
-                "name": "CampaignAttribution",
-                "namespace": "com.company.marketing",
-                "doc": "Marketing campaign attribution events",
-                "fields": [
-                    {"name": "attribution_id", "type": {"type": "string", "logicalType": "uuid"}},
-                    {"name": "user_id", "type": "long"},
-                    {"name": "campaign_id", "type": "string"},
-                    {
-                        "name": "channel",
-                        "type": {
-                            "type": "enum",
-                            "name": "Channel",
-                            "symbols": ["EMAIL", "SOCIAL", "PAID_SEARCH", "ORGANIC", "DIRECT"],
-                        },
-                    },
-                    {"name": "conversion_value", "type": ["null", "double"], "default": None},
-                    {
-                        "name": "attributed_at",
-                        "type": {"type": "long", "logicalType": "timestamp-millis"},
-                    },
-                ],
-            },
-            "team": "marketing-analytics",
-        },
-    ]
+            continue
 
-    for kafka_asset in kafka_schemas:
-        team_id = team_ids.get(kafka_asset["team"])
-        if not team_id:
-            print(f"  Skipping {kafka_asset['fqn']}: team not found")
+        if not manifest_path.exists():
+            print(f"  Skipping {project_name}: manifest not found at {manifest_path}")
             continue
 
-        # Create the asset
+        print(f"\n  Importing {project_name} project -> {owner_team} team...")
+
         try:
-            asset_resp = httpx.post(
-                f"{API_URL}/api/v1/assets",
-                json={
-                    "fqn": kafka_asset["fqn"],
+            resp = await upload_manifest(manifest_path, team_id)
+
+            if resp.status_code == 200:
+                result = loads(resp.content)
+                results["projects_imported"] += 1
+                results["total_assets"] += result["assets"]["created"]
+                results["total_contracts"] += result["contracts"]["published"]
+                results["total_guarantees"] += result.get("guarantees_extracted", 0)
+
+                print(f"    Assets: {result['assets']['created']}")
+                print(f"    Contracts: {result['contracts']['published']}")
+                print(f"    Guarantees: {result.get('guarantees_extracted', 0)}")
+            else:
+                print(f"    Failed: {resp.status_code} - {resp.text[:100]}")
+
+        except httpx.RequestError as e:
+            print(f"    Error: {e}")
+
+    return results
+
+
+async def create_kafka_asset(
+    fqn: str, team: str, contract_body: bytes, team_ids: dict[str, str]
+) -> tuple[bool, list[str]]:
+    """Create one Kafka asset and publish its Avro contract.
+
+    Returns whether the contract was published, and the lines describing the
+    outcome to print.
+    """
+    team_id = team_ids.get(team)
+    if not team_id:
+        return False, [f"  Skipping {fqn}: team not found"]
+
+    messages: list[str] = []
+    try:
+        # Create the asset
+        asset_resp = await api_post(
+            "/api/v1/assets",
+            content=dumps(
+                {
+                    "fqn": fqn,
                     "owner_team_id": team_id,
                     "resource_type": "kafka_topic",
                     "metadata": {"source": "kafka", "format": "avro"},
-                },
-                headers=get_headers(),
-                timeout=10,
-            )
+                }
+            ),
+        )
 
-            if asset_resp.status_code == 201:
-                asset = asset_resp.json()
-                asset_id = asset["id"]
-                print(f"  Created asset: {kafka_asset['fqn']}")
-
-                # Publish contract with Avro schema
-                contract_resp = httpx.post(
-                    f"{API_URL}/api/v1/assets/{asset_id}/contracts?published_by={team_id}",
-                    json={
-                        "version": "1.0.0",
-                        "schema": kafka_asset["schema"],
-                        "schema_format": "avro",
-                        "compatibility_mode": "backward",
-                    },
-                    headers=get_headers(),
-                    timeout=30,
-                )
+        if asset_resp.status_code == 409:
+            return False, [f"  Asset exists: {fqn}"]
+        if asset_resp.status_code != 201:
+            return False, [f"  Failed to create asset: {asset_resp.status_code}"]
 
-                if contract_resp.status_code == 201:
-                    result = contract_resp.json()
-                    contract = result.get("contract", {})
-                    print(
-                        f"    Published v{contract.get('version', '1.0.0')} (Avro -> JSON Schema)"
-                    )
-                    assets_created += 1
-                else:
-                    print(f"    Failed to publish contract: {contract_resp.status_code}")
+        asset_id = loads(asset_resp.content)["id"]
+        messages.append(f"  Created asset: {fqn}")
 
-            elif asset_resp.status_code == 409:
-                print(f"  Asset exists: {kafka_asset['fqn']}")
-            else:
-                print(f"  Failed to create asset: {asset_resp.status_code}")
+        # Publish contract with Avro schema
+        contract_resp = await api_post(
+            f"/api/v1/assets/{asset_id}/contracts?published_by={team_id}",
+            content=contract_body,
+            timeout=30,
+        )
+
+        if contract_resp.status_code != 201:
+            messages.append(f"    Failed to publish contract: {contract_resp.status_code}")
+            return False, messages
+
+        contract = loads(contract_resp.content).get("contract", {})
+        messages.append(f"    Published v{contract.get('version', '1.0.0')} (Avro -> JSON Schema)")
+        return True, messages
+
+    except httpx.RequestError as e:
+        messages.append(f"  Error: {e}")
+        return False, messages
 
-        except httpx.RequestError as e:
-            print(f"  Error: {e}")
+
+async def create_kafka_assets(team_ids: dict[str, str]) -> int:
+    """Create sample Kafka assets with Avro schemas to demonstrate schema format support.
+
+    This shows how Tessera handles Avro schemas from Kafka topics.
+    """
+    print("\nCreating Kafka assets with Avro schemas...")
+    assets_created = 0
+
+    # Each topic's contract depends only on its own asset, so create the topics
+    # concurrently and print their outcomes in order
+    outcomes = await asyncio.gather(
+        *(create_kafka_asset(*topic, team_ids) for topic in KAFKA_TOPICS)
+    )
+    for created, messages in outcomes:
+        assets_created += created
+        for message in messages:
+            print(message)
 
     return assets_created
 
 
-def import_openapi_spec(team_ids: dict[str, str]) -> int:
+def encode_with(name: str, encoded: bytes, fields: dict[str, Any]) -> bytes:
+    """Encode ``fields`` as a JSON object, plus ``name`` set to the JSON ``encoded``.
+
+    The large demo specs are encoded once at import time and spliced into each
+    request body this way, instead of being walked and encoded per request.
+    """
+    separator = b"," if fields else b""
+    return b'{"' + name.encode() + b'":' + encoded + separator + dumps(fields)[1:]
+
+
+async def import_openapi_spec(team_ids: dict[str, str]) -> int:
     """Import OpenAPI spec via the /sync/openapi endpoint.
 
     This demonstrates how Tessera imports REST API contracts from OpenAPI specs.
@@ -500,190 +1038,19 @@ def import_openapi_spec(team_ids: dict[str, str]) -> int:
         print("  Skipping: product-analytics team not found")
         return 0
 
-    # Sample OpenAPI 3.0 spec representing a typical User API
-    openapi_spec = {
-        "openapi": "3.0.0",
-        "info": {
-            "title": "User Service API",
-            "version": "1.0.0",
-            "description": "API for managing users, orders, and products",
-        },
-        "paths": {
-            "/v1/users": {
-                "get": {
-                    "operationId": "listUsers",
-                    "summary": "List all users",
-                    "description": "Returns a paginated list of users",
-                    "responses": {
-                        "200": {
-                            "description": "Success",
-                            "content": {
-                                "application/json": {
-                                    "schema": {
-                                        "type": "array",
-                                        "items": {"$ref": "#/components/schemas/User"},
-                                    }
-                                }
-                            },
-                        }
-                    },
-                },
-                "post": {
-                    "operationId": "createUser",
-                    "summary": "Create a new user",
-                    "requestBody": {
-                        "required": True,
-                        "content": {
-                            "application/json": {
-                                "schema": {"$ref": "#/components/schemas/CreateUserRequest"}
-                            }
-                        },
-                    },
-                    "responses": {
-                        "201": {
-                            "description": "Created",
-                            "content": {
-                                "application/json": {
-                                    "schema": {"$ref": "#/components/schemas/User"}
-                                }
-                            },
-                        }
-                    },
-                },
-            },
-            "/v1/users/{id}": {
-                "get": {
-                    "operationId": "getUser",
-                    "summary": "Get a user by ID",
-                    "parameters": [
-                        {
-                            "name": "id",
-                            "in": "path",
-                            "required": True,
-                            "schema": {"type": "integer"},
-                        }
-                    ],
-                    "responses": {
-                        "200": {
-                            "description": "Success",
-                            "content": {
-                                "application/json": {
-                                    "schema": {"$ref": "#/components/schemas/User"}
-                                }
-                            },
-                        },
-                        "404": {"description": "User not found"},
-                    },
-                },
-            },
-            "/v1/orders": {
-                "post": {
-                    "operationId": "createOrder",
-                    "summary": "Create a new order",
-                    "requestBody": {
-                        "required": True,
-                        "content": {
-                            "application/json": {
-                                "schema": {"$ref": "#/components/schemas/CreateOrderRequest"}
-                            }
-                        },
-                    },
-                    "responses": {
-                        "201": {
-                            "description": "Created",
-                            "content": {
-                                "application/json": {
-                                    "schema": {"$ref": "#/components/schemas/Order"}
-                                }
-                            },
-                        }
-                    },
-                },
-            },
-        },
-        "components": {
-            "schemas": {
-                "User": {
-                    "type": "object",
-                    "properties": {
-                        "id": {"type": "integer"},
-                        "email": {"type": "string", "format": "email"},
-                        "name": {"type": "string"},
-                        "created_at": {"type": "string", "format": "date-time"},
-                        "plan": {"type": "string", "enum": ["free", "pro", "enterprise"]},
-                    },
-                    "required": ["id", "email", "name", "created_at", "plan"],
-                },
-                "CreateUserRequest": {
-                    "type": "object",
-                    "properties": {
-                        "email": {"type": "string", "format": "email"},
-                        "name": {"type": "string"},
-                        "plan": {"type": "string", "enum": ["free", "pro", "enterprise"]},
-                    },
-                    "required": ["email", "name"],
-                },
-                "Order": {
-                    "type": "object",
-                    "properties": {
-                        "order_id": {"type": "string", "format": "uuid"},
-                        "customer_id": {"type": "integer"},
-                        "items": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "sku": {"type": "string"},
-                                    "quantity": {"type": "integer", "minimum": 1},
-                                    "unit_price": {"type": "number"},
-                                },
-                                "required": ["sku", "quantity", "unit_price"],
-                            },
-                        },
-                        "total": {"type": "number"},
-                        "status": {
-                            "type": "string",
-                            "enum": ["pending", "confirmed", "shipped", "delivered"],
-                        },
-                    },
-                    "required": ["order_id", "customer_id", "items", "total", "status"],
-                },
-                "CreateOrderRequest": {
-                    "type": "object",
-                    "properties": {
-                        "customer_id": {"type": "integer"},
-                        "items": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "sku": {"type": "string"},
-                                    "quantity": {"type": "integer", "minimum": 1},
-                                },
-                                "required": ["sku", "quantity"],
-                            },
-                        },
-                    },
-                    "required": ["customer_id", "items"],
-                },
-            }
-        },
-    }
-
     try:
-        resp = httpx.post(
-            f"{API_URL}/api/v1/sync/openapi",
-            json={
-                "spec": openapi_spec,
-                "owner_team_id": team_id,
-                "auto_publish_contracts": True,
-            },
-            headers=get_headers(),
+        resp = await api_post(
+            "/api/v1/sync/openapi",
+            content=encode_with(
+                "spec",
+                OPENAPI_SPEC_JSON,
+                {"owner_team_id": team_id, "auto_publish_contracts": True},
+            ),
             timeout=60,
         )
 
         if resp.status_code == 200:
-            result = resp.json()
+            result = loads(resp.content)
             assets_created = result.get("assets_created", 0)
             contracts = result.get("contracts_published", 0)
             print(f"  Imported OpenAPI spec: {result.get('api_title', 'Unknown')}")
@@ -699,7 +1066,7 @@ def import_openapi_spec(team_ids: dict[str, str]) -> int:
     return assets_created
 
 
-def import_graphql_schema(team_ids: dict[str, str]) -> int:
+async def import_graphql_schema(team_ids: dict[str, str]) -> int:
     """Import GraphQL schema via the /sync/graphql endpoint.
 
     This demonstrates how Tessera imports GraphQL API contracts from introspection results.
@@ -712,200 +1079,23 @@ def import_graphql_schema(team_ids: dict[str, str]) -> int:
         print("  Skipping: marketing-analytics team not found")
         return 0
 
-    # Sample GraphQL introspection result representing an Analytics API
-    introspection = {
-        "__schema": {
-            "queryType": {"name": "Query"},
-            "mutationType": {"name": "Mutation"},
-            "types": [
-                {
-                    "kind": "OBJECT",
-                    "name": "Query",
-                    "fields": [
-                        {
-                            "name": "campaigns",
-                            "description": "List all marketing campaigns",
-                            "args": [
-                                {
-                                    "name": "status",
-                                    "type": {"kind": "ENUM", "name": "CampaignStatus"},
-                                },
-                                {
-                                    "name": "limit",
-                                    "type": {"kind": "SCALAR", "name": "Int"},
-                                },
-                            ],
-                            "type": {
-                                "kind": "LIST",
-                                "ofType": {"kind": "OBJECT", "name": "Campaign"},
-                            },
-                        },
-                        {
-                            "name": "campaign",
-                            "description": "Get a campaign by ID",
-                            "args": [
-                                {
-                                    "name": "id",
-                                    "type": {
-                                        "kind": "NON_NULL",
-                                        "ofType": {"kind": "SCALAR", "name": "ID"},
-                                    },
-                                }
-                            ],
-                            "type": {"kind": "OBJECT", "name": "Campaign"},
-                        },
-                        {
-                            "name": "campaignMetrics",
-                            "description": "Get performance metrics for a campaign",
-                            "args": [
-                                {
-                                    "name": "campaignId",
-                                    "type": {
-                                        "kind": "NON_NULL",
-                                        "ofType": {"kind": "SCALAR", "name": "ID"},
-                                    },
-                                },
-                                {
-                                    "name": "startDate",
-                                    "type": {"kind": "SCALAR", "name": "String"},
-                                },
-                                {
-                                    "name": "endDate",
-                                    "type": {"kind": "SCALAR", "name": "String"},
-                                },
-                            ],
-                            "type": {"kind": "OBJECT", "name": "CampaignMetrics"},
-                        },
-                    ],
-                },
-                {
-                    "kind": "OBJECT",
-                    "name": "Mutation",
-                    "fields": [
-                        {
-                            "name": "createCampaign",
-                            "description": "Create a new marketing campaign",
-                            "args": [
-                                {
-                                    "name": "input",
-                                    "type": {
-                                        "kind": "NON_NULL",
-                                        "ofType": {
-                                            "kind": "INPUT_OBJECT",
-                                            "name": "CreateCampaignInput",
-                                        },
-                                    },
-                                }
-                            ],
-                            "type": {"kind": "OBJECT", "name": "Campaign"},
-                        },
-                        {
-                            "name": "updateCampaignStatus",
-                            "description": "Update campaign status",
-                            "args": [
-                                {
-                                    "name": "id",
-                                    "type": {
-                                        "kind": "NON_NULL",
-                                        "ofType": {"kind": "SCALAR", "name": "ID"},
-                                    },
-                                },
-                                {
-                                    "name": "status",
-                                    "type": {
-                                        "kind": "NON_NULL",
-                                        "ofType": {"kind": "ENUM", "name": "CampaignStatus"},
-                                    },
-                                },
-                            ],
-                            "type": {"kind": "OBJECT", "name": "Campaign"},
-                        },
-                    ],
-                },
-                {
-                    "kind": "OBJECT",
-                    "name": "Campaign",
-                    "fields": [
-                        {
-                            "name": "id",
-                            "type": {
-                                "kind": "NON_NULL",
-                                "ofType": {"kind": "SCALAR", "name": "ID"},
-                            },
-                        },
-                        {"name": "name", "type": {"kind": "SCALAR", "name": "String"}},
-                        {"name": "description", "type": {"kind": "SCALAR", "name": "String"}},
-                        {"name": "status", "type": {"kind": "ENUM", "name": "CampaignStatus"}},
-                        {"name": "budget", "type": {"kind": "SCALAR", "name": "Float"}},
-                        {"name": "startDate", "type": {"kind": "SCALAR", "name": "String"}},
-                        {"name": "endDate", "type": {"kind": "SCALAR", "name": "String"}},
-                    ],
-                },
-                {
-                    "kind": "OBJECT",
-                    "name": "CampaignMetrics",
-                    "fields": [
-                        {
-                            "name": "campaignId",
-                            "type": {
-                                "kind": "NON_NULL",
-                                "ofType": {"kind": "SCALAR", "name": "ID"},
-                            },
-                        },
-                        {"name": "impressions", "type": {"kind": "SCALAR", "name": "Int"}},
-                        {"name": "clicks", "type": {"kind": "SCALAR", "name": "Int"}},
-                        {"name": "conversions", "type": {"kind": "SCALAR", "name": "Int"}},
-                        {"name": "spend", "type": {"kind": "SCALAR", "name": "Float"}},
-                        {"name": "revenue", "type": {"kind": "SCALAR", "name": "Float"}},
-                        {"name": "roas", "type": {"kind": "SCALAR", "name": "Float"}},
-                    ],
-                },
-                {
-                    "kind": "ENUM",
-                    "name": "CampaignStatus",
-                    "enumValues": [
-                        {"name": "DRAFT"},
-                        {"name": "ACTIVE"},
-                        {"name": "PAUSED"},
-                        {"name": "ENDED"},
-                    ],
-                },
+    try:
+        resp = await api_post(
+            "/api/v1/sync/graphql",
+            content=encode_with(
+                "introspection",
+                GRAPHQL_INTROSPECTION_JSON,
                 {
-                    "kind": "INPUT_OBJECT",
-                    "name": "CreateCampaignInput",
-                    "inputFields": [
-                        {
-                            "name": "name",
-                            "type": {
-                                "kind": "NON_NULL",
-                                "ofType": {"kind": "SCALAR", "name": "String"},
-                            },
-                        },
-                        {"name": "description", "type": {"kind": "SCALAR", "name": "String"}},
-                        {"name": "budget", "type": {"kind": "SCALAR", "name": "Float"}},
-                        {"name": "startDate", "type": {"kind": "SCALAR", "name": "String"}},
-                        {"name": "endDate", "type": {"kind": "SCALAR", "name": "String"}},
-                    ],
+                    "owner_team_id": team_id,
+                    "schema_name": "Marketing Analytics API",
+                    "auto_publish_contracts": True,
                 },
-            ],
-        }
-    }
-
-    try:
-        resp = httpx.post(
-            f"{API_URL}/api/v1/sync/graphql",
-            json={
-                "introspection": introspection,
-                "owner_team_id": team_id,
-                "schema_name": "Marketing Analytics API",
-                "auto_publish_contracts": True,
-            },
-            headers=get_headers(),
+            ),
             timeout=60,
         )
 
         if resp.status_code == 200:
-            result = resp.json()
+            result = loads(resp.content)
             assets_created = result.get("assets_created", 0)
             contracts = result.get("contracts_published", 0)
             print(f"  Imported GraphQL schema: {result.get('schema_name', 'Unknown')}")
@@ -921,89 +1111,82 @@ def import_graphql_schema(team_ids: dict[str, str]) -> int:
     return assets_created
 
 
-def get_model_fqn_for_test(test_node: dict, manifest: dict) -> str | None:
-    """Get the FQN of the model that a test depends on.
+async def report_model_results(
+    model_fqn: str, results: ModelTestCounts, invocation_id: str, project_name: str
+) -> tuple[bool, str | None]:
+    """Report one model's dbt test results to its asset's audit endpoint.
 
-    Uses database.schema.name format which matches how Tessera stores FQNs
-    from dbt manifest imports.
+    Returns whether an audit result was recorded, and a line describing the
+    outcome to print (None if there is nothing to say).
     """
-    depends_on = test_node.get("depends_on", {}).get("nodes", [])
-
-    for node_id in depends_on:
-        if node_id.startswith("model.") or node_id.startswith("source."):
-            node = manifest.get("nodes", {}).get(node_id) or manifest.get("sources", {}).get(
-                node_id
+    try:
+        # Look up asset by FQN
+        asset_resp = await api_get(
+            "/api/v1/assets",
+            params={"fqn": model_fqn, "limit": 1},
+        )
+        if asset_resp.status_code != 200:
+            return False, f"      Lookup failed for {model_fqn}: {asset_resp.status_code}"
+
+        assets = loads(asset_resp.content).get("results", [])
+        if not assets:
+            # Try partial match (search for model name anywhere in FQN)
+            parts = model_fqn.split(".")
+            model_name = parts[-1] if parts else model_fqn
+            asset_resp = await api_get(
+                "/api/v1/assets",
+                params={"search": model_name, "resource_type": "model", "limit": 5},
             )
-            if node:
-                # Use database.schema.name format (matches Tessera's FQN storage)
-                database = node.get("database", "")
-                schema = node.get("schema", "")
-                name = node.get("name", "")
-                return f"{database}.{schema}.{name}".lower()
-    return None
-
-
-def extract_test_results_from_run(run_results: dict, manifest: dict) -> dict[str, dict]:
-    """Extract test results grouped by model FQN from dbt run_results.json.
-
-    Returns:
-        Dict mapping model FQN to {
-            "passed": int,
-            "failed": int,
-            "errored": int,
-            "skipped": int,
-            "failed_tests": [{"name": str, "message": str}]
+            if asset_resp.status_code == 200:
+                all_assets = loads(asset_resp.content).get("results", [])
+                # Find exact match by model name
+                assets = [a for a in all_assets if a.get("fqn", "").endswith(f".{model_name}")]
+            if not assets:
+                return False, f"      Asset not found: {model_fqn}"
+
+        asset_id = assets[0]["id"]
+
+        # Calculate totals
+        total_checked = results.passed + results.failed + results.errored
+        total_failed = results.failed + results.errored
+
+        if total_checked == 0:
+            return False, None
+
+        # Determine status
+        if total_failed > 0:
+            status = "failed"
+        elif results.skipped > 0 and results.passed == 0:
+            status = "partial"
+        else:
+            status = "passed"
+
+        payload = {
+            "status": status,
+            "guarantees_checked": total_checked,
+            "guarantees_passed": results.passed,
+            "guarantees_failed": total_failed,
+            "triggered_by": "dbt_test",
+            "run_id": invocation_id,
+            "details": {
+                "failed_tests": results.failed_tests,
+                "skipped": results.skipped,
+                "project": project_name,
+            },
         }
-    """
-    from collections import defaultdict
-
-    results_by_model: dict[str, dict] = defaultdict(
-        lambda: {"passed": 0, "failed": 0, "errored": 0, "skipped": 0, "failed_tests": []}
-    )
-
-    for result in run_results.get("results", []):
-        unique_id = result.get("unique_id", "")
-        if not unique_id.startswith("test."):
-            continue
 
-        test_node = manifest.get("nodes", {}).get(unique_id, {})
-        if not test_node:
-            continue
-
-        model_fqn = get_model_fqn_for_test(test_node, manifest)
-        if not model_fqn:
-            continue
-
-        status = result.get("status", "").lower()
-        model_results = results_by_model[model_fqn]
-
-        if status == "pass":
-            model_results["passed"] += 1
-        elif status == "fail":
-            model_results["failed"] += 1
-            model_results["failed_tests"].append(
-                {
-                    "name": test_node.get("name", unique_id),
-                    "message": result.get("message", "Test failed"),
-                    "unique_id": unique_id,
-                }
-            )
-        elif status == "error":
-            model_results["errored"] += 1
-            model_results["failed_tests"].append(
-                {
-                    "name": test_node.get("name", unique_id),
-                    "message": result.get("message", "Test errored"),
-                    "unique_id": unique_id,
-                }
-            )
-        elif status == "skipped":
-            model_results["skipped"] += 1
-
-    return dict(results_by_model)
+        resp = await api_post(
+            f"/api/v1/assets/{asset_id}/audit-results",
+            content=dumps(payload),
+        )
+        if resp.status_code in (200, 201):
+            return True, f"      {model_fqn}: {status} ({results.passed}/{total_checked} passed)"
+    except httpx.RequestError:
+        pass
+    return False, None
 
 
-def report_dbt_test_results() -> int:
+async def report_dbt_test_results() -> int:
     """Report REAL dbt test results from run_results.json to Tessera.
 
     This reads the actual test outcomes from dbt build runs and reports
@@ -1028,11 +1211,11 @@ def report_dbt_test_results() -> int:
         print(f"\n  Processing {project_name} project...")
 
         try:
-            manifest = json.loads(manifest_path.read_text())
-            run_results = json.loads(run_results_path.read_text())
+            manifest = loads(manifest_path.read_bytes())
+            run_results = loads(run_results_path.read_bytes())
 
             invocation_id = run_results.get("metadata", {}).get("invocation_id", "unknown")
-            results_by_model = extract_test_results_from_run(run_results, manifest)
+            results_by_model = extract_test_results(run_results, manifest)
 
             if not results_by_model:
                 print(f"    No test results found in {project_name}")
@@ -1040,86 +1223,16 @@ def report_dbt_test_results() -> int:
 
             print(f"    Found test results for {len(results_by_model)} models")
 
-            for model_fqn, results in results_by_model.items():
-                # Look up asset by FQN
-                try:
-                    asset_resp = httpx.get(
-                        f"{API_URL}/api/v1/assets",
-                        params={"fqn": model_fqn, "limit": 1},
-                        headers=get_headers(),
-                        timeout=10,
-                    )
-                    if asset_resp.status_code != 200:
-                        print(f"      Lookup failed for {model_fqn}: {asset_resp.status_code}")
-                        continue
-
-                    assets = asset_resp.json().get("results", [])
-                    if not assets:
-                        # Try partial match (search for model name anywhere in FQN)
-                        parts = model_fqn.split(".")
-                        model_name = parts[-1] if parts else model_fqn
-                        asset_resp = httpx.get(
-                            f"{API_URL}/api/v1/assets",
-                            params={"search": model_name, "resource_type": "model", "limit": 5},
-                            headers=get_headers(),
-                            timeout=10,
-                        )
-                        if asset_resp.status_code == 200:
-                            all_assets = asset_resp.json().get("results", [])
-                            # Find exact match by model name
-                            assets = [
-                                a for a in all_assets if a.get("fqn", "").endswith(f".{model_name}")
-                            ]
-                        if not assets:
-                            print(f"      Asset not found: {model_fqn}")
-                            continue
-
-                    asset_id = assets[0]["id"]
-
-                    # Calculate totals
-                    total_checked = results["passed"] + results["failed"] + results["errored"]
-                    total_failed = results["failed"] + results["errored"]
-
-                    if total_checked == 0:
-                        continue
-
-                    # Determine status
-                    if total_failed > 0:
-                        status = "failed"
-                    elif results["skipped"] > 0 and results["passed"] == 0:
-                        status = "partial"
-                    else:
-                        status = "passed"
-
-                    payload = {
-                        "status": status,
-                        "guarantees_checked": total_checked,
-                        "guarantees_passed": results["passed"],
-                        "guarantees_failed": total_failed,
-                        "triggered_by": "dbt_test",
-                        "run_id": invocation_id,
-                        "details": {
-                            "failed_tests": results["failed_tests"],
-                            "skipped": results["skipped"],
-                            "project": project_name,
-                        },
-                    }
-
-                    resp = httpx.post(
-                        f"{API_URL}/api/v1/assets/{asset_id}/audit-results",
-                        json=payload,
-                        headers=get_headers(),
-                        timeout=10,
-                    )
-                    if resp.status_code in (200, 201):
-                        audits_reported += 1
-                        print(
-                            f"      {model_fqn}: {status} "
-                            f"({results['passed']}/{total_checked} passed)"
-                        )
-
-                except httpx.RequestError:
-                    continue
+            # Each model's results are independent, so report them concurrently and
+            # print the outcomes in model order
+            outcomes = await gather_bounded(
+                report_model_results(model_fqn, results, invocation_id, project_name)
+                for model_fqn, results in results_by_model.items()
+            )
+            for reported, message in outcomes:
+                audits_reported += reported
+                if message:
+                    print(message)
 
         except (json.JSONDecodeError, OSError) as e:
             print(f"    Error reading artifacts: {e}")
@@ -1128,7 +1241,32 @@ def report_dbt_test_results() -> int:
     return audits_reported
 
 
-def create_proposals(team_ids: dict[str, str]) -> int:
+async def get_active_contracts_by_asset() -> dict[str, dict]:
+    """Fetch every active contract, keyed by asset ID.
+
+    Pages through /api/v1/contracts, which returns each contract with its full
+    schema, so many assets' contracts cost a few requests instead of one each.
+    """
+    contracts: dict[str, dict] = {}
+    offset = 0
+    while True:
+        resp = await api_get(
+            "/api/v1/contracts",
+            params={"status": "active", "limit": PAGE_SIZE, "offset": offset},
+        )
+        if resp.status_code != 200:
+            break
+        page = loads(resp.content).get("results", [])
+        for contract in page:
+            # Newest first, so keep the first contract seen for each asset
+            contracts.setdefault(contract["asset_id"], contract)
+        if len(page) < PAGE_SIZE:
+            break
+        offset += PAGE_SIZE
+    return contracts
+
+
+async def create_proposals(team_ids: dict[str, str]) -> int:
     """Create proposals with breaking changes that affect demo user teams.
 
     Creates proposals where:
@@ -1157,16 +1295,15 @@ def create_proposals(team_ids: dict[str, str]) -> int:
     # Focus on Kafka and OpenAPI assets which we created with known schemas
     try:
         # Get assets with contracts
-        assets_resp = httpx.get(
-            f"{API_URL}/api/v1/assets?limit=50",
-            headers=get_headers(),
-            timeout=10,
+        assets_resp = await api_get(
+            "/api/v1/assets?limit=50",
         )
         if assets_resp.status_code != 200:
             print("  Could not fetch assets")
             return 0
 
-        all_assets = assets_resp.json().get("results", [])
+        all_assets = loads(assets_resp.content).get("results", [])
+        active_contracts = await get_active_contracts_by_asset()
 
         # Find suitable assets with active contracts (not owned by demo consumer teams)
         target_items = []
@@ -1179,49 +1316,19 @@ def create_proposals(team_ids: dict[str, str]) -> int:
             if owner_team_id in demo_consumer_teams.values():
                 continue
 
-            # Get contracts for this asset
-            contracts_resp = httpx.get(
-                f"{API_URL}/api/v1/assets/{asset_id}/contracts",
-                headers=get_headers(),
-                timeout=10,
-            )
-            if contracts_resp.status_code != 200:
-                continue
-
-            contracts_data = contracts_resp.json()
-            contracts = contracts_data.get("results", [])
-            if not contracts:
-                continue
-
-            # Get the active contract
-            active_contract = None
-            for c in contracts:
-                if c.get("status") == "active":
-                    active_contract = c
-                    break
-
+            active_contract = active_contracts.get(asset_id)
             if not active_contract:
                 continue
 
-            # Get full contract details
-            contract_resp = httpx.get(
-                f"{API_URL}/api/v1/contracts/{active_contract['id']}",
-                headers=get_headers(),
-                timeout=10,
-            )
-            if contract_resp.status_code != 200:
-                continue
-
-            contract_detail = contract_resp.json()
             # API returns schema_def not schema
-            schema = contract_detail.get("schema_def") or contract_detail.get("schema", {})
+            schema = active_contract.get("schema_def") or active_contract.get("schema", {})
 
             # Accept any contract with a schema
             if schema and schema.get("type") == "object":
                 target_items.append(
                     {
                         "asset": asset,
-                        "contract": contract_detail,
+                        "contract": active_contract,
                     }
                 )
                 print(f"    Found candidate: {fqn}")
@@ -1235,14 +1342,12 @@ def create_proposals(team_ids: dict[str, str]) -> int:
         print(f"  Found {len(target_items)} assets suitable for proposals")
 
         # Step 0: Check for existing pending proposals and skip those assets
-        pending_resp = httpx.get(
-            f"{API_URL}/api/v1/proposals?status=pending&limit=100",
-            headers=get_headers(),
-            timeout=10,
+        pending_resp = await api_get(
+            "/api/v1/proposals?status=pending&limit=100",
         )
         assets_with_pending_proposals: set[str] = set()
         if pending_resp.status_code == 200:
-            for p in pending_resp.json().get("results", []):
+            for p in loads(pending_resp.content).get("results", []):
                 assets_with_pending_proposals.add(p.get("asset_id", ""))
 
         # Filter out assets that already have pending proposals
@@ -1271,13 +1376,13 @@ def create_proposals(team_ids: dict[str, str]) -> int:
                 continue
 
             # contract_id is a query param, consumer_team_id goes in JSON body
-            reg_resp = httpx.post(
-                f"{API_URL}/api/v1/registrations?contract_id={contract_id}",
-                json={
-                    "consumer_team_id": team_id,
-                },
-                headers=get_headers(),
-                timeout=10,
+            reg_resp = await api_post(
+                f"/api/v1/registrations?contract_id={contract_id}",
+                content=dumps(
+                    {
+                        "consumer_team_id": team_id,
+                    }
+                ),
             )
             if reg_resp.status_code in (200, 201):
                 print(f"    Registered {team_name} -> {contract_id[:8]}...")
@@ -1329,19 +1434,20 @@ def create_proposals(team_ids: dict[str, str]) -> int:
             print(f"    {fqn}: Adding required field '{new_field_name}' -> v{new_version}")
 
             try:
-                pub_resp = httpx.post(
-                    f"{API_URL}/api/v1/assets/{asset_id}/contracts?published_by={owner_team_id}",
-                    json={
-                        "version": new_version,
-                        "schema": new_schema,
-                        "compatibility_mode": "backward",
-                    },
-                    headers=get_headers(),
+                pub_resp = await api_post(
+                    f"/api/v1/assets/{asset_id}/contracts?published_by={owner_team_id}",
+                    content=dumps(
+                        {
+                            "version": new_version,
+                            "schema": new_schema,
+                            "compatibility_mode": "backward",
+                        }
+                    ),
                     timeout=30,
                 )
 
                 if pub_resp.status_code == 201:
-                    result = pub_resp.json()
+                    result = loads(pub_resp.content)
                     action = result.get("action", "unknown")
                     if action == "proposal_created":
                         proposal_id = result["proposal"]["id"]
@@ -1353,7 +1459,7 @@ def create_proposals(team_ids: dict[str, str]) -> int:
                         print(f"      Action: {action}")
                 else:
                     try:
-                        err = pub_resp.json()
+                        err = loads(pub_resp.content)
                         msg = err.get("message") or err.get("error", {}).get("message", "")
                         print(f"      Failed: {pub_resp.status_code} - {msg[:80]}")
                     except Exception:
@@ -1368,132 +1474,113 @@ def create_proposals(team_ids: dict[str, str]) -> int:
     return proposals_created
 
 
-def main() -> int:
+async def main() -> int:
     """Main entry point."""
-    print("=" * 60)
-    print("Tessera Demo Seeder")
-    print("=" * 60)
-
-    if not wait_for_api():
-        print("ERROR: API did not become ready")
-        return 1
-
-    # Create teams
-    print("\n[1/7] Creating teams...")
-    team_ids: dict[str, str] = {}
-    for team in TEAMS:
-        team_id = create_team(team["name"], team.get("metadata"))
-        if team_id:
-            team_ids[team["name"]] = team_id
+    try:
+        print("=" * 60)
+        print("Tessera Demo Seeder")
+        print("=" * 60)
+
+        if not await wait_for_api():
+            print("ERROR: API did not become ready")
+            return 1
+
+        # Create teams
+        print("\n[1/7] Creating teams...")
+        team_ids = await create_teams(TEAMS)
+        if not team_ids:
+            print("ERROR: Could not create any teams")
+            return 1
+
+        print(f"  Total: {len(team_ids)} teams")
+
+        # Create demo users with login credentials first
+        print("\n[2/7] Creating demo login users...")
+        demo_users_created = await create_users(DEMO_USERS, team_ids)
+        print(f"  Total: {demo_users_created} demo users")
+
+        # Create regular users
+        print("\n[3/7] Creating users...")
+        users_created = await create_users(USERS, team_ids)
+        print(f"  Total: {users_created} users")
+
+        # Import multi-project manifests (real dbt projects with team ownership)
+        multi_project_result = await import_multi_project_manifests(team_ids)
+
+        # Fall back to synthetic manifest if no real dbt projects found
+        if multi_project_result["projects_imported"] == 0:
+            print("\n  No real dbt projects found, using synthetic manifest...")
+            default_team_id = team_ids.get("data-platform") or list(team_ids.values())[0]
+            import_result = await import_manifest(default_team_id)
+            if not import_result:
+                print("WARNING: Manifest import failed")
+        else:
+            import_result = {
+                "assets": {"created": multi_project_result["total_assets"]},
+                "contracts": {"published": multi_project_result["total_contracts"]},
+                "registrations": {"created": 0},  # placeholder
+            }
+            print("\n  Multi-project import complete!")
+            print(f"    Projects: {multi_project_result['projects_imported']}")
+            print(f"    Total Assets: {multi_project_result['total_assets']}")
+            print(f"    Total Contracts: {multi_project_result['total_contracts']}")
+            print(f"    Total Guarantees: {multi_project_result['total_guarantees']}")
+
+        # Create Kafka assets with Avro schemas
+        print("\n[5/9] Creating Kafka assets with Avro schemas...")
+        kafka_assets = await create_kafka_assets(team_ids)
+        print(f"  Total: {kafka_assets} Kafka assets with Avro contracts")
+
+        # Import OpenAPI spec (REST endpoints)
+        print("\n[6/9] Importing OpenAPI spec (REST endpoints)...")
+        openapi_assets = await import_openapi_spec(team_ids)
+        print(f"  Total: {openapi_assets} REST API assets")
+
+        # Import GraphQL schema
+        print("\n[7/9] Importing GraphQL schema...")
+        graphql_assets = await import_graphql_schema(team_ids)
+        print(f"  Total: {graphql_assets} GraphQL assets")
+
+        # Report real dbt test results (WAP demo)
+        print("\n[8/9] Reporting dbt test results (WAP demo)...")
+        audit_results = await report_dbt_test_results()
+        print(f"  Total: {audit_results} audit results reported")
+
+        # Create proposals
+        print("\n[9/9] Creating sample proposals...")
+        proposals = await create_proposals(team_ids)
+        print(f"  Total: {proposals} proposals")
+
+        # Summary
+        print("\n" + "=" * 60)
+        print("Seeding complete!")
+        print("=" * 60)
+        print(f"  Teams: {len(team_ids)}")
+        print(f"  Demo Users: {demo_users_created}")
+        print(f"  Regular Users: {users_created}")
+        if import_result:
+            print(f"  Assets: {import_result['assets']['created']}")
+            print(f"  Contracts: {import_result['contracts']['published']}")
+            print(f"  Registrations: {import_result['registrations']['created']}")
+        print(f"  Kafka Assets (Avro): {kafka_assets}")
+        print(f"  OpenAPI Assets (REST): {openapi_assets}")
+        print(f"  GraphQL Assets: {graphql_assets}")
+        print(f"  Audit Results (WAP): {audit_results}")
+        print(f"  Proposals: {proposals}")
+        print("=" * 60)
+        print("\nDemo Login Credentials:")
+        print("  admin@test.com / admin (Admin)")
+        print("  team_admin@test.com / team_admin (Team Admin)")
+        print("  user@test.com / user (Regular User)")
+        print("=" * 60)
 
-    if not team_ids:
-        print("ERROR: Could not create any teams")
+        return 0
+    except CircuitOpenError as e:
+        print(f"ERROR: {e}")
         return 1
-
-    print(f"  Total: {len(team_ids)} teams")
-
-    # Create demo users with login credentials first
-    print("\n[2/7] Creating demo login users...")
-    demo_users_created = 0
-    for user in DEMO_USERS:
-        team_id = team_ids.get(user["team"])
-        if team_id:
-            result = create_user(
-                user["name"],
-                user["email"],
-                team_id,
-                password=user.get("password"),
-                role=user.get("role", "user"),
-            )
-            if result:
-                demo_users_created += 1
-
-    print(f"  Total: {demo_users_created} demo users")
-
-    # Create regular users
-    print("\n[3/7] Creating users...")
-    users_created = 0
-    for user in USERS:
-        team_id = team_ids.get(user["team"])
-        if team_id:
-            result = create_user(user["name"], user["email"], team_id)
-            if result:
-                users_created += 1
-
-    print(f"  Total: {users_created} users")
-
-    # Import multi-project manifests (real dbt projects with team ownership)
-    multi_project_result = import_multi_project_manifests(team_ids)
-
-    # Fall back to synthetic manifest if no real dbt projects found
-    if multi_project_result["projects_imported"] == 0:
-        print("\n  No real dbt projects found, using synthetic manifest...")
-        default_team_id = team_ids.get("data-platform") or list(team_ids.values())[0]
-        import_result = import_manifest(default_team_id)
-        if not import_result:
-            print("WARNING: Manifest import failed")
-    else:
-        import_result = {
-            "assets": {"created": multi_project_result["total_assets"]},
-            "contracts": {"published": multi_project_result["total_contracts"]},
-            "registrations": {"created": 0},  # placeholder
-        }
-        print("\n  Multi-project import complete!")
-        print(f"    Projects: {multi_project_result['projects_imported']}")
-        print(f"    Total Assets: {multi_project_result['total_assets']}")
-        print(f"    Total Contracts: {multi_project_result['total_contracts']}")
-        print(f"    Total Guarantees: {multi_project_result['total_guarantees']}")
-
-    # Create Kafka assets with Avro schemas
-    print("\n[5/9] Creating Kafka assets with Avro schemas...")
-    kafka_assets = create_kafka_assets(team_ids)
-    print(f"  Total: {kafka_assets} Kafka assets with Avro contracts")
-
-    # Import OpenAPI spec (REST endpoints)
-    print("\n[6/9] Importing OpenAPI spec (REST endpoints)...")
-    openapi_assets = import_openapi_spec(team_ids)
-    print(f"  Total: {openapi_assets} REST API assets")
-
-    # Import GraphQL schema
-    print("\n[7/9] Importing GraphQL schema...")
-    graphql_assets = import_graphql_schema(team_ids)
-    print(f"  Total: {graphql_assets} GraphQL assets")
-
-    # Report real dbt test results (WAP demo)
-    print("\n[8/9] Reporting dbt test results (WAP demo)...")
-    audit_results = report_dbt_test_results()
-    print(f"  Total: {audit_results} audit results reported")
-
-    # Create proposals
-    print("\n[9/9] Creating sample proposals...")
-    proposals = create_proposals(team_ids)
-    print(f"  Total: {proposals} proposals")
-
-    # Summary
-    print("\n" + "=" * 60)
-    print("Seeding complete!")
-    print("=" * 60)
-    print(f"  Teams: {len(team_ids)}")
-    print(f"  Demo Users: {demo_users_created}")
-    print(f"  Regular Users: {users_created}")
-    if import_result:
-        print(f"  Assets: {import_result['assets']['created']}")
-        print(f"  Contracts: {import_result['contracts']['published']}")
-        print(f"  Registrations: {import_result['registrations']['created']}")
-    print(f"  Kafka Assets (Avro): {kafka_assets}")
-    print(f"  OpenAPI Assets (REST): {openapi_assets}")
-    print(f"  GraphQL Assets: {graphql_assets}")
-    print(f"  Audit Results (WAP): {audit_results}")
-    print(f"  Proposals: {proposals}")
-    print("=" * 60)
-    print("\nDemo Login Credentials:")
-    print("  admin@test.com / admin (Admin)")
-    print("  team_admin@test.com / team_admin (Team Admin)")
-    print("  user@test.com / user (Regular User)")
-    print("=" * 60)
-
-    return 0
+    finally:
+        await CLIENT.aclose()
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(asyncio.run(main()))
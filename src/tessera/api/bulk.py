@@ -3,11 +3,12 @@
 from datetime import UTC, datetime
 from typing import Any
 
+from argon2 import PasswordHasher
 from fastapi import APIRouter, Depends, Request
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from tessera.api.auth import Auth, RequireWrite
+from tessera.api.auth import Auth, RequireAdmin, RequireWrite
 from tessera.api.errors import BadRequestError, ErrorCode, ForbiddenError
 from tessera.api.rate_limit import limit_write
 from tessera.db import (
@@ -17,6 +18,7 @@ from tessera.db import (
     ProposalDB,
     RegistrationDB,
     TeamDB,
+    UserDB,
     get_session,
 )
 from tessera.models import (
@@ -27,6 +29,10 @@ from tessera.models import (
     BulkItemResult,
     BulkRegistrationRequest,
     BulkRegistrationResponse,
+    BulkTeamRequest,
+    BulkTeamResponse,
+    BulkUserRequest,
+    BulkUserResponse,
 )
 from tessera.models.enums import (
     AcknowledgmentResponseType,
@@ -42,6 +48,8 @@ from tessera.services import (
 )
 from tessera.services.audit import AuditAction, log_event
 
+_hasher = PasswordHasher()
+
 router = APIRouter()
 
 
@@ -314,6 +322,221 @@ async def bulk_create_assets(
     )
 
 
+@router.post("/teams", response_model=BulkTeamResponse)
+@limit_write
+async def bulk_create_teams(
+    request: Request,
+    auth: Auth,
+    bulk_request: BulkTeamRequest,
+    _: None = RequireAdmin,
+    session: AsyncSession = Depends(get_session),
+) -> BulkTeamResponse:
+    """Create multiple teams at once.
+
+    If skip_duplicates is true, duplicate teams (by name) are skipped instead of failing,
+    and their existing IDs are returned.
+
+    Requires admin scope.
+    """
+    results: list[BulkItemResult] = []
+    succeeded = 0
+    failed = 0
+
+    for idx, item in enumerate(bulk_request.teams):
+        try:
+            # Check for existing team with same name
+            existing_result = await session.execute(select(TeamDB).where(TeamDB.name == item.name))
+            existing = existing_result.scalar_one_or_none()
+            if existing:
+                if bulk_request.skip_duplicates and existing.deleted_at is None:
+                    results.append(
+                        BulkItemResult(
+                            success=True,
+                            index=idx,
+                            id=existing.id,
+                            details={"skipped": True, "reason": "duplicate"},
+                        )
+                    )
+                    succeeded += 1
+                    continue
+                else:
+                    raise BadRequestError(
+                        f"Team with name '{item.name}' already exists",
+                        code=ErrorCode.DUPLICATE_TEAM,
+                    )
+
+            # Create team
+            team = TeamDB(name=item.name, metadata_=item.metadata)
+            session.add(team)
+            await session.flush()
+            await session.refresh(team)
+
+            # Log audit event
+            await log_event(
+                session=session,
+                entity_type="team",
+                entity_id=team.id,
+                action=AuditAction.TEAM_CREATED,
+                payload={"name": item.name, "bulk_operation": True},
+            )
+
+            results.append(
+                BulkItemResult(
+                    success=True,
+                    index=idx,
+                    id=team.id,
+                )
+            )
+            succeeded += 1
+
+        except BadRequestError as e:
+            results.append(
+                BulkItemResult(
+                    success=False,
+                    index=idx,
+                    error=e.message,
+                )
+            )
+            failed += 1
+        except Exception as e:
+            results.append(
+                BulkItemResult(
+                    success=False,
+                    index=idx,
+                    error=f"Unexpected error: {str(e)}",
+                )
+            )
+            failed += 1
+
+    return BulkTeamResponse(
+        total=len(bulk_request.teams),
+        succeeded=succeeded,
+        failed=failed,
+        results=results,
+    )
+
+
+@router.post("/users", response_model=BulkUserResponse)
+@limit_write
+async def bulk_create_users(
+    request: Request,
+    auth: Auth,
+    bulk_request: BulkUserRequest,
+    _: None = RequireAdmin,
+    session: AsyncSession = Depends(get_session),
+) -> BulkUserResponse:
+    """Create multiple users at once.
+
+    If skip_duplicates is true, duplicate users (by email) are skipped instead of failing,
+    and their existing IDs are returned.
+
+    Requires admin scope.
+    """
+    results: list[BulkItemResult] = []
+    succeeded = 0
+    failed = 0
+
+    for idx, item in enumerate(bulk_request.users):
+        try:
+            # Check for existing user with same email
+            existing_result = await session.execute(
+                select(UserDB).where(UserDB.email == item.email)
+            )
+            existing = existing_result.scalar_one_or_none()
+            if existing:
+                if bulk_request.skip_duplicates:
+                    results.append(
+                        BulkItemResult(
+                            success=True,
+                            index=idx,
+                            id=existing.id,
+                            details={"skipped": True, "reason": "duplicate"},
+                        )
+                    )
+                    succeeded += 1
+                    continue
+                else:
+                    raise BadRequestError(
+                        f"User with email '{item.email}' already exists",
+                        code=ErrorCode.DUPLICATE_USER,
+                    )
+
+            # Verify team exists if provided
+            if item.team_id:
+                team_result = await session.execute(
+                    select(TeamDB)
+                    .where(TeamDB.id == item.team_id)
+                    .where(TeamDB.deleted_at.is_(None))
+                )
+                if not team_result.scalar_one_or_none():
+                    raise BadRequestError(
+                        f"Team {item.team_id} not found",
+                        code=ErrorCode.TEAM_NOT_FOUND,
+                    )
+
+            # Create user
+            user = UserDB(
+                email=item.email,
+                name=item.name,
+                team_id=item.team_id,
+                password_hash=_hasher.hash(item.password) if item.password else None,
+                role=item.role,
+                metadata_=item.metadata,
+            )
+            session.add(user)
+            await session.flush()
+            await session.refresh(user)
+
+            # Log audit event
+            await log_event(
+                session=session,
+                entity_type="user",
+                entity_id=user.id,
+                action=AuditAction.USER_CREATED,
+                payload={
+                    "email": item.email,
+                    "name": item.name,
+                    "team_id": str(item.team_id) if item.team_id else None,
+                    "bulk_operation": True,
+                },
+            )
+
+            results.append(
+                BulkItemResult(
+                    success=True,
+                    index=idx,
+                    id=user.id,
+                )
+            )
+            succeeded += 1
+
+        except BadRequestError as e:
+            results.append(
+                BulkItemResult(
+                    success=False,
+                    index=idx,
+                    error=e.message,
+                )
+            )
+            failed += 1
+        except Exception as e:
+            results.append(
+                BulkItemResult(
+                    success=False,
+                    index=idx,
+                    error=f"Unexpected error: {str(e)}",
+                )
+            )
+            failed += 1
+
+    return BulkUserResponse(
+        total=len(bulk_request.users),
+        succeeded=succeeded,
+        failed=failed,
+        results=results,
+    )
+
+
 async def _check_proposal_completion(
     proposal: ProposalDB,
     session: AsyncSession,
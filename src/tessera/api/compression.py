@@ -0,0 +1,131 @@
+"""Request body decompression for Tessera API."""
+
+import zlib
+from collections.abc import Collection
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from tessera.api.errors import ErrorCode, build_error_response, get_request_id
+from tessera.config import settings
+
+
+class GzipRequestMiddleware:
+    """Middleware that decompresses request bodies sent with ``Content-Encoding: gzip``.
+
+    dbt manifests are large and highly repetitive, so clients may gzip uploads
+    to cut the bytes sent over the wire. Decompression runs before
+    authentication, so it is only done for the routes listed in ``paths``;
+    gzipped bodies sent anywhere else are rejected with 415. Requests without
+    that encoding pass through untouched. Bodies that inflate past ``max_size``
+    bytes are rejected without being fully decompressed.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Collection[str], max_size: int | None = None):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.max_size = max_size or settings.max_decompressed_request_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encodings = [
+            value.strip().lower() for name, value in scope["headers"] if name == b"content-encoding"
+        ]
+        if encodings != [b"gzip"]:
+            await self.app(scope, receive, send)
+            return
+        if scope["path"] not in self.paths:
+            await self._reject(
+                scope,
+                receive,
+                send,
+                415,
+                ErrorCode.UNSUPPORTED_MEDIA_TYPE,
+                "Content-Encoding gzip is not accepted on this endpoint",
+            )
+            return
+
+        # wbits=MAX_WBITS | 16 expects a gzip header and trailer
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        chunks: list[bytes] = []
+        size = 0
+        more_body = True
+        try:
+            while more_body:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                more_body = message.get("more_body", False)
+                # Ask for one byte past the limit so an oversized body is detected
+                # without inflating the rest of it
+                chunk = decompressor.decompress(message.get("body", b""), self.max_size - size + 1)
+                size += len(chunk)
+                if size > self.max_size or decompressor.unconsumed_tail:
+                    await self._reject(
+                        scope,
+                        receive,
+                        send,
+                        413,
+                        ErrorCode.PAYLOAD_TOO_LARGE,
+                        f"Decompressed request body exceeds {self.max_size} bytes",
+                    )
+                    return
+                chunks.append(chunk)
+            if not decompressor.eof:
+                raise zlib.error("truncated gzip stream")
+            if decompressor.unused_data:
+                raise zlib.error("data after end of gzip stream")
+        except zlib.error:
+            await self._reject(
+                scope,
+                receive,
+                send,
+                400,
+                ErrorCode.BAD_REQUEST,
+                "Request body is not valid gzip data",
+            )
+            return
+
+        headers = [
+            (name, value)
+            for name, value in scope["headers"]
+            if name not in (b"content-encoding", b"content-length")
+        ]
+        headers.append((b"content-length", str(size).encode()))
+        scope = {**scope, "headers": headers}
+
+        # Hand the inflated chunks on one message at a time rather than joining
+        # them here, so the body is not held twice while the app reads it
+        chunks.reverse()
+
+        async def receive_decompressed() -> Message:
+            if not chunks:
+                return await receive()
+            return {"type": "http.request", "body": chunks.pop(), "more_body": bool(chunks)}
+
+        await self.app(scope, receive_decompressed, send)
+
+    @staticmethod
+    async def _reject(
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        status_code: int,
+        code: ErrorCode,
+        message: str,
+    ) -> None:
+        request_id = get_request_id(Request(scope))
+        response = JSONResponse(
+            status_code=status_code,
+            content=build_error_response(
+                code=code,
+                message=message,
+                request_id=request_id,
+                status_code=status_code,
+            ),
+        )
+        await response(scope, receive, send)
@@ -43,6 +43,8 @@ class ErrorCode(StrEnum):
     INVALID_FQN = "INVALID_FQN"
     INVALID_MANIFEST = "INVALID_MANIFEST"
     INVALID_OPENAPI_SPEC = "INVALID_OPENAPI_SPEC"
+    PAYLOAD_TOO_LARGE = "PAYLOAD_TOO_LARGE"
+    UNSUPPORTED_MEDIA_TYPE = "UNSUPPORTED_MEDIA_TYPE"
 
     # Business logic errors
     PROPOSAL_NOT_PENDING = "PROPOSAL_NOT_PENDING"
@@ -89,6 +89,7 @@ class Settings(BaseSettings):  # type: ignore[misc]
     max_schema_properties: int = 1000
     max_fqn_length: int = 1000
     max_team_name_length: int = 255
+    max_decompressed_request_bytes: int = 100_000_000  # 100MB, for gzipped uploads
     default_environment: str = "production"
 
     # Analysis Defaults
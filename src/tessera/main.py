@@ -38,6 +38,7 @@ from tessera.api import (
     users,
     webhooks,
 )
+from tessera.api.compression import GzipRequestMiddleware
 from tessera.api.errors import (
     APIError,
     RequestIDMiddleware,
@@ -154,6 +155,10 @@ app = FastAPI(
 )
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+# Gzip request decompression for dbt manifest uploads (innermost, so the
+# request ID and metrics middleware also cover its error responses)
+app.add_middleware(GzipRequestMiddleware, paths={"/api/v1/sync/dbt/upload"})
+
 # Only add rate limiting middleware if enabled
 if settings.rate_limit_enabled:
     app.add_middleware(SlowAPIMiddleware)
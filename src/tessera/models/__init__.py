@@ -25,6 +25,10 @@ from tessera.models.bulk import (
     BulkRegistrationItem,
     BulkRegistrationRequest,
     BulkRegistrationResponse,
+    BulkTeamRequest,
+    BulkTeamResponse,
+    BulkUserRequest,
+    BulkUserResponse,
 )
 from tessera.models.contract import Contract, ContractCreate, Guarantees
 from tessera.models.dependency import Dependency, DependencyCreate
@@ -105,6 +109,10 @@ __all__ = [
     "BulkAssetItem",
     "BulkAssetRequest",
     "BulkAssetResponse",
+    "BulkTeamRequest",
+    "BulkTeamResponse",
+    "BulkUserRequest",
+    "BulkUserResponse",
     "BulkAcknowledgmentItem",
     "BulkAcknowledgmentRequest",
     "BulkAcknowledgmentResponse",
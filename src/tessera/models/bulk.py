@@ -6,6 +6,8 @@ from uuid import UUID
 from pydantic import BaseModel, Field
 
 from tessera.models.enums import AcknowledgmentResponseType, GuaranteeMode, ResourceType
+from tessera.models.team import TeamCreate
+from tessera.models.user import UserCreate
 
 
 class BulkItemResult(BaseModel):
@@ -91,6 +93,42 @@ class BulkAssetResponse(BulkOperationResponse):
     pass
 
 
+# Bulk Team Models
+class BulkTeamRequest(BaseModel):
+    """Request to create multiple teams at once."""
+
+    teams: list[TeamCreate] = Field(
+        ..., min_length=1, max_length=100, description="List of teams to create (max 100)"
+    )
+    skip_duplicates: bool = Field(
+        False, description="If true, skip duplicate teams (by name) instead of failing"
+    )
+
+
+class BulkTeamResponse(BulkOperationResponse):
+    """Response for bulk team creation."""
+
+    pass
+
+
+# Bulk User Models
+class BulkUserRequest(BaseModel):
+    """Request to create multiple users at once."""
+
+    users: list[UserCreate] = Field(
+        ..., min_length=1, max_length=100, description="List of users to create (max 100)"
+    )
+    skip_duplicates: bool = Field(
+        False, description="If true, skip duplicate users (by email) instead of failing"
+    )
+
+
+class BulkUserResponse(BulkOperationResponse):
+    """Response for bulk user creation."""
+
+    pass
+
+
 # Bulk Acknowledgment Models
 class BulkAcknowledgmentItem(BaseModel):
     """A single acknowledgment to create in a bulk request."""
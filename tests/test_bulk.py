@@ -290,6 +290,151 @@ class TestBulkAssets:
         assert data["succeeded"] == 1
 
 
+class TestBulkTeams:
+    """Tests for bulk team creation."""
+
+    async def test_bulk_create_teams_success(self, client: AsyncClient):
+        """Create multiple teams at once."""
+        resp = await client.post(
+            "/api/v1/bulk/teams",
+            json={
+                "teams": [
+                    {"name": "bulk-team-1"},
+                    {"name": "bulk-team-2", "metadata": {"domain": "finance"}},
+                ]
+            },
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == 2
+        assert data["succeeded"] == 2
+        assert data["failed"] == 0
+        assert all(r["id"] is not None for r in data["results"])
+
+        team_resp = await client.get(f"/api/v1/teams/{data['results'][1]['id']}")
+        assert team_resp.json()["name"] == "bulk-team-2"
+        assert team_resp.json()["metadata"] == {"domain": "finance"}
+
+    async def test_bulk_teams_skip_duplicates(self, client: AsyncClient):
+        """Skipped duplicate teams return the existing team's ID."""
+        team_resp = await client.post("/api/v1/teams", json={"name": "dup-bulk-team"})
+        team_id = team_resp.json()["id"]
+
+        resp = await client.post(
+            "/api/v1/bulk/teams",
+            json={
+                "teams": [{"name": "dup-bulk-team"}, {"name": "new-bulk-team"}],
+                "skip_duplicates": True,
+            },
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["succeeded"] == 2
+        assert data["results"][0]["id"] == team_id
+        assert data["results"][0]["details"].get("skipped") is True
+        assert data["results"][1]["details"] == {}
+
+    async def test_bulk_teams_duplicate_fails(self, client: AsyncClient):
+        """Duplicate team fails when skip_duplicates is false."""
+        await client.post("/api/v1/teams", json={"name": "fail-dup-bulk-team"})
+
+        resp = await client.post(
+            "/api/v1/bulk/teams",
+            json={"teams": [{"name": "fail-dup-bulk-team"}]},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["failed"] == 1
+        assert "already exists" in data["results"][0]["error"]
+
+
+class TestBulkUsers:
+    """Tests for bulk user creation."""
+
+    async def test_bulk_create_users_success(self, client: AsyncClient):
+        """Create multiple users at once."""
+        team_resp = await client.post("/api/v1/teams", json={"name": "bulk-users-team"})
+        team_id = team_resp.json()["id"]
+
+        resp = await client.post(
+            "/api/v1/bulk/users",
+            json={
+                "users": [
+                    {"name": "Bulk One", "email": "Bulk.One@Example.com", "team_id": team_id},
+                    {
+                        "name": "Bulk Two",
+                        "email": "bulk.two@example.com",
+                        "password": "secret",
+                        "role": "admin",
+                    },
+                ]
+            },
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == 2
+        assert data["succeeded"] == 2
+        assert data["failed"] == 0
+
+        user_resp = await client.get(f"/api/v1/users/{data['results'][0]['id']}")
+        assert user_resp.json()["email"] == "bulk.one@example.com"
+        assert user_resp.json()["team_id"] == team_id
+
+    async def test_bulk_users_skip_duplicates(self, client: AsyncClient):
+        """Skipped duplicate users return the existing user's ID."""
+        user_resp = await client.post(
+            "/api/v1/users", json={"name": "Dup User", "email": "dup.bulk@example.com"}
+        )
+        user_id = user_resp.json()["id"]
+
+        resp = await client.post(
+            "/api/v1/bulk/users",
+            json={
+                "users": [{"name": "Dup User", "email": "dup.bulk@example.com"}],
+                "skip_duplicates": True,
+            },
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["succeeded"] == 1
+        assert data["results"][0]["id"] == user_id
+        assert data["results"][0]["details"].get("skipped") is True
+
+    async def test_bulk_users_duplicate_fails(self, client: AsyncClient):
+        """Duplicate user fails when skip_duplicates is false."""
+        await client.post(
+            "/api/v1/users", json={"name": "Fail Dup", "email": "fail.dup.bulk@example.com"}
+        )
+
+        resp = await client.post(
+            "/api/v1/bulk/users",
+            json={"users": [{"name": "Fail Dup", "email": "fail.dup.bulk@example.com"}]},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["failed"] == 1
+        assert "already exists" in data["results"][0]["error"]
+
+    async def test_bulk_users_invalid_team(self, client: AsyncClient):
+        """User with a nonexistent team fails."""
+        resp = await client.post(
+            "/api/v1/bulk/users",
+            json={
+                "users": [
+                    {
+                        "name": "No Team",
+                        "email": "no.team.bulk@example.com",
+                        "team_id": "00000000-0000-0000-0000-000000000000",
+                    }
+                ]
+            },
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["failed"] == 1
+        assert "not found" in data["results"][0]["error"]
+
+
 class TestBulkAcknowledgments:
     """Tests for bulk acknowledgment creation."""
 
@@ -633,6 +778,22 @@ class TestBulkValidation:
         )
         assert resp.status_code == 422  # Validation error
 
+    async def test_bulk_teams_empty_list(self, client: AsyncClient):
+        """Empty teams list fails validation."""
+        resp = await client.post(
+            "/api/v1/bulk/teams",
+            json={"teams": []},
+        )
+        assert resp.status_code == 422  # Validation error
+
+    async def test_bulk_users_empty_list(self, client: AsyncClient):
+        """Empty users list fails validation."""
+        resp = await client.post(
+            "/api/v1/bulk/users",
+            json={"users": []},
+        )
+        assert resp.status_code == 422  # Validation error
+
     async def test_bulk_acknowledgments_empty_list(self, client: AsyncClient):
         """Empty acknowledgments list fails validation."""
         resp = await client.post(
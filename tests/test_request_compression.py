@@ -0,0 +1,106 @@
+"""Tests for gzip-compressed request bodies."""
+
+import gzip
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from tessera.api.compression import GzipRequestMiddleware
+
+pytestmark = pytest.mark.asyncio
+
+GZIP_HEADERS = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+
+
+def echo_app(max_size: int | None = None) -> GzipRequestMiddleware:
+    """Build an app that reports the size of the body it received on /."""
+
+    async def echo(request: Request) -> JSONResponse:
+        return JSONResponse({"size": len(await request.body())})
+
+    app = Starlette(routes=[Route("/", echo, methods=["POST"])])
+    return GzipRequestMiddleware(app, paths={"/"}, max_size=max_size)
+
+
+class TestGzipRequests:
+    """Tests for requests sent with Content-Encoding: gzip."""
+
+    async def test_gzip_rejected_on_other_endpoints(self, client: AsyncClient):
+        """Only the manifest upload accepts gzipped bodies; others return 415."""
+        body = gzip.compress(json.dumps({"name": "gzip-team"}).encode())
+        resp = await client.post("/api/v1/teams", content=body, headers=GZIP_HEADERS)
+        assert resp.status_code == 415
+        assert resp.json()["error"]["code"] == "UNSUPPORTED_MEDIA_TYPE"
+
+    async def test_uncompressed_body_unaffected(self, client: AsyncClient):
+        """Requests without Content-Encoding pass through untouched."""
+        resp = await client.post("/api/v1/teams", json={"name": "plain-team"})
+        assert resp.status_code == 201
+
+    async def test_gzipped_manifest_upload(self, client: AsyncClient):
+        """A gzipped dbt manifest upload is imported."""
+        team_resp = await client.post("/api/v1/teams", json={"name": "gzip-owner"})
+        team_id = team_resp.json()["id"]
+        manifest = {
+            "nodes": {
+                "model.proj.orders": {
+                    "resource_type": "model",
+                    "name": "orders",
+                    "database": "analytics",
+                    "schema": "core",
+                    "description": "Orders",
+                    "columns": {},
+                }
+            },
+            "sources": {},
+        }
+        body = gzip.compress(
+            json.dumps({"manifest": manifest, "owner_team_id": team_id}).encode(),
+            compresslevel=1,
+        )
+        resp = await client.post("/api/v1/sync/dbt/upload", content=body, headers=GZIP_HEADERS)
+        assert resp.status_code == 200
+        assert resp.json()["assets"]["created"] == 1
+
+    async def test_invalid_gzip_rejected(self, client: AsyncClient):
+        """A body that is not gzip data returns 400."""
+        resp = await client.post(
+            "/api/v1/sync/dbt/upload",
+            content=json.dumps({"name": "not-gzip"}).encode(),
+            headers=GZIP_HEADERS,
+        )
+        assert resp.status_code == 400
+        assert resp.json()["error"]["code"] == "BAD_REQUEST"
+
+    async def test_truncated_gzip_rejected(self, client: AsyncClient):
+        """A gzip stream cut off before its end returns 400."""
+        body = gzip.compress(json.dumps({"name": "truncated"}).encode())
+        resp = await client.post("/api/v1/sync/dbt/upload", content=body[:-8], headers=GZIP_HEADERS)
+        assert resp.status_code == 400
+
+    async def test_trailing_data_rejected(self):
+        """Bytes after the end of the gzip stream return 400."""
+        async with AsyncClient(
+            transport=ASGITransport(app=echo_app()), base_url="http://test"
+        ) as c:
+            body = gzip.compress(b"{}") + b"trailing"
+            resp = await c.post("/", content=body, headers=GZIP_HEADERS)
+            assert resp.status_code == 400
+            assert resp.json()["error"]["code"] == "BAD_REQUEST"
+
+    async def test_oversized_body_rejected(self):
+        """A body that decompresses past the size limit returns 413."""
+        app = echo_app(max_size=100)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+            resp = await c.post("/", content=gzip.compress(b"x" * 100), headers=GZIP_HEADERS)
+            assert resp.status_code == 200
+            assert resp.json() == {"size": 100}
+
+            resp = await c.post("/", content=gzip.compress(b"x" * 101), headers=GZIP_HEADERS)
+            assert resp.status_code == 413
+            assert resp.json()["error"]["code"] == "PAYLOAD_TOO_LARGE"